@@ -3,12 +3,12 @@
 Backfill historical results into nba_predictions_log.json
 Calculates hits/total/pct from existing prediction data
 """
-import json
+from log_store import LOG_FILE, load_log, save_log
+from resampling import bootstrap_mean
 
-log_file = 'nba_predictions_log.json'
+log_file = LOG_FILE
 
-with open(log_file) as f:
-    log = json.load(f)
+log = load_log(log_file)
 
 for entry in log:
     preds = entry.get('predictions', [])
@@ -24,12 +24,13 @@ for entry in log:
     if total > 0:
         pct = round(hits / total * 100, 1)
         entry['result'] = {'hits': hits, 'total': total, 'pct': pct}
-        print(f"  {entry['date']}: {hits}/{total} = {pct}%")
+        ci = bootstrap_mean([1.0 if p.get('result') == 'hit' else 0.0
+                             for p in preds if p.get('result') in ['hit', 'miss']])
+        print(f"  {entry['date']}: {hits}/{total} = {pct}%  (95% CI {ci['lo']*100:.0f}–{ci['hi']*100:.0f}%)")
     else:
         print(f"  {entry['date']}: no results found")
 
-with open(log_file, 'w') as f:
-    json.dump(log, f, indent=2)
+save_log(log, log_file)
 
 print()
 print("✅ Historical results backfilled!")
@@ -0,0 +1,9 @@
+"""
+Offline benchmarks and load-test data for the NBA Oracle hot paths.
+
+  python3 -m benchmarks.run                  # run everything, compare to baseline.json
+  python3 -m benchmarks.run predict find     # only benchmarks whose name matches
+  python3 -m benchmarks.run --save-baseline  # record the current numbers
+  python3 -m benchmarks.synthetic --league ncaab --log-days 900 --out /tmp/espn
+                                             # seeded ESPN / Odds payloads + a long log
+"""
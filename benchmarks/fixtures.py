@@ -0,0 +1,145 @@
+"""
+Seeded fixture data for the benchmarks — shaped like the real payloads
+(ESPN team stats / form, Odds API odds, settled finals, the predictions log,
+football_beast match dicts) but generated, so runs are offline and repeatable.
+"""
+import random
+
+SEED = 20260222
+
+NBA_TEAMS = [
+    "Atlanta Hawks", "Boston Celtics", "Brooklyn Nets", "Charlotte Hornets", "Chicago Bulls",
+    "Cleveland Cavaliers", "Dallas Mavericks", "Denver Nuggets", "Detroit Pistons",
+    "Golden State Warriors", "Houston Rockets", "Indiana Pacers", "LA Clippers",
+    "Los Angeles Lakers", "Memphis Grizzlies", "Miami Heat", "Milwaukee Bucks",
+    "Minnesota Timberwolves", "New Orleans Pelicans", "New York Knicks",
+    "Oklahoma City Thunder", "Orlando Magic", "Philadelphia 76ers", "Phoenix Suns",
+    "Portland Trail Blazers", "Sacramento Kings", "San Antonio Spurs", "Toronto Raptors",
+    "Utah Jazz", "Washington Wizards",
+]
+
+def rng(seed=SEED):
+    return random.Random(seed)
+
+# ── NBA ──────────────────────────────────────────────────────────────────
+def team_stats(r):
+    fga = r.uniform(84, 92)
+    fg3a = r.uniform(30, 42)
+    ortg = r.gauss(114, 4)
+    return {
+        'ppg': r.gauss(113, 5), 'opp_ppg': r.gauss(113, 5),
+        'fgm': fga * r.uniform(0.44, 0.50), 'fga': fga,
+        'fg3m': fg3a * r.uniform(0.33, 0.39), 'fg3a': fg3a,
+        'ftm': r.uniform(15, 21), 'fta': r.uniform(19, 26),
+        'orb': r.uniform(8, 13), 'drb': r.uniform(31, 36),
+        'ast': r.uniform(22, 30), 'tov': r.uniform(11, 16),
+        'stl': r.uniform(6, 9), 'blk': r.uniform(4, 6.5),
+        'ortg': ortg, 'drtg': r.gauss(114, 4), 'pace': r.gauss(99, 2),
+    }
+
+def team_form(r):
+    wins = r.randint(0, 10)
+    return {
+        'wins': wins, 'losses': 10 - wins,
+        'avg_pts': r.gauss(113, 6), 'avg_opp': r.gauss(113, 6),
+        'form_score': (wins / 10 - 0.5) * 2,
+        'streak': r.randint(1, 6), 'streak_type': r.choice('WL'),
+    }
+
+def _american(p):
+    return int(-100 * p / (1 - p)) if p >= 0.5 else int(100 * (1 - p) / p)
+
+def odds_payload(r, n_games=15, n_books=12):
+    """Odds API /v4/sports/basketball_nba/odds response"""
+    games = []
+    for g in range(n_games):
+        home, away = r.sample(NBA_TEAMS, 2)
+        books = []
+        for b in range(n_books):
+            p = min(max(r.gauss(0.55, 0.15), 0.08), 0.92)
+            line = round(r.gauss(226, 7) * 2) / 2
+            books.append({'key': f'book{b}', 'title': f'Book {b}', 'markets': [
+                {'key': 'h2h', 'outcomes': [{'name': home, 'price': _american(p + 0.02)},
+                                            {'name': away, 'price': _american(1 - p + 0.02)}]},
+                {'key': 'totals', 'outcomes': [{'name': 'Over', 'price': -110, 'point': line},
+                                               {'name': 'Under', 'price': -110, 'point': line}]},
+            ]})
+        games.append({'id': f'g{g}', 'sport_key': 'basketball_nba',
+                      'home_team': home, 'away_team': away, 'bookmakers': books})
+    return games
+
+def final(r, home, away):
+    h, a = int(r.gauss(114, 12)), int(r.gauss(112, 12))
+    if h == a:
+        h += 1
+    return {'home_team': home, 'away_team': away, 'home_score': h, 'away_score': a,
+            'total': h + a, 'home_won': h > a}
+
+def finals_for_day(r, n_games=15):
+    teams = r.sample(NBA_TEAMS, min(2 * n_games, len(NBA_TEAMS)))
+    out = {}
+    for i in range(0, len(teams) - 1, 2):
+        f = final(r, teams[i + 1], teams[i])
+        out[f"{f['away_team']} @ {f['home_team']}"] = f
+    return out
+
+def prediction(r, away, home, settled=True):
+    conf = r.uniform(0.5, 0.85)
+    home_pick = r.random() < 0.6
+    p = {
+        'matchup': f"{away} @ {home}",
+        'pick': home if home_pick else away,
+        'conf': round(conf, 4),
+        'ou': r.choice(['OVER', 'UNDER']),
+        'ou_line': round(r.gauss(226, 7) * 2) / 2,
+        'total': round(r.gauss(226, 8), 1),
+        'god': conf >= 0.70,
+        'line_source': r.choice(['Vegas', 'Model']),
+        'result': 'pending',
+    }
+    if settled:
+        f = final(r, home, away)
+        p.update(result=r.choice(['hit', 'hit', 'miss']), actual_away=f['away_score'],
+                 actual_home=f['home_score'], actual_total=f['total'])
+    return p
+
+def prediction_log(r, days=600, games_per_day=10, pending_days=1):
+    """Multi-season log, newest first, the last pending_days unsettled"""
+    import datetime as dt
+    start = dt.date(2023, 10, 24)
+    log = []
+    for d in range(days):
+        date = (start + dt.timedelta(days=d)).isoformat()
+        settled = d < days - pending_days
+        teams = r.sample(NBA_TEAMS, 2 * games_per_day)
+        preds = [prediction(r, teams[i], teams[i + 1], settled) for i in range(0, len(teams), 2)]
+        entry = {'date': date, 'predictions': preds}
+        if settled:
+            hits = sum(p['result'] == 'hit' for p in preds)
+            entry['result'] = {'hits': hits, 'total': len(preds), 'pct': round(hits / len(preds) * 100)}
+        log.append(entry)
+    log.sort(key=lambda e: e['date'], reverse=True)
+    return log
+
+# ── FOOTBALL ─────────────────────────────────────────────────────────────
+def football_team(r):
+    played = r.randint(10, 30)
+    w = r.randint(0, 10)
+    d = r.randint(0, 10 - w)
+    return {
+        'goals_for': r.randint(played // 2, played * 2), 'goals_against': r.randint(played // 2, played * 2),
+        'shots_on_target': r.randint(3 * played, 6 * played), 'shots_total': r.randint(9 * played, 15 * played),
+        'corners_for': r.randint(3 * played, 7 * played), 'matches_played': played,
+        'clean_sheets': r.randint(0, played // 2), 'tackles': r.randint(14 * played, 20 * played),
+        'interceptions': r.randint(8 * played, 12 * played), 'possession_pct': r.uniform(0.38, 0.62),
+        'passes_per_game': r.uniform(350, 650),
+        'last_10_wins': w, 'last_10_draws': d, 'last_10_losses': 10 - w - d,
+    }
+
+def football_match(r, i=0):
+    return {
+        'match_info': {'home': f'Home FC {i}', 'away': f'Away FC {i}', 'league': 'Bench League',
+                       'date': '2026-02-22T15:00:00', 'status': 'SCHEDULED'},
+        'home_team': football_team(r),
+        'away_team': football_team(r),
+    }
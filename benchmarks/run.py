@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Benchmark runner — ops/sec and peak memory for each hot path, compared
+against benchmarks/baseline.json (same machine class, or the numbers mean
+little). Everything runs offline on benchmarks/fixtures.py data.
+
+  python3 -m benchmarks.run                    # all benchmarks
+  python3 -m benchmarks.run odds find          # names containing 'odds' or 'find'
+  python3 -m benchmarks.run --check            # exit 1 if anything regressed
+  python3 -m benchmarks.run --save-baseline
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import runpy
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(1, os.path.join(ROOT, 'football_beast'))
+
+from benchmarks import fixtures  # noqa: E402
+
+BASELINE  = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+MIN_TIME  = 0.5       # seconds of timed calls per round
+ROUNDS    = 3         # best round wins
+TOLERANCE = 0.20      # slower than baseline by more than this → regression
+
+BENCHMARKS = {}       # name → setup() returning a zero-arg callable
+
+def benchmark(name):
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+@contextlib.contextmanager
+def quiet():
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+@contextlib.contextmanager
+def workdir():
+    """Scratch directory as cwd — the log / export code writes relative paths"""
+    old = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            yield tmp
+        finally:
+            os.chdir(old)
+
+# ── NBA ──────────────────────────────────────────────────────────────────
+@benchmark('nba.predict_game')
+def _predict_game():
+    import nba_predictor as nba
+    r = fixtures.rng()
+    args = [(fixtures.team_stats(r), fixtures.team_stats(r), fixtures.team_form(r),
+             fixtures.team_form(r), r.random() < 0.2, r.random() < 0.2) for _ in range(256)]
+    state = {'i': 0}
+    def run():
+        state['i'] = (state['i'] + 1) % len(args)
+        return nba.predict_game(*args[state['i']])
+    return run
+
+@benchmark('nba.get_vegas_odds[15 games x 12 books]')
+def _vegas_odds():
+    import nba_predictor as nba
+    payload = fixtures.odds_payload(fixtures.rng(), 15, 12)
+    nba.cached_get = lambda url, timeout=10: (payload, {'source': 'live', 'age_s': 0})
+    nba.ODDS_API_KEY = 'bench'
+    return nba.get_vegas_odds
+
+@benchmark('nba.find_vegas[fuzzy miss]')
+def _find_vegas():
+    import nba_predictor as nba
+    nba.cached_get = lambda url, timeout=10: (fixtures.odds_payload(fixtures.rng(), 15, 2), {'source': 'live', 'age_s': 0})
+    nba.ODDS_API_KEY = 'bench'
+    odds_map = nba.get_vegas_odds()
+    return lambda: nba.find_vegas('Nowhere Comets', 'Elsewhere Meteors', odds_map)
+
+@benchmark('update_results.find_result[5000 preds]')
+def _find_result():
+    import update_results
+    r = fixtures.rng()
+    days = [fixtures.finals_for_day(r) for _ in range(500)]
+    preds = []
+    for finals in days:
+        for f in list(finals.values())[:10]:
+            preds.append(({'matchup': f"{f['away_team']} @ {f['home_team']}"}, finals))
+    def run():
+        return sum(update_results.find_result(p, finals) is not None for p, finals in preds)
+    return run
+
+@benchmark('nba.save_to_log[3 seasons]')
+def _save_to_log():
+    import log_store
+    import nba_predictor as nba
+    log = fixtures.prediction_log(fixtures.rng(), days=600)
+    rows = [{'matchup': p['matchup'], 'pick': p['pick'], 'conf': p['conf'], 'total': p['total'],
+             'ou': p['ou'], 'ml_odds': None} for p in log[0]['predictions']]
+    def run():
+        with workdir(), quiet():
+            log_store.save_log(log, log_store.LOG_FILE)
+            nba.save_to_log(rows)
+    return run
+
+@benchmark('export_predictions[3 seasons]')
+def _export():
+    import log_store
+    log = fixtures.prediction_log(fixtures.rng(), days=600)
+    script = os.path.join(ROOT, 'export_predictions.py')
+    def run():
+        with workdir(), quiet():
+            log_store.save_log(log, 'nba_predictions_log.json')
+            runpy.run_path(script, run_name='__main__')
+    return run
+
+# ── FOOTBALL ─────────────────────────────────────────────────────────────
+@benchmark('football.compile_match_features')
+def _compile_features():
+    from data_processing import FootballFeatureEngineering
+    fe = FootballFeatureEngineering()
+    r = fixtures.rng()
+    matches = [fixtures.football_match(r, i) for i in range(64)]
+    state = {'i': 0}
+    def run():
+        state['i'] = (state['i'] + 1) % len(matches)
+        return fe.compile_match_features(matches[state['i']])
+    return run
+
+@benchmark('football.calculate_win_probability')
+def _win_prob():
+    from data_processing import FootballFeatureEngineering
+    fe = FootballFeatureEngineering()
+    r = fixtures.rng()
+    m = fixtures.football_match(r)
+    home, away = m['home_team'], m['away_team']
+    home.update(xg=1.7, defensive_rating=0.55, form_rating=0.6)
+    away.update(xg=1.2, defensive_rating=0.48, form_rating=0.4)
+    return lambda: fe.calculate_win_probability(home, away)
+
+@benchmark('football.batch_predict[50 matches]')
+def _batch_predict():
+    with quiet():
+        from football_beast import FootballBeastPredictor
+        predictor = FootballBeastPredictor()
+    r = fixtures.rng()
+    matches = [fixtures.football_match(r, i) for i in range(50)]
+    def run():
+        with quiet():
+            return predictor.batch_predict(matches)
+    return run
+
+# ── RUNNER ───────────────────────────────────────────────────────────────
+def measure(fn, min_time=MIN_TIME, rounds=ROUNDS):
+    fn()                                   # warm-up (imports, caches)
+    best = 0.0
+    for _ in range(rounds):
+        n, start = 0, time.perf_counter()
+        while True:
+            fn()
+            n += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        best = max(best, n / elapsed)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'ops': round(best, 2), 'peak_kb': round(peak / 1024, 1)}
+
+def load_baseline(path=BASELINE):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Offline benchmarks for the NBA Oracle hot paths")
+    ap.add_argument('filters', nargs='*', help="only run benchmarks whose name contains one of these")
+    ap.add_argument('--save-baseline', action='store_true', help=f"write results to {os.path.relpath(BASELINE)}")
+    ap.add_argument('--check', action='store_true', help="exit 1 if any benchmark regressed")
+    ap.add_argument('--min-time', type=float, default=MIN_TIME)
+    ap.add_argument('--json', help="also write results to this file")
+    args = ap.parse_args(argv)
+
+    names = [n for n in BENCHMARKS if not args.filters or any(f in n for f in args.filters)]
+    baseline = load_baseline()
+    results, regressed = {}, []
+
+    print()
+    print("=" * 86)
+    print(f"  🏁  BENCHMARKS — {len(names)} paths, best of {ROUNDS} x {args.min_time}s")
+    print("=" * 86)
+    print(f"  {'BENCHMARK':<42} {'ops/sec':>11} {'peak KiB':>10} {'vs base':>9}")
+    for name in names:
+        res = measure(BENCHMARKS[name](), args.min_time)
+        results[name] = res
+        base = baseline.get(name)
+        if base:
+            ratio = res['ops'] / base['ops']
+            flag = '  ⚠️ ' if ratio < 1 - TOLERANCE else ''
+            if flag:
+                regressed.append(name)
+            vs = f"{ratio:8.2f}x{flag}"
+        else:
+            vs = '      new'
+        print(f"  {name:<42} {res['ops']:>11,.1f} {res['peak_kb']:>10,.1f} {vs}")
+    print("=" * 86)
+    if regressed:
+        print(f"  ⚠️  {len(regressed)} slower than baseline by >{TOLERANCE:.0%}: {', '.join(regressed)}")
+    print()
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+    if args.save_baseline:
+        baseline.update(results)
+        with open(BASELINE, 'w') as f:
+            json.dump(dict(sorted(baseline.items())), f, indent=2)
+            f.write('\n')
+        print(f"  💾 Baseline saved to {os.path.relpath(BASELINE)}")
+    if args.check and regressed:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
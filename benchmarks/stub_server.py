@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Stand-in ESPN and Odds API server for end-to-end performance runs.
+
+Serves the endpoints the scripts call, from benchmarks/synthetic.py (or
+from a recorded tree written by `synthetic --out`, falling back to
+generated data for anything missing):
+
+  GET /apis/site/v2/sports/basketball/{league}/scoreboard[?dates=YYYYMMDD]
+  GET /apis/site/v2/sports/basketball/{league}/summary?event={id}
+  GET /apis/site/v2/sports/basketball/{league}/teams
+  GET /apis/site/v2/sports/basketball/{league}/teams/{id}[/statistics|/schedule]
+  GET /v4/sports/{sport}/odds/?apiKey=…          x-requests-remaining / -used / -last
+  GET /_stub/stats                               requests served, by route and status
+
+with configurable latency and jitter, a random 5xx rate, random 429s, a
+per-host requests/second limit (429 + Retry-After) and a monthly Odds quota.
+Point the scripts at it with the base-URL overrides:
+
+  python3 -m benchmarks.stub_server --port 8899 --latency 80 --jitter 40 --rate-limit 20 &
+  ESPN_BASE_URL=http://127.0.0.1:8899 ODDS_BASE_URL=http://127.0.0.1:8899 ODDS_API_KEY=stub \\
+      python3 nba_predictor.py --profile
+
+`--today` moves the simulated calendar (handy in the off-season): requested
+dates are shifted by the same offset, so "today" and "tomorrow" still line up.
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import threading
+import time
+from collections import Counter, deque
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks.synthetic import LEAGUES, SyntheticLeague
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8899
+QUOTA        = 500            # Odds API free tier, requests per month
+
+ESPN_PATH = re.compile(r'^/apis/site/v2/sports/basketball/(?P<slug>[^/]+)/(?P<rest>scoreboard|summary|teams(?:/\d+(?:/statistics|/schedule)?)?)$')
+ODDS_PATH = re.compile(r'^/v4/sports/(?P<sport>[^/]+)/odds$')
+
+BY_SLUG  = {cfg['espn'].split('/')[1]: name for name, cfg in LEAGUES.items()}
+BY_SPORT = {cfg['odds']: name for name, cfg in LEAGUES.items()}
+
+class StubError(Exception):
+    def __init__(self, status, message, headers=None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+# ── FAULTS ───────────────────────────────────────────────────────────────
+class Faults:
+    """Latency, jitter, random failures and a sliding-window rate limit per host"""
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, throttle_rate=0.0,
+                 rate_limit=0, retry_after=1, seed=None):
+        self.latency = latency / 1000
+        self.jitter = jitter / 1000
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self._rng = random.Random(seed)
+        self._windows = {}          # host → deque of request times in the last second
+        self._lock = threading.Lock()
+
+    def apply(self, host):
+        """Sleep the simulated latency, then raise StubError if this request should fail"""
+        with self._lock:
+            delay = max(0.0, self._rng.gauss(self.latency, self.jitter)) if self.jitter else self.latency
+            roll = self._rng.random()
+            now = time.monotonic()
+            window = self._windows.setdefault(host, deque())
+            while window and now - window[0] >= 1:
+                window.popleft()
+            limited = self.rate_limit and len(window) >= self.rate_limit
+            if not limited:
+                window.append(now)
+        if delay:
+            time.sleep(delay)
+        throttle = {'Retry-After': str(self.retry_after)}
+        if limited:
+            raise StubError(429, 'rate limit exceeded', throttle)
+        if roll < self.throttle_rate:
+            raise StubError(429, 'too many requests', throttle)
+        if roll < self.throttle_rate + self.error_rate:
+            raise StubError(self._rng.choice((500, 502, 503)), 'upstream error')
+
+# ── BACKEND ──────────────────────────────────────────────────────────────
+class StubBackend:
+    """Routes a path to a payload. Encoded bodies are cached, so only the first hit pays for generation"""
+
+    def __init__(self, seed=20260222, today=None, data_dir=None, quota=QUOTA, n_teams=None):
+        self.seed = seed
+        self.today = date.fromisoformat(today) if today else date.today()
+        self.offset = self.today - date.today()
+        self.data_dir = data_dir
+        self.n_teams = n_teams
+        self.quota = quota
+        self.used = 0
+        self._leagues = {}
+        self._bodies = {}
+        self._lock = threading.Lock()
+
+    def league(self, name):
+        with self._lock:
+            if name not in self._leagues:
+                self._leagues[name] = SyntheticLeague(name, self.seed, self.today, self.n_teams)
+            return self._leagues[name]
+
+    def _recorded(self, *parts):
+        if not self.data_dir:
+            return None
+        path = os.path.join(self.data_dir, *parts)
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _cached(self, key, build):
+        with self._lock:
+            body = self._bodies.get(key)
+        if body is None:
+            body = build()
+            with self._lock:
+                self._bodies[key] = body
+        return body
+
+    def espn(self, slug, rest, q):
+        name = BY_SLUG.get(slug)
+        if not name:
+            raise StubError(404, f'unknown league {slug}')
+        lg = self.league(name)
+        espn = lg.cfg['espn']
+        if rest == 'summary':
+            event = q.get('event', '')
+            return self._cached((name, rest, event), lambda: self._recorded(espn, 'summary', f'{event}.json')
+                                or json.dumps(self._summary(lg, event)).encode())
+        if rest == 'scoreboard':
+            dates = q.get('dates')
+            day = (date.fromisoformat(f"{dates[:4]}-{dates[4:6]}-{dates[6:8]}") + self.offset) if dates else self.today
+            file = f"{day:%Y%m%d}.json"
+            return self._cached((name, rest, file), lambda: self._recorded(espn, 'scoreboard', file)
+                                or json.dumps(lg.scoreboard(day)).encode())
+        if rest == 'teams':
+            return self._cached((name, rest), lambda: self._recorded(espn, 'teams.json')
+                                or json.dumps(lg.teams_payload()).encode())
+        parts = rest.split('/')
+        team_id = parts[1]
+        if team_id not in lg.by_id:
+            raise StubError(404, f'unknown team {team_id}')
+        if len(parts) == 2:
+            return self._cached((name, rest), lambda: self._recorded(espn, 'teams', f'{team_id}.json')
+                                or json.dumps(lg.team_payload(team_id)).encode())
+        build = lg.statistics_payload if parts[2] == 'statistics' else lg.schedule_payload
+        return self._cached((name, rest), lambda: self._recorded(espn, 'teams', team_id, f'{parts[2]}.json')
+                            or json.dumps(build(team_id)).encode())
+
+    @staticmethod
+    def _summary(lg, event):
+        payload = lg.summary_payload(event)
+        if payload is None:
+            raise StubError(404, f'unknown event {event}')
+        return payload
+
+    def odds(self, sport, q):
+        """→ (body, quota headers). Costs one credit per market, like the real API"""
+        name = BY_SPORT.get(sport)
+        if not name:
+            raise StubError(404, f'unknown sport {sport}')
+        if not q.get('apiKey'):
+            raise StubError(401, 'missing apiKey')
+        cost = len((q.get('markets') or 'h2h').split(','))
+        with self._lock:
+            if self.used + cost > self.quota:
+                raise StubError(401, 'OUT_OF_USAGE_CREDITS', self._quota_headers(0))
+            self.used += cost
+            headers = self._quota_headers(cost)
+        lg = self.league(name)
+        body = self._cached((name, 'odds'), lambda: self._recorded('odds', f'{sport}.json')
+                            or json.dumps(lg.odds_payload()).encode())
+        return body, headers
+
+    def _quota_headers(self, cost):
+        return {'x-requests-remaining': str(max(0, self.quota - self.used)),
+                'x-requests-used': str(self.used), 'x-requests-last': str(cost)}
+
+# ── SERVER ───────────────────────────────────────────────────────────────
+def make_handler(backend, faults, stats):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'          # keep-alive, so pooled clients reuse connections
+        disable_nagle_algorithm = True         # headers and body go out as separate writes
+
+        def _reply(self, status, body, headers=None):
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            for k, v in (headers or {}).items():
+                self.send_header(k, v)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            u = urlparse(self.path)
+            path = u.path.rstrip('/')
+            q = {k: v[-1] for k, v in parse_qs(u.query).items()}
+            if path == '/_stub/stats':
+                return self._reply(200, json.dumps(stats.summary(backend)).encode())
+            espn, odds = ESPN_PATH.match(path), ODDS_PATH.match(path)
+            route = 'odds' if odds else (re.sub(r'/\d+', '/{id}', espn['rest']) if espn else 'unknown')
+            try:
+                if not (espn or odds):
+                    raise StubError(404, 'not found')
+                faults.apply('odds' if odds else 'espn')
+                if odds:
+                    body, headers = backend.odds(odds['sport'], q)
+                else:
+                    body, headers = backend.espn(espn['slug'], espn['rest'], q), None
+                status = 200
+            except StubError as e:
+                status, headers = e.status, e.headers
+                body = json.dumps({'message': str(e)}).encode()
+            stats.record(route, status)
+            self._reply(status, body, headers)
+
+        def log_message(self, fmt, *args):
+            pass
+    return Handler
+
+class Stats:
+    def __init__(self):
+        self.started = time.time()
+        self.counts = Counter()          # (route, status) → n
+        self._lock = threading.Lock()
+
+    def record(self, route, status):
+        with self._lock:
+            self.counts[(route, status)] += 1
+
+    def summary(self, backend):
+        with self._lock:
+            counts = dict(self.counts)
+        elapsed = time.time() - self.started
+        total = sum(counts.values())
+        return {
+            'uptime_s': round(elapsed, 1), 'requests': total, 'rps': round(total / elapsed, 1) if elapsed else 0,
+            'by_route': {f"{r} {s}": n for (r, s), n in sorted(counts.items())},
+            'odds_quota': {'used': backend.used, 'remaining': max(0, backend.quota - backend.used)},
+        }
+
+def make_server(host=DEFAULT_HOST, port=DEFAULT_PORT, backend=None, faults=None):
+    backend = backend or StubBackend()
+    faults = faults or Faults()
+    stats = Stats()
+    server = ThreadingHTTPServer((host, port), make_handler(backend, faults, stats))
+    server.daemon_threads = True
+    server.stats = lambda: stats.summary(backend)
+    return server
+
+def serve_in_thread(port=0, **kwargs):
+    """Start a stub in a background thread → (server, base_url); port 0 picks a free one"""
+    server = make_server(DEFAULT_HOST, port, **kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{DEFAULT_HOST}:{server.server_address[1]}"
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Local stand-in for the ESPN and Odds APIs")
+    ap.add_argument('--host', default=DEFAULT_HOST)
+    ap.add_argument('--port', type=int, default=DEFAULT_PORT)
+    ap.add_argument('--seed', type=int, default=20260222)
+    ap.add_argument('--today', help="YYYY-MM-DD to simulate as today (default: today)")
+    ap.add_argument('--teams', type=int, help="override every league's team count")
+    ap.add_argument('--data', help="recorded tree from `benchmarks.synthetic --out` (generated data fills gaps)")
+    ap.add_argument('--latency', type=float, default=0, help="mean response latency, ms")
+    ap.add_argument('--jitter', type=float, default=0, help="latency standard deviation, ms")
+    ap.add_argument('--error-rate', type=float, default=0, help="fraction of requests answered 500/502/503")
+    ap.add_argument('--throttle-rate', type=float, default=0, help="fraction of requests answered 429")
+    ap.add_argument('--rate-limit', type=int, default=0, help="requests/second per host before 429 (0 = none)")
+    ap.add_argument('--retry-after', type=int, default=1, help="Retry-After seconds on 429")
+    ap.add_argument('--quota', type=int, default=QUOTA, help="Odds API credits before 401 OUT_OF_USAGE_CREDITS")
+    args = ap.parse_args(argv)
+
+    backend = StubBackend(args.seed, args.today, args.data, args.quota, args.teams)
+    faults = Faults(args.latency, args.jitter, args.error_rate, args.throttle_rate,
+                    args.rate_limit, args.retry_after, args.seed)
+    server = make_server(args.host, args.port, backend, faults)
+    base = f"http://{args.host}:{args.port}"
+    print(f"  🧪 Stub ESPN / Odds API on {base} (today = {backend.today})")
+    print(f"     ESPN_BASE_URL={base} ODDS_BASE_URL={base} ODDS_API_KEY=stub")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        s = server.stats()
+        print(f"\n  ⏹  Stopped — {s['requests']} requests ({s['rps']}/s)")
+    finally:
+        server.server_close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,574 @@
+#!/usr/bin/env python3
+"""
+Synthetic ESPN / Odds API data for load tests.
+
+A seeded league simulator that produces schema-faithful payloads — ESPN
+scoreboard, summary (box score), teams, teams/{id}, teams/{id}/statistics,
+teams/{id}/schedule and the-odds-api /v4/sports/{sport}/odds — plus prediction logs of any
+length in the format nba_predictor.save_to_log writes.
+
+Every date's slate is generated from its own seed, so any day of any season
+can be produced on its own and the same seed always gives the same games,
+scores and box scores. Scores come from team ratings (offence, defence,
+pace, home court) and the box score adds up to them, so season averages,
+records and Four Factors are all mutually consistent.
+
+  python3 -m benchmarks.synthetic --out /tmp/espn                  # NBA, today
+  python3 -m benchmarks.synthetic --league ncaab --today 2026-02-21 --log-days 900 --out /tmp/ncaab
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+from datetime import date, datetime, timedelta
+
+from benchmarks.fixtures import NBA_TEAMS
+
+# ── LEAGUES ──────────────────────────────────────────────────────────────
+# games_per_day is the weekday average; college Saturdays are much bigger
+LEAGUES = {
+    'nba': {
+        'espn': 'basketball/nba', 'odds': 'basketball_nba',
+        'teams': 30, 'periods': 4, 'period_min': 12,
+        'pace': 99.0, 'ortg': 114.0, 'spread': 4.0, 'game_sd': 9.0, 'home_adv': 2.5,
+        'season_start': (10, 22), 'season_days': 174, 'games_per_day': 7, 'saturday': 1.0,
+    },
+    'wnba': {
+        'espn': 'basketball/wnba', 'odds': 'basketball_wnba',
+        'teams': 13, 'periods': 4, 'period_min': 10,
+        'pace': 80.0, 'ortg': 102.0, 'spread': 5.0, 'game_sd': 8.0, 'home_adv': 2.0,
+        'season_start': (5, 16), 'season_days': 125, 'games_per_day': 2, 'saturday': 1.0,
+    },
+    'ncaab': {
+        'espn': 'basketball/mens-college-basketball', 'odds': 'basketball_ncaab',
+        'teams': 362, 'periods': 2, 'period_min': 20,
+        'pace': 68.0, 'ortg': 105.0, 'spread': 7.0, 'game_sd': 10.0, 'home_adv': 3.2,
+        'season_start': (11, 3), 'season_days': 130, 'games_per_day': 45, 'saturday': 3.3,
+    },
+    'ncaaw': {
+        'espn': 'basketball/womens-college-basketball', 'odds': 'basketball_wncaab',
+        'teams': 360, 'periods': 4, 'period_min': 10,
+        'pace': 70.0, 'ortg': 98.0, 'spread': 8.0, 'game_sd': 10.0, 'home_adv': 3.0,
+        'season_start': (11, 3), 'season_days': 130, 'games_per_day': 40, 'saturday': 2.5,
+    },
+}
+
+PLACES = [
+    "Abilene", "Akron", "Albany", "Ashland", "Auburn", "Austin", "Bangor", "Baylor", "Boise",
+    "Bristol", "Brookfield", "Camden", "Canton", "Cedar", "Charleston", "Clayton", "Clinton",
+    "Columbia", "Dayton", "Dover", "Eastport", "Elmira", "Fairview", "Franklin", "Fremont",
+    "Georgetown", "Greenville", "Hamilton", "Harrison", "Hudson", "Jackson", "Kent", "Lafayette",
+    "Lancaster", "Lexington", "Lincoln", "Madison", "Marion", "Milton", "Monroe", "Newport",
+    "Oakland", "Oxford", "Portland", "Quincy", "Richmond", "Salem", "Springfield", "Troy",
+    "Union", "Vernon", "Warren", "Westfield", "Winchester",
+]
+MASCOTS = [
+    "Bears", "Bobcats", "Cardinals", "Comets", "Cougars", "Eagles", "Falcons", "Hawks",
+    "Hornets", "Knights", "Lions", "Mustangs", "Owls", "Panthers", "Pioneers", "Rams",
+    "Rebels", "Spartans", "Tigers", "Wildcats",
+]
+
+STAT_NAMES = {     # stats dict key → ESPN statistics name
+    'ppg': 'avgPoints', 'opp_ppg': 'avgPointsAllowed',
+    'fgm': 'avgFieldGoalsMade', 'fga': 'avgFieldGoalsAttempted',
+    'fg3m': 'avgThreePointFieldGoalsMade', 'fg3a': 'avgThreePointFieldGoalsAttempted',
+    'ftm': 'avgFreeThrowsMade', 'fta': 'avgFreeThrowsAttempted',
+    'orb': 'avgOffensiveRebounds', 'drb': 'avgDefensiveRebounds',
+    'ast': 'avgAssists', 'tov': 'avgTurnovers', 'stl': 'avgSteals', 'blk': 'avgBlocks',
+    'ortg': 'offensiveRating', 'drtg': 'defensiveRating', 'pace': 'pace',
+}
+BOX_KEYS = ('fgm', 'fga', 'fg3m', 'fg3a', 'ftm', 'fta', 'orb', 'drb', 'ast', 'tov', 'stl', 'blk', 'pts')
+
+# The scoreboard carries a few team totals per final; the summary has the full box
+SCOREBOARD_STATS = {'fgm': 'fieldGoalsMade', 'fga': 'fieldGoalsAttempted',
+                    'fg3m': 'threePointFieldGoalsMade', 'fg3a': 'threePointFieldGoalsAttempted',
+                    'ftm': 'freeThrowsMade', 'fta': 'freeThrowsAttempted', 'ast': 'assists'}
+SUMMARY_STATS = [
+    ('fieldGoalsMade-fieldGoalsAttempted', 'FG', ('fgm', 'fga')),
+    ('threePointFieldGoalsMade-threePointFieldGoalsAttempted', '3PT', ('fg3m', 'fg3a')),
+    ('freeThrowsMade-freeThrowsAttempted', 'FT', ('ftm', 'fta')),
+    ('offensiveRebounds', 'Offensive Rebounds', ('orb',)),
+    ('defensiveRebounds', 'Defensive Rebounds', ('drb',)),
+    ('assists', 'Assists', ('ast',)),
+    ('steals', 'Steals', ('stl',)),
+    ('blocks', 'Blocks', ('blk',)),
+    ('turnovers', 'Turnovers', ('tov',)),
+]
+
+def _abbr(name):
+    words = name.split()
+    return (words[0][:3] if len(words) == 2 else ''.join(w[0] for w in words))[:4].upper()
+
+def _american(p):
+    p = min(max(p, 0.01), 0.99)
+    return int(round(-100 * p / (1 - p))) if p >= 0.5 else int(round(100 * (1 - p) / p))
+
+def _parse_day(day):
+    if isinstance(day, date):
+        return day
+    day = day.replace('-', '')
+    return date(int(day[:4]), int(day[4:6]), int(day[6:8]))
+
+# ── LEAGUE ───────────────────────────────────────────────────────────────
+class SyntheticLeague:
+    """
+    One league's worth of teams, seasons and slates. Dates before `today`
+    are final, `today` and later are scheduled ('pre').
+    """
+
+    def __init__(self, league='nba', seed=20260222, today=None, n_teams=None, games_per_day=None):
+        self.league = league
+        self.cfg = dict(LEAGUES[league])
+        if n_teams:
+            self.cfg['teams'] = n_teams
+        if games_per_day:
+            self.cfg['games_per_day'] = games_per_day
+        self.seed = seed
+        self.today = _parse_day(today or date.today())
+        self.teams = self._make_teams()
+        self.by_id = {t['id']: t for t in self.teams}
+        self._ratings = {}            # season → team id → (off, def, pace)
+        self._slates = {}             # date → [game]
+        self._season_cache = {}       # season → [final game] before today
+        self._standings = {}          # season → {team id: (wins, losses)}
+
+    def _rng(self, *parts):
+        return random.Random(':'.join(map(str, (self.seed, self.league) + parts)))
+
+    def _make_teams(self):
+        n = self.cfg['teams']
+        if self.league == 'nba' and n <= len(NBA_TEAMS):
+            names = NBA_TEAMS[:n]
+        else:
+            pool = [f"{p} {m}" for p in PLACES for m in MASCOTS]
+            self._rng('teams').shuffle(pool)
+            names = sorted(pool[:n])
+        return [{'id': str(i + 1), 'displayName': name, 'abbreviation': _abbr(name),
+                 'location': name.rsplit(' ', 1)[0], 'name': name.rsplit(' ', 1)[1]}
+                for i, name in enumerate(names)]
+
+    # ── seasons ──
+    def season_of(self, day):
+        """Season start year for a date, or None in the off-season"""
+        m, d = self.cfg['season_start']
+        for year in (day.year, day.year - 1):
+            start = date(year, m, d)
+            if start <= day < start + timedelta(days=self.cfg['season_days']):
+                return year
+        return None
+
+    def season_dates(self, season):
+        m, d = self.cfg['season_start']
+        start = date(season, m, d)
+        return [start + timedelta(days=i) for i in range(self.cfg['season_days'])]
+
+    def ratings(self, season):
+        """Per-team (offence, defence, pace) — a stable team strength plus a season wobble"""
+        if season not in self._ratings:
+            r = self._rng('ratings', season)
+            spread = self.cfg['spread']
+            out = {}
+            for t in self.teams:
+                base = self._rng('strength', t['id'])
+                off = 0.7 * base.gauss(0, spread) + 0.5 * r.gauss(0, spread)
+                dfn = 0.7 * base.gauss(0, spread) + 0.5 * r.gauss(0, spread)
+                out[t['id']] = (off, dfn, self.cfg['pace'] + r.gauss(0, 2))
+            self._ratings[season] = out
+        return self._ratings[season]
+
+    def expected(self, season, home_id, away_id):
+        """(home win prob, expected total) from ratings alone — what a sharp market would price"""
+        rt, c = self.ratings(season), self.cfg
+        h_off, h_def, h_pace = rt[home_id]
+        a_off, a_def, a_pace = rt[away_id]
+        poss = (h_pace + a_pace) / 2
+        h = (c['ortg'] + h_off - a_def) * poss / 100 + c['home_adv'] / 2
+        a = (c['ortg'] + a_off - h_def) * poss / 100 - c['home_adv'] / 2
+        p_home = 0.5 * (1 + math.erf((h - a) / (2 * c['game_sd'])))   # margin sd = game_sd·√2
+        return p_home, h + a
+
+    # ── slates ──
+    def slate(self, day):
+        """Games on a date (final before today, scheduled from today on)"""
+        day = _parse_day(day)
+        if day not in self._slates:
+            self._slates[day] = self._make_slate(day)
+        return self._slates[day]
+
+    def _make_slate(self, day):
+        season = self.season_of(day)
+        if season is None:
+            return []
+        r = self._rng('slate', day.isoformat())
+        c = self.cfg
+        mean = c['games_per_day'] * (c['saturday'] if day.weekday() == 5 else 1.0)
+        n = max(1, min(len(self.teams) // 2, int(round(r.gauss(mean, mean * 0.1)))))
+        ids = r.sample([t['id'] for t in self.teams], 2 * n)
+        games = []
+        for i in range(n):
+            home_id, away_id = ids[2 * i], ids[2 * i + 1]
+            slot = i * 6 // n                          # spread tipoffs 17:00Z–23:30Z
+            tip = datetime(day.year, day.month, day.day, 17 + slot, r.choice((0, 30)))
+            g = {'id': f"{self.league[:1]}{day.strftime('%Y%m%d')}{i:03d}", 'season': season,
+                 'date': tip.strftime('%Y-%m-%dT%H:%MZ'), 'home': home_id, 'away': away_id,
+                 'final': day < self.today}
+            if g['final']:
+                g.update(self._play(r, season, home_id, away_id))
+            games.append(g)
+        return games
+
+    def _box(self, r, poss, target):
+        """A team box score with ~target points on poss possessions (pts is exact for the box)"""
+        scale = poss / 100
+        tov = max(4, round(poss * r.gauss(0.13, 0.02)))
+        fta = max(2, round(poss * r.gauss(0.26, 0.05)))
+        ftm = min(fta, max(0, round(fta * r.gauss(0.77, 0.06))))
+        orb = max(2, round(r.gauss(10.5, 2.5) * scale))
+        fga = max(30, round(poss + orb - tov - 0.44 * fta))
+        fg3a = max(5, round(fga * r.gauss(0.40, 0.05)))
+        fg3m = min(fg3a, max(0, round(fg3a * r.gauss(0.36, 0.05))))
+        fgm = min(fga, max(fg3m, round((target - ftm - fg3m) / 2)))
+        return {
+            'fgm': fgm, 'fga': fga, 'fg3m': fg3m, 'fg3a': fg3a, 'ftm': ftm, 'fta': fta,
+            'orb': orb, 'drb': max(15, round(r.gauss(34, 3) * scale)),
+            'ast': round(fgm * r.uniform(0.52, 0.68)), 'tov': tov,
+            'stl': max(1, round(r.gauss(7.5, 2) * scale)), 'blk': max(0, round(r.gauss(5, 1.8) * scale)),
+            'pts': 2 * fgm + fg3m + ftm,
+        }
+
+    def _split(self, r, pts, periods):
+        w = [r.uniform(0.8, 1.2) for _ in range(periods)]
+        parts = [int(pts * x / sum(w)) for x in w]
+        parts[-1] += pts - sum(parts)
+        return parts
+
+    def _play(self, r, season, home_id, away_id):
+        rt, c = self.ratings(season), self.cfg
+        h_off, h_def, h_pace = rt[home_id]
+        a_off, a_def, a_pace = rt[away_id]
+        poss = max(55, r.gauss((h_pace + a_pace) / 2, 3))
+        h_target = (c['ortg'] + h_off - a_def) * poss / 100 + c['home_adv'] / 2 + r.gauss(0, c['game_sd'])
+        a_target = (c['ortg'] + a_off - h_def) * poss / 100 - c['home_adv'] / 2 + r.gauss(0, c['game_sd'])
+        hb, ab = self._box(r, poss, h_target), self._box(r, poss, a_target)
+        h_lines, a_lines = self._split(r, hb['pts'], c['periods']), self._split(r, ab['pts'], c['periods'])
+        while hb['pts'] == ab['pts']:                  # overtime, five minutes at a time
+            for box, lines in ((hb, h_lines), (ab, a_lines)):
+                made = r.randint(2, 6)
+                fts = r.randint(0, 3)
+                box['fgm'] += made; box['fga'] += made + r.randint(2, 5)
+                box['ftm'] += fts; box['fta'] += fts + r.randint(0, 1)
+                box['pts'] += 2 * made + fts
+                lines.append(2 * made + fts)
+        return {'poss': round(poss, 1), 'home_box': hb, 'away_box': ab,
+                'home_lines': h_lines, 'away_lines': a_lines}
+
+    def season_games(self, season):
+        """Final games of a season so far"""
+        if season not in self._season_cache:
+            self._season_cache[season] = [g for d in self.season_dates(season) if d < self.today
+                                          for g in self.slate(d)]
+        return self._season_cache[season]
+
+    def current_season(self):
+        """The season `today` is in, or the last one played"""
+        season = self.season_of(self.today)
+        if season is None:
+            m, d = self.cfg['season_start']
+            season = self.today.year if self.today >= date(self.today.year, m, d) else self.today.year - 1
+        return season
+
+    def team_totals(self, team_id, season=None):
+        """Season-to-date sums: games, wins, box totals, points allowed, possessions"""
+        season = self.current_season() if season is None else season
+        tot = dict.fromkeys(BOX_KEYS, 0)
+        tot.update(games=0, wins=0, opp_pts=0, poss=0.0)
+        for g in self.season_games(season):
+            if team_id not in (g['home'], g['away']):
+                continue
+            me, them = ('home', 'away') if g['home'] == team_id else ('away', 'home')
+            for k in BOX_KEYS:
+                tot[k] += g[f'{me}_box'][k]
+            tot['opp_pts'] += g[f'{them}_box']['pts']
+            tot['poss'] += g['poss']
+            tot['games'] += 1
+            tot['wins'] += g[f'{me}_box']['pts'] > g[f'{them}_box']['pts']
+        return tot
+
+    def standings(self, season=None):
+        """Season-to-date W-L for every team, as the scoreboard's competitor records show it"""
+        season = self.current_season() if season is None else season
+        if season not in self._standings:
+            wl = {t['id']: [0, 0] for t in self.teams}
+            for g in self.season_games(season):
+                home_won = g['home_box']['pts'] > g['away_box']['pts']
+                wl[g['home']][0 if home_won else 1] += 1
+                wl[g['away']][1 if home_won else 0] += 1
+            self._standings[season] = {tid: tuple(v) for tid, v in wl.items()}
+        return self._standings[season]
+
+    # ── ESPN payloads ──
+    def _team_ref(self, team_id):
+        t = self.by_id[team_id]
+        return {'id': t['id'], 'uid': f"s:40~l:{self.league}~t:{t['id']}", 'location': t['location'],
+                'name': t['name'], 'abbreviation': t['abbreviation'], 'displayName': t['displayName'],
+                'shortDisplayName': t['name']}
+
+    def _status(self, g):
+        if g['final']:
+            n = len(g['home_lines'])
+            detail = 'Final' if n == self.cfg['periods'] else f"Final/{n - self.cfg['periods']}OT"
+            return {'clock': 0.0, 'displayClock': '0:00', 'period': n,
+                    'type': {'id': '3', 'name': 'STATUS_FINAL', 'state': 'post', 'completed': True,
+                             'description': 'Final', 'detail': detail, 'shortDetail': detail}}
+        return {'clock': self.cfg['period_min'] * 60.0, 'displayClock': f"{self.cfg['period_min']}:00",
+                'period': 0, 'type': {'id': '1', 'name': 'STATUS_SCHEDULED', 'state': 'pre',
+                                      'completed': False, 'description': 'Scheduled',
+                                      'detail': g['date'], 'shortDetail': g['date']}}
+
+    def _competitor(self, g, side, schedule=False):
+        team_id = g[side]
+        c = {'id': team_id, 'homeAway': side, 'order': 0 if side == 'home' else 1,
+             'team': self._team_ref(team_id)}
+        if g['final']:
+            other = 'away' if side == 'home' else 'home'
+            pts = g[f'{side}_box']['pts']
+            c['winner'] = pts > g[f'{other}_box']['pts']
+            if schedule:      # the team schedule endpoint wraps scores in an object
+                c['score'] = {'value': float(pts), 'displayValue': str(pts)}
+            else:
+                c['score'] = str(pts)
+                c['linescores'] = [{'value': float(v)} for v in g[f'{side}_lines']]
+                c['statistics'] = [{'name': name, 'abbreviation': k.upper(),
+                                    'displayValue': str(g[f'{side}_box'][k])}
+                                   for k, name in SCOREBOARD_STATS.items()]
+        elif not schedule:
+            c['score'] = '0'
+        if not schedule:
+            wins, losses = self.standings().get(team_id, (0, 0))
+            c['records'] = [{'name': 'overall', 'abbreviation': 'Game', 'type': 'total',
+                             'summary': f"{wins}-{losses}"}]
+        return c
+
+    def _event(self, g, schedule=False):
+        home, away = self.by_id[g['home']], self.by_id[g['away']]
+        status = self._status(g)
+        return {
+            'id': g['id'], 'uid': f"s:40~l:{self.league}~e:{g['id']}", 'date': g['date'],
+            'name': f"{away['displayName']} at {home['displayName']}",
+            'shortName': f"{away['abbreviation']} @ {home['abbreviation']}",
+            'season': {'year': g['season'] + 1, 'type': 2},
+            'competitions': [{
+                'id': g['id'], 'date': g['date'], 'neutralSite': False,
+                'competitors': [self._competitor(g, 'home', schedule), self._competitor(g, 'away', schedule)],
+                'status': status,
+            }],
+            'status': status,
+        }
+
+    def scoreboard(self, day=None):
+        day = _parse_day(day or self.today)
+        return {
+            'leagues': [{'id': self.league, 'abbreviation': self.league.upper(),
+                         'slug': self.cfg['espn'].split('/')[1]}],
+            'day': {'date': day.isoformat()},
+            'events': [self._event(g) for g in self.slate(day)],
+        }
+
+    def game(self, event_id):
+        """The game behind an event id ('<l>YYYYMMDDnnn'), or None"""
+        try:
+            day = date(int(event_id[1:5]), int(event_id[5:7]), int(event_id[7:9]))
+            return self.slate(day)[int(event_id[9:])]
+        except (ValueError, IndexError):
+            return None
+
+    def summary_payload(self, event_id):
+        """ESPN summary?event= — header plus the team box score (away first, like ESPN)"""
+        g = self.game(event_id)
+        if g is None:
+            return None
+        teams = []
+        for side in ('away', 'home'):
+            box = g.get(f'{side}_box')
+            stats = [] if box is None else [
+                {'name': name, 'label': label, 'displayValue': '-'.join(str(box[k]) for k in keys)}
+                for name, label, keys in SUMMARY_STATS]
+            teams.append({'team': self._team_ref(g[side]), 'homeAway': side, 'statistics': stats})
+        return {'header': {'id': g['id'], 'competitions': self._event(g)['competitions']},
+                'boxscore': {'teams': teams}}
+
+    def teams_payload(self):
+        return {'sports': [{'name': 'Basketball', 'slug': 'basketball', 'leagues': [{
+            'abbreviation': self.league.upper(),
+            'teams': [{'team': self._team_ref(t['id'])} for t in self.teams]}]}]}
+
+    def team_payload(self, team_id):
+        tot = self.team_totals(team_id)
+        wins, losses = tot['wins'], tot['games'] - tot['wins']
+        team = self._team_ref(team_id)
+        team['record'] = {'items': [{'description': 'Overall Record', 'type': 'total',
+                                     'summary': f"{wins}-{losses}",
+                                     'stats': [{'name': 'wins', 'value': float(wins)},
+                                               {'name': 'losses', 'value': float(losses)}]}]}
+        return {'team': team}
+
+    def team_stats(self, team_id):
+        """Season averages in nba_predictor.get_team_stats' shape"""
+        tot = self.team_totals(team_id)
+        n = tot['games'] or 1
+        poss = tot['poss'] or 1
+        avg = {k: tot[k] / n for k in BOX_KEYS}
+        return {
+            'ppg': avg['pts'], 'opp_ppg': tot['opp_pts'] / n,
+            **{k: avg[k] for k in BOX_KEYS if k != 'pts'},
+            'ortg': tot['pts'] / poss * 100, 'drtg': tot['opp_pts'] / poss * 100, 'pace': poss / n,
+        }
+
+    def statistics_payload(self, team_id):
+        stats = self.team_stats(team_id)
+        groups = {
+            'offensive': ('ppg', 'fgm', 'fga', 'fg3m', 'fg3a', 'ftm', 'fta', 'orb', 'ast', 'tov', 'ortg'),
+            'defensive': ('opp_ppg', 'drb', 'stl', 'blk', 'drtg'),
+            'general':   ('pace',),
+        }
+        return {
+            'team': self._team_ref(team_id),
+            'results': {'stats': {'categories': [
+                {'name': cat, 'stats': [{'name': STAT_NAMES[k], 'value': round(stats[k], 3),
+                                         'displayValue': f"{stats[k]:.1f}"} for k in keys]}
+                for cat, keys in groups.items()]}},
+        }
+
+    def schedule_payload(self, team_id):
+        season = self.current_season()
+        events = [self._event(g, schedule=True) for d in self.season_dates(season)
+                  for g in self.slate(d) if team_id in (g['home'], g['away'])]
+        return {'team': self._team_ref(team_id), 'season': {'year': season + 1}, 'events': events}
+
+    # ── Odds API payload ──
+    def odds_payload(self, days=2, n_books=8):
+        """Upcoming games (today + days-1) with h2h and totals from n_books bookmakers"""
+        out = []
+        for i in range(days):
+            day = self.today + timedelta(days=i)
+            for g in self.slate(day):
+                r = self._rng('odds', g['id'])
+                p_home, total = self.expected(g['season'], g['home'], g['away'])
+                home, away = self.by_id[g['home']]['displayName'], self.by_id[g['away']]['displayName']
+                stamp = f"{self.today.isoformat()}T12:00:00Z"
+                books = []
+                for b in range(n_books):
+                    p = min(max(p_home + r.gauss(0, 0.02), 0.02), 0.98)
+                    line = round((total + r.gauss(0, 1.5)) * 2) / 2
+                    books.append({'key': f'book{b}', 'title': f'Book {b}', 'last_update': stamp, 'markets': [
+                        {'key': 'h2h', 'last_update': stamp, 'outcomes': [
+                            {'name': home, 'price': _american(p + 0.022)},
+                            {'name': away, 'price': _american(1 - p + 0.022)}]},
+                        {'key': 'totals', 'last_update': stamp, 'outcomes': [
+                            {'name': 'Over', 'price': -110, 'point': line},
+                            {'name': 'Under', 'price': -110, 'point': line}]},
+                    ]})
+                out.append({'id': g['id'], 'sport_key': self.cfg['odds'], 'sport_title': self.league.upper(),
+                            'commence_time': g['date'][:16] + ':00Z', 'home_team': home, 'away_team': away,
+                            'bookmakers': books})
+        return out
+
+    # ── prediction logs ──
+    def prediction_log(self, game_days=180, pending=True, max_games=None):
+        """
+        Log of `game_days` days with games (newest first) in save_to_log's
+        format, settled against the simulated finals. `pending` adds today's
+        slate unsettled. Walks back across as many seasons as needed.
+        """
+        log = []
+        day = self.today if pending else self.today - timedelta(days=1)
+        while len(log) < game_days + (1 if pending else 0):
+            games = self.slate(day)[:max_games]
+            if games:
+                log.append(self._log_entry(day, games))
+            day -= timedelta(days=1)
+            if (self.today - day).days > 366 * 200:
+                break
+        return log
+
+    def _log_entry(self, day, games):
+        r = self._rng('log', day.isoformat())
+        preds = []
+        for g in games:
+            p_home, total = self.expected(g['season'], g['home'], g['away'])
+            p = min(max(p_home + r.gauss(0, 0.06), 0.05), 0.95)
+            est = total + r.gauss(0, 6)
+            line = round((total + r.gauss(0, 1.5)) * 2) / 2
+            home, away = self.by_id[g['home']]['displayName'], self.by_id[g['away']]['displayName']
+            pred = {'matchup': f"{away} @ {home}", 'pick': home if p >= 0.5 else away,
+                    'confidence': round(max(p, 1 - p) * 100, 1), 'est_total': round(est, 1),
+                    'ou_pick': 'OVER' if est > line else 'UNDER', 'ou_line': line, 'result': 'pending'}
+            if g['final']:
+                actual = g['home_box']['pts'] + g['away_box']['pts']
+                over = actual > line
+                pred.update(result='hit' if over == (pred['ou_pick'] == 'OVER') and actual != line else 'miss',
+                            actual_away=g['away_box']['pts'], actual_home=g['home_box']['pts'],
+                            actual_total=actual)
+            preds.append(pred)
+        entry = {'date': day.isoformat(), 'predictions': preds}
+        if all(g['final'] for g in games):
+            hits = sum(p['result'] == 'hit' for p in preds)
+            entry['result'] = {'hits': hits, 'total': len(preds), 'pct': round(hits / len(preds) * 100, 1)}
+        return entry
+
+# ── ON-DISK DUMP ─────────────────────────────────────────────────────────
+def _dump(path, obj):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(obj, f, separators=(',', ':'))
+
+def write_tree(lg, out, back=7, ahead=1, log_days=0):
+    """
+    Write payloads under `out` laid out like the URL paths:
+      <espn path>/scoreboard/YYYYMMDD.json, <espn path>/teams.json,
+      <espn path>/teams/<id>.json, …/statistics.json, …/schedule.json,
+      odds/<sport>.json and, if log_days, nba_predictions_log.json
+    """
+    base = os.path.join(out, lg.cfg['espn'])
+    n = 0
+    for i in range(-back, ahead + 1):
+        day = lg.today + timedelta(days=i)
+        _dump(os.path.join(base, 'scoreboard', f"{day:%Y%m%d}.json"), lg.scoreboard(day))
+        n += 1
+    _dump(os.path.join(base, 'teams.json'), lg.teams_payload())
+    for t in lg.teams:
+        tdir = os.path.join(base, 'teams', t['id'])
+        _dump(tdir + '.json', lg.team_payload(t['id']))
+        _dump(os.path.join(tdir, 'statistics.json'), lg.statistics_payload(t['id']))
+        _dump(os.path.join(tdir, 'schedule.json'), lg.schedule_payload(t['id']))
+        n += 3
+    _dump(os.path.join(out, 'odds', f"{lg.cfg['odds']}.json"), lg.odds_payload(days=ahead + 1))
+    n += 2
+    if log_days:
+        from log_store import save_log
+        os.makedirs(out, exist_ok=True)
+        save_log(lg.prediction_log(log_days), os.path.join(out, 'nba_predictions_log.json'))
+        n += 1
+    return n
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Generate synthetic ESPN / Odds API payloads")
+    ap.add_argument('--league', choices=sorted(LEAGUES), default='nba')
+    ap.add_argument('--seed', type=int, default=20260222)
+    ap.add_argument('--today', help="YYYY-MM-DD the data is 'as of' (default: today)")
+    ap.add_argument('--teams', type=int, help="override the league's team count")
+    ap.add_argument('--games-per-day', type=int, help="override the weekday slate size")
+    ap.add_argument('--back', type=int, default=7, help="scoreboard days before today")
+    ap.add_argument('--ahead', type=int, default=1, help="scoreboard days after today")
+    ap.add_argument('--log-days', type=int, default=0, help="also write a prediction log of this many game days")
+    ap.add_argument('--out', required=True)
+    args = ap.parse_args(argv)
+
+    lg = SyntheticLeague(args.league, args.seed, args.today, args.teams, args.games_per_day)
+    n = write_tree(lg, args.out, args.back, args.ahead, args.log_days)
+    print(f"✅ {n} {args.league.upper()} payloads ({len(lg.teams)} teams, as of {lg.today}) → {args.out}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,176 @@
+"""
+bulk_slate.py
+NCAA-scale slate mode for nba_predictor.py. A college Saturday is 150+
+D-I games among ~360 teams; six requests per game, one game at a time,
+does not finish before the first tipoffs. Instead:
+
+  • the slate (today + tomorrow) is reduced to its distinct teams
+  • each team's stats and form are loaded once, on a pool of workers —
+    the per-host rate limiter in oracle_http keeps the pool polite
+  • W-L records come off the scoreboard, no per-team record call
+  • a game is predicted and checkpointed as soon as both of its teams are
+    in, and a team's summary is dropped once its last game is done, so
+    memory stays flat however large the slate grows
+
+Output is one line per game plus the usual summary, and the run reports
+its throughput in games/sec.
+
+  python3 nba_predictor.py --league ncaab              # the league's default workers
+  python3 nba_predictor.py --league ncaab --workers 32
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import elo_ratings
+import nba_predictor as nba
+import oracle_http
+import oracle_metrics
+import oracle_profile
+
+# ── TEAMS ────────────────────────────────────────────────────────────────
+def scoreboard_record(event, team_id):
+    """Overall W-L summary from a scoreboard competitor, or None"""
+    for c in event['competitions'][0].get('competitors', []):
+        if c.get('team', {}).get('id') == str(team_id):
+            for rec in c.get('records') or []:
+                if rec.get('type', 'total') == 'total' and rec.get('summary'):
+                    return rec['summary']
+    return None
+
+def load_team(team_id, league, priority, record):
+    """Everything one team contributes to its games — small, so it can be held for the whole slate"""
+    shed_before = oracle_http.shed_count()
+    team = {
+        'stats': nba.get_team_stats(team_id, league, priority),
+        'form':  nba.get_recent_form(team_id, league=league, priority=priority),
+        'rec':   record or nba.get_team_record(team_id, league),
+    }
+    team['shed'] = oracle_http.shed_count() != shed_before
+    return team
+
+def game_line(row):
+    flag = " ⚠️" if row.get('flags') else ""
+    god  = " 🔥" if row['conf'] >= 0.70 else ""
+    return (f"  {row['conf']*100:5.1f}%  {row['pick'][:28]:<28} {row['matchup'][:48]:<48} "
+            f"{row['ou']:<5} {row['total']:5.1f}{god}{flag}")
+
+# ── SLATE ────────────────────────────────────────────────────────────────
+def predict_bulk(league, slate, run_dir, resume, workers):
+    """predict_league for big slates: dedupe teams, load them concurrently, stream the games"""
+    t0 = time.perf_counter()
+    requests_before = sum(b['acquired'] for b in oracle_http.rate_limit_state().values())
+    vegas_map = slate['vegas_map']
+    all_events = slate['today'] + slate['tomorrow']
+    scheduled = [(day, e) for day, events in (('TODAY', slate['today']), ('TOMORROW', slate['tomorrow']))
+                 for e in events if e.get('status', {}).get('type', {}).get('state') == 'pre']
+
+    print()
+    if not scheduled:
+        print(f"  ⚠️  No scheduled {league['name']} games found right now.")
+        return
+    n_today = sum(day == 'TODAY' for day, _ in scheduled)
+    print(f"  {league['name']}: {n_today} today + {len(scheduled) - n_today} tomorrow = "
+          f"{len(scheduled)} total games — bulk mode, {workers} workers")
+
+    results, failed, replayed = [], [], 0      # results: (slate index, row) — logged in slate order
+    waiting = {}          # game index → team ids still loading
+    needs = {}            # team id → [priority, record, open games]
+
+    def finish(i, fetch=None):
+        event = scheduled[i][1]
+        _, _, home_name, away_name = nba.event_teams(event)
+        try:
+            with oracle_profile.game(f"{league['name']}: {away_name} @ {home_name}"):
+                _, row, from_ckpt = nba.run_game(event, all_events, vegas_map, run_dir, resume, league, fetch)
+        except Exception as e:
+            failed.append(event.get('id', '?'))
+            oracle_metrics.inc('oracle_games_skipped', reason=type(e).__name__)
+            print(f"  ⚠️  Error processing game {event.get('id', '?')}: {e}")
+            return 0
+        results.append((i, row))
+        oracle_metrics.inc('oracle_games_predicted')
+        if row.get('flags'):
+            oracle_metrics.inc('oracle_games_degraded')
+        print(game_line(row) + (" ♻️" if from_ckpt else ""), flush=True)
+        return from_ckpt
+
+    # Finished (or fully fetched) games replay from their checkpoints; the rest need their teams
+    for i, (day, event) in enumerate(scheduled):
+        ckpt = nba.load_checkpoint(run_dir, nba.game_checkpoint(event)) if resume else None
+        if ckpt and ckpt.get('status') in ('done', 'fetched'):
+            replayed += finish(i)
+            continue
+        home_id, away_id, _, _ = nba.event_teams(event)
+        waiting[i] = {home_id, away_id}
+        for tid in (home_id, away_id):
+            need = needs.setdefault(tid, ['low', scoreboard_record(event, tid), 0])
+            if day == 'TODAY':
+                need[0] = 'normal'
+            need[2] += 1
+
+    teams = {}
+    by_team = {}
+    for i in waiting:
+        for tid in waiting[i]:
+            by_team.setdefault(tid, []).append(i)
+
+    # Today's teams first, so a deadline sheds tomorrow's
+    order = sorted(needs, key=lambda tid: needs[tid][0] != 'normal')
+    with oracle_profile.stage('team_load'), ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(load_team, tid, league, needs[tid][0], needs[tid][1]): tid for tid in order}
+        for fut in as_completed(futures):
+            tid = futures.pop(fut)       # the pool keeps no reference to a finished team either
+            try:
+                teams[tid] = fut.result()
+            except Exception as e:
+                print(f"  ⚠️  Team {tid} failed to load: {e}")
+                teams[tid] = None
+            for i in by_team.pop(tid, []):
+                waiting[i].discard(tid)
+                if waiting[i]:
+                    continue
+                del waiting[i]
+                day, event = scheduled[i]
+                home_id, away_id, home_name, away_name = nba.event_teams(event)
+                home, away = teams[home_id], teams[away_id]
+                if day == 'TOMORROW' and oracle_http.should_shed('low'):
+                    oracle_http.shed(f"{league['key']} game {away_name} @ {home_name} (tomorrow)", 'low')
+                elif home is None or away is None:
+                    failed.append(event.get('id', '?'))
+                else:
+                    inputs = {
+                        'home_stats': home['stats'], 'away_stats': away['stats'],
+                        'home_form': home['form'],   'away_form': away['form'],
+                        'home_rec': home['rec'],     'away_rec': away['rec'],
+                        'home_b2b': nba.detect_b2b(all_events, home_id, league, nba.game_day(event)),
+                        'away_b2b': nba.detect_b2b(all_events, away_id, league, nba.game_day(event)),
+                        'vegas': nba.find_vegas(home_name, away_name, vegas_map),
+                        'elo': elo_ratings.matchup(league, home_id, away_id),
+                    }
+                    if home['shed'] or away['shed']:
+                        inputs['shed'] = True
+                    finish(i, lambda *_: inputs)
+                # Drop a team's summary once its last game is built
+                for t in (home_id, away_id):
+                    needs[t][2] -= 1
+                    if needs[t][2] == 0:
+                        teams.pop(t, None)
+
+    wall = time.perf_counter() - t0
+    requests = sum(b['acquired'] for b in oracle_http.rate_limit_state().values()) - requests_before
+    rate = len(results) / wall if wall > 0 else 0.0
+    oracle_metrics.set_gauge('oracle_slate_games_per_second', rate, league=league['key'])
+    print()
+    print(f"  ⚡ {len(results)} games in {wall:.1f}s — {rate:.1f} games/s "
+          f"({len(needs)} teams, {requests} requests, {workers} workers"
+          + (f", {replayed} from checkpoint" if replayed else "") + ")")
+
+    if results:
+        rows = [row for _, row in sorted(results, key=lambda r: r[0])]
+        print()
+        with oracle_profile.stage('summary'):
+            nba.print_summary(rows, league)
+        with oracle_profile.stage('save_to_log'):
+            nba.save_to_log(rows, league)
+    if failed:
+        print(f"  ⚠️  {len(failed)} {league['name']} game(s) failed — run again with --resume to retry them")
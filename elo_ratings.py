@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+elo_ratings.py
+Team Elo ratings, updated one finished game at a time from the same finals
+update_results.py settles predictions with:
+
+  • margin of victory scales each update (FiveThirtyEight's multiplier,
+    damped when the favourite wins, so blowouts by good teams count less)
+  • home court is worth league['elo']['home'] rating points
+  • at the first game of a new season every team keeps league['elo']['carry']
+    of its distance from the mean
+
+The current ratings live in elo_ratings.json, one compact array per league
+(team ids, ratings and games played side by side). Every applied game is
+appended to elo_history.jsonl with both pre-game ratings. Ratings as of any
+past date come from replaying that log: a season is a few thousand additions.
+
+  python3 elo_ratings.py                                  # NBA table
+  python3 elo_ratings.py --league nba --date 2026-01-15   # as of a past date, by replay
+  python3 elo_ratings.py --rebuild                        # recompute the arrays from the log
+  python3 elo_ratings.py --league ncaab --seed            # fill from the warehouse (no settlement feed)
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+from datetime import date
+
+import warehouse
+from leagues import LEAGUES, parse_leagues, season_start
+
+RATINGS_FILE = 'elo_ratings.json'
+HISTORY_FILE = 'elo_history.jsonl'
+MEAN = 1500.0
+
+# ── MODEL ────────────────────────────────────────────────────────────────
+def expected(diff):
+    """Win probability of the side `diff` rating points ahead"""
+    return 1 / (1 + 10 ** (-diff / 400))
+
+def game_delta(elo_h, elo_a, home_pts, away_pts, params):
+    """Rating points the home team gains from a final (the away team loses as many)"""
+    diff = elo_h - elo_a + params['home']
+    margin = home_pts - away_pts
+    winner_diff = diff if margin > 0 else -diff
+    mov = (abs(margin) + 3) ** 0.8 / (7.5 + 0.006 * winner_diff)
+    return params['k'] * mov * ((1.0 if margin > 0 else 0.0) - expected(diff))
+
+class EloBook:
+    """One league's ratings: parallel team id / rating / games arrays and the season they belong to"""
+
+    def __init__(self, league, teams=(), ratings=(), games=(), season=None, through=None):
+        self.league = league
+        self.params = league['elo']
+        self.teams, self.ratings, self.games = list(teams), list(ratings), list(games)
+        self.index = {t: i for i, t in enumerate(self.teams)}
+        self.season, self.through = season, through
+        self.applied = None         # game ids in the history, loaded on first apply
+        self._day = None            # last day new_season checked
+
+    def slot(self, team_id):
+        i = self.index.get(team_id)
+        if i is None:
+            i = self.index[team_id] = len(self.teams)
+            self.teams.append(team_id)
+            self.ratings.append(MEAN)
+            self.games.append(0)
+        return i
+
+    def rating(self, team_id):
+        i = self.index.get(str(team_id))
+        return None if i is None or not self.games[i] else self.ratings[i]
+
+    def new_season(self, day):
+        """Regress everyone toward the mean when `day` starts a new season"""
+        if day == self._day:
+            return
+        self._day = day
+        start = season_start(self.league, date.fromisoformat(day)).isoformat()
+        if self.season and start > self.season:
+            carry = self.params['carry']
+            self.ratings = [MEAN + carry * (r - MEAN) for r in self.ratings]
+        if not self.season or start > self.season:
+            self.season = start
+
+    def apply(self, day, game_id, home_id, away_id, home_pts, away_pts):
+        """One final → its history record (O(1): two array slots and a season check)"""
+        self.new_season(day)
+        h, a = self.slot(str(home_id)), self.slot(str(away_id))
+        pre = (self.ratings[h], self.ratings[a])
+        delta = game_delta(pre[0], pre[1], home_pts, away_pts, self.params)
+        self.ratings[h] += delta
+        self.ratings[a] -= delta
+        self.games[h] += 1
+        self.games[a] += 1
+        return {'league': self.league['key'], 'date': day, 'game': str(game_id),
+                'home': str(home_id), 'away': str(away_id), 'pts': [home_pts, away_pts],
+                'elo': [round(pre[0], 2), round(pre[1], 2)], 'delta': round(delta, 3)}
+
+    def to_json(self):
+        return {'season': self.season, 'through': self.through, 'teams': self.teams,
+                'ratings': [round(r, 2) for r in self.ratings], 'games': self.games}
+
+# ── STORAGE ──────────────────────────────────────────────────────────────
+def load(path=RATINGS_FILE):
+    """{league key: EloBook} from the ratings file (empty books for leagues not in it)"""
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        data = {}
+    return {key: EloBook(league, **data.get(key, {})) for key, league in LEAGUES.items()}
+
+def save(books, path=RATINGS_FILE):
+    """One line per league — the arrays stay compact (write_json would put every number on its own line)"""
+    lines = [f"{json.dumps(key)}:{json.dumps(book.to_json(), separators=(',', ':'))}"
+             for key, book in books.items() if book.teams]
+    text = '{\n' + ',\n'.join(lines) + '\n}\n'
+    try:
+        with open(path) as f:
+            if f.read() == text:
+                return
+    except OSError:
+        pass
+    with open(path, 'w') as f:
+        f.write(text)
+
+def read_history(league_key=None, path=HISTORY_FILE):
+    """History records for a league (every league if None), in date order"""
+    rows = []
+    try:
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    rec = json.loads(line)
+                    if league_key is None or rec['league'] == league_key:
+                        rows.append(rec)
+    except OSError:
+        pass
+    rows.sort(key=lambda r: r['date'])        # stable: same-day games keep their applied order
+    return rows
+
+def record_finals(book, day, finals, complete=False, path=HISTORY_FILE):
+    """
+    Apply a day's finals (update_results.parse_finals values) not applied
+    before; append them to the history → number applied. complete=True
+    moves `through`, so catch-up starts after it next time: pass it only
+    when this day and every day since `through` is complete.
+    """
+    if book.applied is None:
+        book.applied = {r['game'] for r in read_history(book.league['key'], path)}
+    records = []
+    for g in finals:
+        if not g.get('game_id') or str(g['game_id']) in book.applied:
+            continue
+        records.append(book.apply(day, g['game_id'], g['home_id'], g['away_id'],
+                                  g['home_score'], g['away_score']))
+        book.applied.add(str(g['game_id']))
+    if records:
+        with open(path, 'a') as f:
+            f.writelines(json.dumps(r, separators=(',', ':')) + '\n' for r in records)
+    if complete and (book.through is None or day > book.through):
+        book.through = day
+    return len(records)
+
+# ── REPLAY ───────────────────────────────────────────────────────────────
+def replay(league, history, before=None):
+    """EloBook rebuilt from history records (only games before `before`, YYYY-MM-DD, if given)"""
+    book = EloBook(league)
+    for r in history:
+        if before and r['date'] >= before:
+            break
+        book.apply(r['date'], r['game'], r['home'], r['away'], *r['pts'])
+    return book
+
+def ratings_on(league, day, path=HISTORY_FILE):
+    """{team id: rating} entering `day` (a date or YYYY-MM-DD), by replaying the log"""
+    book = replay(league, read_history(league['key'], path), str(day))
+    return {t: book.ratings[i] for i, t in enumerate(book.teams)}
+
+def seed_from_warehouse(book, conn=None, path=HISTORY_FILE):
+    """Apply every stored warehouse game of the league not yet in the history → number applied"""
+    n = 0
+    days = {}
+    for g in warehouse.games(book.league['key'], conn=conn):
+        days.setdefault(g['date'], []).append(g)
+    for day in sorted(days):
+        n += record_finals(book, day, days[day], complete=True, path=path)
+    return n
+
+# ── PREDICTOR ────────────────────────────────────────────────────────────
+_cache = {'mtime': None, 'books': None}
+_lock = threading.Lock()
+
+def current(path=RATINGS_FILE):
+    """Ratings as last saved, re-read only when the file changes"""
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    with _lock:
+        if _cache['mtime'] != mtime:
+            _cache['books'], _cache['mtime'] = load(path), mtime
+        return _cache['books']
+
+def matchup(league, home_id, away_id):
+    """{'home', 'away', 'wp'} — both ratings and the home win probability — or None if either is unrated"""
+    books = current()
+    if not books:
+        return None
+    book = books[league['key']]
+    home, away = book.rating(home_id), book.rating(away_id)
+    if home is None or away is None:
+        return None
+    return {'home': home, 'away': away, 'wp': expected(home - away + book.params['home'])}
+
+# ── CLI ──────────────────────────────────────────────────────────────────
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Team Elo ratings")
+    ap.add_argument('--league', default='nba')
+    ap.add_argument('--date', type=date.fromisoformat, help="ratings entering this day, replayed from the log")
+    ap.add_argument('--rebuild', action='store_true', help="recompute the stored arrays from the history log")
+    ap.add_argument('--seed', action='store_true', help="apply warehouse games missing from the history")
+    ap.add_argument('--top', type=int, default=30)
+    args = ap.parse_args(argv)
+    try:
+        leagues = parse_leagues(args.league)
+    except ValueError as e:
+        ap.error(str(e))
+
+    books = load()
+    for league in leagues:
+        book = books[league['key']]
+        if args.seed:
+            print(f"  🌱 {league['name']}: {seed_from_warehouse(book)} game(s) applied from the warehouse")
+        if args.rebuild:
+            rebuilt = replay(league, read_history(league['key']))
+            rebuilt.through = book.through
+            books[league['key']] = book = rebuilt
+            print(f"  🔁 {league['name']}: rebuilt from {sum(book.games) // 2} game(s)")
+        if args.date:
+            table = ratings_on(league, args.date)
+            label = f"entering {args.date}"
+        else:
+            table = {t: book.ratings[i] for i, t in enumerate(book.teams)}
+            label = f"through {book.through or '—'}"
+        print(f"  ♟️  {league['name']} Elo {label} — {len(table)} teams")
+        for rank, (tid, r) in enumerate(sorted(table.items(), key=lambda kv: -kv[1])[:args.top], 1):
+            print(f"     {rank:>3}  {tid:<10} {r:7.1f}")
+    if args.seed or args.rebuild:
+        save(books)
+
+if __name__ == '__main__':
+    sys.exit(main())
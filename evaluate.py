@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+NBA ORACLE — Evaluation Engine
+Reads settled predictions from the log for any date range and reports
+ML / O/U hit rates, Brier score, log loss, ROI and total error, broken down
+by confidence bucket, line source and team.
+
+  python3 evaluate.py                          # whole log
+  python3 evaluate.py --from 2026-02-22 --to 2026-02-28
+  python3 evaluate.py --team Celtics --json
+"""
+
+import argparse
+import json
+import sys
+
+import numpy as np
+
+from log_store import LOG_FILE, load_log
+
+DEFAULT_ODDS = -110          # standard juice when no price was logged
+CONF_BUCKETS = [0.50, 0.55, 0.60, 0.70, 1.01]
+CONF_LABELS  = ['50-55%', '55-60%', '60-70%', '70%+']
+
+# ── LOADING ──────────────────────────────────────────────────────────────
+def _num(v, default=np.nan):
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return default
+
+def load_settled(log=None, date_from=None, date_to=None):
+    """
+    Flatten the log into column arrays — one row per settled game.
+    Handles both log schemas (conf/ou/total and confidence/ou_pick/estimated).
+    """
+    if log is None:
+        log = load_log(LOG_FILE)
+    rows = []
+    for entry in log:
+        date = entry.get('date', '')
+        if (date_from and date < date_from) or (date_to and date > date_to):
+            continue
+        for p in entry.get('predictions', []):
+            if p.get('actual_home') is None or p.get('actual_away') is None:
+                continue
+            parts = p.get('matchup', '').split(' @ ')
+            if len(parts) != 2:
+                continue
+            conf = p['conf'] if 'conf' in p else _num(p.get('confidence')) / 100
+            rows.append((
+                date, parts[0].strip(), parts[1].strip(), p.get('pick', ''),
+                _num(conf),
+                (p.get('ou') or p.get('ou_pick') or '').upper(),
+                _num(p.get('ou_line')),
+                _num(p.get('total', p.get('est_total', p.get('estimated')))),
+                p.get('line_source', 'Unknown'),
+                _num(p.get('ml_odds')), _num(p.get('ou_odds')),
+                _num(p['actual_home']), _num(p['actual_away']),
+            ))
+    cols = list(zip(*rows)) if rows else [()] * 13
+    return {
+        'date':        np.array(cols[0], dtype='U10'),
+        'away':        np.array(cols[1], dtype=object),
+        'home':        np.array(cols[2], dtype=object),
+        'pick':        np.array(cols[3], dtype=object),
+        'conf':        np.array(cols[4], dtype=float),
+        'ou':          np.array(cols[5], dtype='U5'),
+        'ou_line':     np.array(cols[6], dtype=float),
+        'est_total':   np.array(cols[7], dtype=float),
+        'line_source': np.array(cols[8], dtype=object),
+        'ml_odds':     np.array(cols[9], dtype=float),
+        'ou_odds':     np.array(cols[10], dtype=float),
+        'actual_home': np.array(cols[11], dtype=float),
+        'actual_away': np.array(cols[12], dtype=float),
+    }
+
+# ── METRICS ──────────────────────────────────────────────────────────────
+def payout(odds):
+    """Profit per 1 unit staked at American odds (vectorized)"""
+    odds = np.asarray(odds, dtype=float)
+    return np.where(odds < 0, 100 / np.abs(odds), odds / 100)
+
+def outcomes(g):
+    """Per-game outcome arrays: ML hit, O/U hit (NaN on push / no pick), profits"""
+    actual_total = g['actual_home'] + g['actual_away']
+    home_won = g['actual_home'] > g['actual_away']
+    picked_home = np.array([pk == h or (pk and pk.split()[-1] == h.split()[-1])
+                            for pk, h in zip(g['pick'], g['home'])], dtype=bool)
+    has_pick = np.array([bool(pk) for pk in g['pick']], dtype=bool)
+    ml_hit = np.where(has_pick, (picked_home == home_won).astype(float), np.nan)
+
+    over  = g['ou'] == 'OVER'
+    under = g['ou'] == 'UNDER'
+    push  = actual_total == g['ou_line']
+    ou_hit = np.where(over, actual_total > g['ou_line'], actual_total < g['ou_line']).astype(float)
+    ou_hit[~(over | under) | push | np.isnan(g['ou_line'])] = np.nan
+
+    ml_odds = g['ml_odds']
+    ml_profit = np.where(ml_hit == 1, payout(np.nan_to_num(ml_odds, nan=DEFAULT_ODDS)), -1.0)
+    ml_profit[np.isnan(ml_hit) | np.isnan(ml_odds)] = np.nan
+    ou_odds = np.nan_to_num(g['ou_odds'], nan=DEFAULT_ODDS)
+    ou_profit = np.where(ou_hit == 1, payout(ou_odds), -1.0)
+    ou_profit[np.isnan(ou_hit)] = np.nan
+
+    return {
+        'ml_hit': ml_hit, 'ou_hit': ou_hit,
+        'ml_profit': ml_profit, 'ou_profit': ou_profit,
+        'total_err': g['est_total'] - actual_total,
+    }
+
+def summarize(g, o, mask=None):
+    """Headline metrics over the rows selected by mask"""
+    if mask is None:
+        mask = np.ones(len(g['date']), dtype=bool)
+    conf = np.clip(g['conf'][mask], 1e-6, 1 - 1e-6)
+    ml   = o['ml_hit'][mask]
+    ok   = ~np.isnan(ml) & ~np.isnan(conf)
+    ou   = o['ou_hit'][mask]
+    mlp  = o['ml_profit'][mask]
+    oup  = o['ou_profit'][mask]
+    err  = o['total_err'][mask]
+    err  = err[~np.isnan(err)]
+
+    def rate(x):
+        x = x[~np.isnan(x)]
+        return (int(x.sum()), len(x), float(x.mean()) if len(x) else None)
+
+    ml_h, ml_n, ml_pct = rate(ml)
+    ou_h, ou_n, ou_pct = rate(ou)
+    return {
+        'games':    int(mask.sum()),
+        'ml':       {'hits': ml_h, 'total': ml_n, 'rate': ml_pct},
+        'ou':       {'hits': ou_h, 'total': ou_n, 'rate': ou_pct},
+        'brier':    float(np.mean((conf[ok] - ml[ok]) ** 2)) if ok.any() else None,
+        'log_loss': float(-np.mean(ml[ok] * np.log(conf[ok]) + (1 - ml[ok]) * np.log(1 - conf[ok]))) if ok.any() else None,
+        'ml_roi':   float(np.nanmean(mlp)) if np.any(~np.isnan(mlp)) else None,
+        'ml_bets':  int(np.sum(~np.isnan(mlp))),
+        'ou_roi':   float(np.nanmean(oup)) if np.any(~np.isnan(oup)) else None,
+        'total_mae':  float(np.mean(np.abs(err))) if len(err) else None,
+        'total_bias': float(np.mean(err)) if len(err) else None,
+    }
+
+def breakdown(g, o, keys):
+    """Group rows by a key array and summarize each group"""
+    labels, inv = np.unique(np.asarray(keys, dtype=str), return_inverse=True)
+    return {str(lbl): summarize(g, o, inv == i) for i, lbl in enumerate(labels)}
+
+def conf_bucket(conf):
+    idx = np.clip(np.digitize(conf, CONF_BUCKETS) - 1, 0, len(CONF_LABELS) - 1)
+    return np.array(CONF_LABELS)[idx]
+
+def evaluate(log=None, date_from=None, date_to=None, team=None):
+    g = load_settled(log, date_from, date_to)
+    if team:
+        t = team.lower()
+        keep = np.array([t in a.lower() or t in h.lower() for a, h in zip(g['away'], g['home'])], dtype=bool)
+        g = {k: v[keep] for k, v in g.items()}
+    o = outcomes(g)
+    teams = np.concatenate([g['away'], g['home']])
+    g2 = {k: np.concatenate([v, v]) for k, v in g.items()}
+    o2 = {k: np.concatenate([v, v]) for k, v in o.items()}
+    return {
+        'from': date_from or (str(min(g['date'])) if len(g['date']) else None),
+        'to':   date_to   or (str(max(g['date'])) if len(g['date']) else None),
+        'overall':     summarize(g, o),
+        'by_conf':     breakdown(g, o, conf_bucket(g['conf'])),
+        'by_source':   breakdown(g, o, g['line_source']),
+        'by_team':     breakdown(g2, o2, teams),
+        'ou_misses':   [(str(a), str(h), str(pk), float(l), int(ah + aa))
+                        for a, h, pk, l, ah, aa, hit in zip(g['away'], g['home'], g['ou'], g['ou_line'],
+                                                             g['actual_home'], g['actual_away'], o['ou_hit'])
+                        if hit == 0],
+    }
+
+# ── REPORT ───────────────────────────────────────────────────────────────
+def _pct(x):
+    return f"{x*100:.1f}%" if x is not None else '—'
+
+def _f(x, fmt='.3f'):
+    return format(x, fmt) if x is not None else '—'
+
+def _line(label, s):
+    return (f"  {label:<24} {s['ml']['hits']:>3}/{s['ml']['total']:<3} {_pct(s['ml']['rate']):>6}  "
+            f"{s['ou']['hits']:>3}/{s['ou']['total']:<3} {_pct(s['ou']['rate']):>6}  "
+            f"{_f(s['brier']):>6}  {_f(s['total_mae'], '.1f'):>5}")
+
+def print_report(rep, top_teams=10):
+    s = rep['overall']
+    print()
+    print("=" * 70)
+    print("  🏀  NBA ORACLE — PREDICTION vs ACTUAL RESULTS")
+    print(f"  📅  {rep['from'] or '—'} → {rep['to'] or '—'}   ({s['games']} settled games)")
+    print("=" * 70)
+    print()
+    if not s['games']:
+        print("  ⏳ No settled predictions in this range. Run update_results.py first.")
+        print()
+        return
+
+    print(f"  Pick accuracy       : {s['ml']['hits']}/{s['ml']['total']} = {_pct(s['ml']['rate'])}")
+    print(f"  Over/Under accuracy : {s['ou']['hits']}/{s['ou']['total']} = {_pct(s['ou']['rate'])}")
+    print(f"  Brier score         : {_f(s['brier'])}   (0.250 = coin flip)")
+    print(f"  Log loss            : {_f(s['log_loss'])}   (0.693 = coin flip)")
+    ml_roi = f"{_pct(s['ml_roi'])} over {s['ml_bets']} priced picks" if s['ml_roi'] is not None else '— (no ML odds logged)'
+    print(f"  ML ROI              : {ml_roi}")
+    print(f"  O/U ROI             : {_pct(s['ou_roi'])}   (at logged odds, else {DEFAULT_ODDS})")
+    print(f"  Total error         : MAE {_f(s['total_mae'], '.1f')} pts | bias {_f(s['total_bias'], '+.1f')} pts")
+    print()
+
+    header = f"  {'':<24} {'PICK':>14}  {'O/U':>14}  {'BRIER':>6}  {'MAE':>5}"
+    for title, key in (("📊  BY CONFIDENCE", 'by_conf'), ("💠  BY LINE SOURCE", 'by_source')):
+        print("=" * 70)
+        print(f"  {title}")
+        print("=" * 70)
+        print(header)
+        for label, sub in rep[key].items():
+            print(_line(label, sub))
+        print()
+
+    print("=" * 70)
+    print(f"  🏀  BY TEAM (top {top_teams} by games)")
+    print("=" * 70)
+    print(header)
+    teams = sorted(rep['by_team'].items(), key=lambda kv: (-kv[1]['games'], kv[0]))[:top_teams]
+    for label, sub in teams:
+        print(_line(label[:24], sub))
+    print()
+
+    if rep['ou_misses']:
+        print("  ❌ O/U WRONG:")
+        for away, home, ou, line, total in rep['ou_misses']:
+            print(f"     • {away.split()[-1]} @ {home.split()[-1]} (pred {ou} {line}, actual {total})")
+        print()
+
+    print("=" * 70)
+    print("  🔍  ENGINE ANALYSIS")
+    print("=" * 70)
+    for name, rate in (("O/U Model", s['ou']['rate']), ("Pick Model", s['ml']['rate'])):
+        if rate is None:
+            print(f"  {name}: — (no settled picks)")
+            continue
+        pct = rate * 100
+        if pct >= 70:
+            print(f"  {name}: 🔥 STRONG ({pct:.1f}%)")
+        elif pct >= 60:
+            print(f"  {name}: ✅ SOLID ({pct:.1f}%)")
+        else:
+            print(f"  {name}: ⚠️  NEEDS WORK ({pct:.1f}%)")
+    print("=" * 70)
+    print()
+
+# ── MAIN ─────────────────────────────────────────────────────────────────
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Evaluate settled predictions from the log")
+    ap.add_argument('--from', dest='date_from', help="first date YYYY-MM-DD (inclusive)")
+    ap.add_argument('--to', dest='date_to', help="last date YYYY-MM-DD (inclusive)")
+    ap.add_argument('--team', help="only games involving this team (substring match)")
+    ap.add_argument('--log', default=LOG_FILE, help=f"predictions log (default {LOG_FILE})")
+    ap.add_argument('--json', action='store_true', help="print the metrics as JSON")
+    args = ap.parse_args(argv)
+
+    rep = evaluate(load_log(args.log), args.date_from, args.date_to, args.team)
+    if args.json:
+        json.dump(rep, sys.stdout, indent=2)
+        print()
+    else:
+        print_report(rep)
+
+if __name__ == '__main__':
+    main()
@@ -3,21 +3,21 @@
 Export predictions log to dashboard/predictions.json
 Run after nba_predictor.py to update the live dashboard
 """
-import json, os
+import os, time
 from datetime import datetime
 
-NBA_LOG  = 'nba_predictions_log.json'
-NCAA_LOG = 'ncaa_predictions_log.json'
-OUT_DIR  = 'dashboard'
-OUT_FILE = f'{OUT_DIR}/predictions.json'
+import oracle_metrics
+from log_store import load_log, write_json, write_meta
+from resampling import bootstrap_mean, log_intervals, as_percent
 
-os.makedirs(OUT_DIR, exist_ok=True)
+NBA_LOG   = 'nba_predictions_log.json'
+NCAA_LOG  = 'ncaa_predictions_log.json'
+OUT_DIR   = 'dashboard'
+OUT_FILE  = f'{OUT_DIR}/predictions.json'
+META_FILE = f'{OUT_DIR}/meta.json'
 
-def load_log(path):
-    if os.path.exists(path):
-        with open(path) as f:
-            return json.load(f)
-    return []
+_started = time.perf_counter()
+os.makedirs(OUT_DIR, exist_ok=True)
 
 nba_log  = load_log(NBA_LOG)
 ncaa_log = load_log(NCAA_LOG)
@@ -28,9 +28,19 @@ today = datetime.now().strftime('%Y-%m-%d')
 nba_today  = next((e for e in nba_log  if e['date'] == today), None)
 ncaa_today = next((e for e in ncaa_log if e['date'] == today), None)
 
+def day_ci(entry):
+    """95% bootstrap interval for one day's hit rate (None until settled)"""
+    hits = [1.0 if p.get('result') == 'hit' else 0.0
+            for p in entry.get('predictions', []) if p.get('result') in ('hit', 'miss')]
+    if 'result' not in entry or not hits:
+        return None
+    ci = as_percent(bootstrap_mean(hits))
+    return {'lo': ci['lo'], 'hi': ci['hi']}
+
 # Full history with results
 nba_history = [
-    {'date': e['date'], 'result': e.get('result', {}), 'total': len(e.get('predictions', []))}
+    {'date': e['date'], 'result': e.get('result', {}), 'total': len(e.get('predictions', [])),
+     'ci': day_ci(e)}
     for e in nba_log
 ]
 
@@ -39,8 +49,22 @@ total_hits  = sum(e.get('result', {}).get('hits', 0)  for e in nba_log if 'resul
 total_picks = sum(e.get('result', {}).get('total', 0) for e in nba_log if 'result' in e)
 best_day    = max((e for e in nba_log if 'result' in e), key=lambda e: e['result'].get('pct', 0), default=None)
 
+# Intervals — block bootstrap by date, so one hot night isn't read as a trend
+settled = [(e['date'], 1.0 if p.get('result') == 'hit' else 0.0)
+           for e in nba_log if 'result' in e
+           for p in e.get('predictions', []) if p.get('result') in ('hit', 'miss')]
+acc_ci  = as_percent(bootstrap_mean([h for _, h in settled], groups=[d for d, _ in settled]))
+log_ci  = log_intervals(nba_log, block=True)
+intervals = {
+    'accuracy':    acc_ci,
+    'ml_hit_rate': as_percent(log_ci['ml_hit_rate']),
+    'ou_hit_rate': as_percent(log_ci['ou_hit_rate']),
+    'ml_roi':      as_percent(log_ci['ml_roi']),
+    'ou_roi':      as_percent(log_ci['ou_roi']),
+    'brier':       log_ci['brier'],
+}
+
 output = {
-    'updated': datetime.now().strftime('%Y-%m-%d %H:%M'),
     'stats': {
         'total_hits':   total_hits,
         'total_picks':  total_picks,
@@ -52,12 +76,20 @@ output = {
     'nba_today':   nba_today,
     'ncaa_today':  ncaa_today,
     'nba_history': nba_history,
+    'intervals':   intervals,
 }
 
-with open(OUT_FILE, 'w') as f:
-    json.dump(output, f, indent=2, default=str)
+# Timestamp goes to the small meta file so predictions.json only changes with the data
+changed = write_json(OUT_FILE, output)
+write_meta(META_FILE, updated=datetime.now().strftime('%Y-%m-%d %H:%M'))
+
+oracle_metrics.set_gauge('oracle_export_days', len(nba_history))
+if total_picks:
+    oracle_metrics.set_gauge('oracle_export_accuracy_ratio', round(total_hits / total_picks, 4))
+oracle_metrics.finish_job('export_predictions', _started)
 
-print(f"✅ Dashboard data exported to {OUT_FILE}")
-print(f"   NBA accuracy: {output['stats']['accuracy']}% ({total_hits}/{total_picks})")
+print(f"✅ Dashboard data exported to {OUT_FILE}" + ("" if changed else " (no changes)"))
+print(f"   NBA accuracy: {output['stats']['accuracy']}% ({total_hits}/{total_picks})"
+      + (f" — 95% CI {acc_ci['lo']}–{acc_ci['hi']}%" if acc_ci['n'] else ""))
 print(f"   Today's NBA games: {len(nba_today['predictions']) if nba_today else 0}")
 print(f"   Today's NCAA games: {len(ncaa_today['predictions']) if ncaa_today else 0}")
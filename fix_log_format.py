@@ -4,11 +4,9 @@ One-time script to convert nba_predictions_log.json into the format
 the dashboard expects, then backfill all available results.
 """
 import requests
-import json
-import os
 from datetime import datetime
 
-LOG_FILE = 'nba_predictions_log.json'
+from log_store import LOG_FILE, load_log, save_log
 
 # Known results from our tracking history
 KNOWN_RESULTS = {
@@ -71,18 +69,7 @@ def rebuild_log():
     today = datetime.now().strftime('%Y-%m-%d')
 
     # Load existing log if present
-    existing = {}
-    if os.path.exists(LOG_FILE):
-        try:
-            with open(LOG_FILE, 'r') as f:
-                raw = json.load(f)
-            entries = raw if isinstance(raw, list) else raw.get('entries', [])
-            for entry in entries:
-                d = entry.get('date')
-                if d:
-                    existing[d] = entry
-        except:
-            pass
+    existing = {e['date']: e for e in load_log(LOG_FILE) if e.get('date')}
 
     # Merge known results with existing log
     all_dates = set(list(KNOWN_RESULTS.keys()) + list(existing.keys()))
@@ -109,8 +96,7 @@ def rebuild_log():
                     p['god'] = p.get('confidence', 0) >= 70
             new_log.append({'date': date, 'predictions': preds})
 
-    with open(LOG_FILE, 'w') as f:
-        json.dump(new_log, f, indent=2)
+    save_log(new_log, LOG_FILE)
 
     total_picks = sum(len(e['predictions']) for e in new_log)
     total_hits = sum(1 for e in new_log for p in e['predictions'] if p.get('result') == 'hit')
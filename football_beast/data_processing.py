@@ -3,8 +3,8 @@ Football Beast - Data Processing & Feature Engineering
 Advanced football analytics for 8 prediction markets
 """
 
+import math
 import numpy as np
-import pandas as pd
 from typing import Dict, List, Tuple
 from datetime import datetime, timedelta
 import warnings
@@ -420,8 +420,6 @@ class FootballFeatureEngineering:
             final_away_xg = away_adjusted_xg * (0.7 + 0.3 * away_form)
             
             # Poisson-based win probability
-            from scipy import stats
-            
             # Estimate win/draw/loss using normal approximation
             home_win_prob = 0
             draw_prob = 0
@@ -429,8 +427,8 @@ class FootballFeatureEngineering:
             
             for h_goals in range(0, 6):
                 for a_goals in range(0, 6):
-                    home_p = (final_home_xg ** h_goals * np.exp(-final_home_xg)) / np.math.factorial(h_goals)
-                    away_p = (final_away_xg ** a_goals * np.exp(-final_away_xg)) / np.math.factorial(a_goals)
+                    home_p = (final_home_xg ** h_goals * np.exp(-final_home_xg)) / math.factorial(h_goals)
+                    away_p = (final_away_xg ** a_goals * np.exp(-final_away_xg)) / math.factorial(a_goals)
                     prob = home_p * away_p
                     
                     if h_goals > a_goals:
@@ -4,7 +4,6 @@ Main class for all 8 market predictions + recommendations
 """
 
 import numpy as np
-import pandas as pd
 import json
 from datetime import datetime
 from typing import Dict, List, Tuple
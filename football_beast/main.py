@@ -4,6 +4,8 @@ You input real matches, engine provides predictions
 """
 
 import json
+import os
+import sys
 import numpy as np
 from datetime import datetime
 from typing import List, Dict
@@ -106,4 +108,11 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    if '--import-profile' in sys.argv:
+        # import_profile.py lives at the repository root
+        here = os.path.dirname(os.path.abspath(__file__))
+        sys.path.insert(0, os.path.dirname(here))
+        from import_profile import print_profile
+        print_profile('football_beast', path=here)
+    else:
+        main()
\ No newline at end of file
@@ -3,42 +3,28 @@ Football Beast - ML Models & Recommendation Engine
 4-Model Ensemble + Market Recommendation System
 """
 
+import importlib
 import numpy as np
-import pandas as pd
 from typing import Dict, List, Tuple
 import warnings
 warnings.filterwarnings('ignore')
 
 from config import MODEL_CONFIG, XGBOOST_PARAMS, LGBM_PARAMS, CATBOOST_PARAMS, NN_PARAMS
 
-try:
-    import xgboost as xgb
-except:
-    xgb = None
 
-try:
-    import lightgbm as lgb
-except:
-    lgb = None
-
-try:
-    from catboost import CatBoostClassifier
-except:
-    CatBoostClassifier = None
-
-try:
-    from tensorflow import keras
-    from tensorflow.keras import layers
-except:
-    keras = None
+def _backend(module):
+    """Import an ML backend on first use (keeps the formula path's cold start fast)"""
+    try:
+        return importlib.import_module(module)
+    except Exception:
+        raise ImportError(f"{module} not installed")
 
 
 class XGBoostPredictor:
     """XGBoost model for market prediction"""
     
     def __init__(self):
-        if xgb is None:
-            raise ImportError("xgboost not installed")
+        xgb = _backend('xgboost')
         self.model = xgb.XGBClassifier(**XGBOOST_PARAMS)
         self.name = 'xgboost'
     
@@ -66,8 +52,7 @@ class LightGBMPredictor:
     """LightGBM model for market prediction"""
     
     def __init__(self):
-        if lgb is None:
-            raise ImportError("lightgbm not installed")
+        lgb = _backend('lightgbm')
         self.model = lgb.LGBMClassifier(**LGBM_PARAMS)
         self.name = 'lightgbm'
     
@@ -95,8 +80,7 @@ class CatBoostPredictor:
     """CatBoost model for market prediction"""
     
     def __init__(self):
-        if CatBoostClassifier is None:
-            raise ImportError("catboost not installed")
+        CatBoostClassifier = _backend('catboost').CatBoostClassifier
         self.model = CatBoostClassifier(**CATBOOST_PARAMS)
         self.name = 'catboost'
     
@@ -124,8 +108,8 @@ class NeuralNetworkPredictor:
     """Neural Network model for market prediction"""
     
     def __init__(self, input_dim=20):
-        if keras is None:
-            raise ImportError("tensorflow not installed")
+        keras = _backend('tensorflow').keras
+        layers = keras.layers
         
         model = keras.Sequential([
             layers.Input(shape=(input_dim,)),
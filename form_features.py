@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+form_features.py
+Rolling form for every team after every game of a season, built in one
+vectorized pass over the warehouse game log (warehouse.py):
+
+  • last 5 / 10 / 20 games — win share, scored, allowed, point diff, total
+  • exponentially weighted versions (half-life HALFLIFE games)
+  • home / away splits over each side's last SPLIT_WINDOW games
+  • current streak and days since the last game
+
+Each team-game becomes a row, sorted by team then date, so every window is
+a difference of two cumulative sums. A dense (team × day) as-of index then
+maps any date to the team's last game before it, so the predictor's form
+lookup is one array read instead of a schedule call and a Python loop.
+
+  python3 form_features.py --league nba                   # every team, as of today
+  python3 form_features.py --league ncaab --date 2026-02-14 --team 150
+"""
+import argparse
+import sys
+import threading
+import time
+from datetime import date, datetime
+
+import numpy as np
+
+import warehouse
+from leagues import parse_leagues, season_start
+
+WINDOWS      = (5, 10, 20)
+HALFLIFE     = 5.0        # games — an EWMA weight halves every 5 games back
+SPLIT_WINDOW = 10         # home / away splits look at each side's last 10
+EPOCH        = date(1970, 1, 1)
+
+# ── ROLLING PRIMITIVES ───────────────────────────────────────────────────
+def group_starts(keys):
+    """Index of the first row of each row's group — keys sorted so groups are contiguous"""
+    idx = np.arange(len(keys))
+    first = np.ones(len(keys), dtype=bool)
+    first[1:] = keys[1:] != keys[:-1]
+    return np.maximum.accumulate(np.where(first, idx, 0))
+
+def _rolling_mean(x, starts, window):
+    """Mean of each row and the window-1 rows before it, within its group"""
+    idx = np.arange(len(x))
+    cs = np.concatenate([[0.0], np.cumsum(x, dtype=float)])
+    lo = np.maximum(starts, idx + 1 - window)
+    return (cs[idx + 1] - cs[lo]) / (idx + 1 - lo)
+
+def _ewm(x, starts, decay):
+    """
+    Exponentially weighted mean of each row and its group's earlier rows:
+    Σ decay^(p-j)·x_j / Σ decay^(p-j) = Σ decay^-j·x_j / Σ decay^-j, so both
+    sums are group cumulative sums (positions stay small — a season at most).
+    """
+    idx = np.arange(len(x))
+    pos = idx - starts
+    w = decay ** -pos.astype(float)
+    num = np.cumsum(w * x)
+    den = np.cumsum(w)
+    base = starts - 1
+    num_before = np.where(base >= 0, num[np.maximum(base, 0)], 0.0)
+    den_before = np.where(base >= 0, den[np.maximum(base, 0)], 0.0)
+    return (num - num_before) / (den - den_before)
+
+def _forward_fill(values, mask, starts):
+    """Each row gets the value of its group's latest masked row at or before it (NaN if none yet)"""
+    idx = np.arange(len(mask))
+    last = np.maximum.accumulate(np.where(mask, idx, -1))
+    ok = last >= starts
+    return np.where(ok, values[np.maximum(last, 0)], np.nan)
+
+# ── AS-OF TABLES ─────────────────────────────────────────────────────────
+class AsOfTable:
+    """
+    Team-game rows sorted by team then date, and the as-of index over them:
+    `asof[team, day]` is the row of the team's last game before that day, -1
+    if it has not played yet. Subclasses fill `columns`, one value per row.
+    """
+
+    def _sort_rows(self, games):
+        """
+        Index a game log as two rows per game — every home side, then every
+        away side — and return the permutation that sorts those rows by team
+        and date (subclasses apply it to their own per-side arrays).
+        """
+        n = len(games)
+        ids = np.array([str(g['home_id']) for g in games] + [str(g['away_id']) for g in games], dtype=str)
+        self.teams, team = np.unique(ids, return_inverse=True)
+        self.index = {t: i for i, t in enumerate(self.teams)}
+        self.columns = {}
+        days = np.array([g['date'] for g in games], dtype='datetime64[D]').astype(int)
+        day = np.concatenate([days, days])
+        order = np.lexsort((np.tile(np.arange(n), 2), day, team))
+        self.team, self.day = team[order], day[order]
+        if not n:
+            self.first_day, self.asof = 0, np.full((len(self.teams), 1), -1, dtype=np.int32)
+            return order
+        team, day = self.team, self.day
+        self.first_day = int(day.min())
+        # asof[t, k]: last row of team t strictly before day first_day + k; the
+        # last column (k = span) stands for every day after the final game
+        span = int(day.max()) - self.first_day + 1
+        key = team.astype(np.int64) * (span + 1) + (day - self.first_day)
+        query = (np.arange(len(self.teams), dtype=np.int64)[:, None] * (span + 1)
+                 + np.arange(span + 1)[None, :])
+        pos = np.searchsorted(key, query, side='left') - 1
+        same_team = (pos >= 0) & (team[np.maximum(pos, 0)] == np.arange(len(self.teams))[:, None])
+        self.asof = np.where(same_team, pos, -1).astype(np.int32)
+        return order
+
+    def __len__(self):
+        return len(self.team)
+
+    def _slot(self, day):
+        k = (day - EPOCH).days - self.first_day
+        return None if k < 0 else min(k, self.asof.shape[1] - 1)
+
+    def row(self, team_id, day):
+        """Row of the team's last game before `day`, or None — O(1)"""
+        t = self.index.get(str(team_id))
+        k = self._slot(day)
+        if t is None or k is None:
+            return None
+        r = int(self.asof[t, k])
+        return r if r >= 0 else None
+
+    def snapshot(self, day):
+        """{team_id: features} for every team that has played before `day`"""
+        k = self._slot(day)
+        if k is None:
+            return {}
+        return {self.teams[t]: self.features(self.teams[t], day)
+                for t in np.flatnonzero(self.asof[:, k] >= 0)}
+
+class FormTable(AsOfTable):
+    """Form of every team after each of its games, looked up as of any date"""
+
+    def __init__(self, games, windows=WINDOWS, halflife=HALFLIFE, split_window=SPLIT_WINDOW):
+        self.windows = tuple(windows)
+        n = len(games)
+        order = self._sort_rows(games)
+        if not n:
+            return
+        home_pts = np.array([g['home_score'] for g in games], dtype=float)
+        away_pts = np.array([g['away_score'] for g in games], dtype=float)
+        pts = np.concatenate([home_pts, away_pts])[order]
+        opp = np.concatenate([away_pts, home_pts])[order]
+        home = np.concatenate([np.ones(n, dtype=bool), np.zeros(n, dtype=bool)])[order]
+        team = self.team
+        won = (pts > opp).astype(float)
+        diff = pts - opp
+        starts = group_starts(team)
+        idx = np.arange(len(team))
+
+        cols = {'games': (idx - starts + 1).astype(float), 'home': home.astype(float)}
+        for w in self.windows:
+            cols[f'win_pct_l{w}'] = _rolling_mean(won, starts, w)
+            cols[f'pts_l{w}'] = _rolling_mean(pts, starts, w)
+            cols[f'opp_l{w}'] = _rolling_mean(opp, starts, w)
+            cols[f'diff_l{w}'] = cols[f'pts_l{w}'] - cols[f'opp_l{w}']
+            cols[f'total_l{w}'] = cols[f'pts_l{w}'] + cols[f'opp_l{w}']
+        decay = 0.5 ** (1.0 / halflife)
+        cols['ewm_win_pct'] = _ewm(won, starts, decay)
+        cols['ewm_pts'] = _ewm(pts, starts, decay)
+        cols['ewm_opp'] = _ewm(opp, starts, decay)
+        cols['ewm_diff'] = cols['ewm_pts'] - cols['ewm_opp']
+
+        # Home / away: roll over each side's own rows, then carry forward across the other side's games
+        for side, mask in (('home', home), ('away', ~home)):
+            sub = np.flatnonzero(mask)
+            sub_starts = group_starts(team[sub])
+            for name, x in (('win_pct', won), ('diff', diff)):
+                full = np.full(len(team), np.nan)
+                full[sub] = _rolling_mean(x[sub], sub_starts, split_window)
+                cols[f'{side}_{name}'] = _forward_fill(full, mask, starts)
+
+        # Streak: length of the run of equal results ending at each game
+        run_start = np.ones(len(team), dtype=bool)
+        run_start[1:] = (team[1:] != team[:-1]) | (won[1:] != won[:-1])
+        cols['streak'] = (idx - np.maximum.accumulate(np.where(run_start, idx, 0)) + 1).astype(float)
+        cols['won'] = won
+
+        self.columns = cols
+
+    def features(self, team_id, day):
+        """Every feature for a team as of `day` (games before it), or None if it has none"""
+        r = self.row(team_id, day)
+        if r is None:
+            return None
+        out = {name: py_value(col[r]) for name, col in self.columns.items()}
+        out['rest_days'] = (day - EPOCH).days - int(self.day[r])
+        return out
+
+    def form(self, team_id, day, num_games=10):
+        """get_recent_form's dict (plus every feature) as of `day`, or None"""
+        if num_games not in self.windows:
+            return None
+        f = self.features(team_id, day)
+        if f is None:
+            return None
+        count = int(min(f['games'], num_games))
+        wins = int(round(f[f'win_pct_l{num_games}'] * count))
+        # The streak is capped at the window, as form_from_games counts it on the ESPN path
+        return dict(f, wins=wins, losses=count - wins,
+                    avg_pts=f[f'pts_l{num_games}'], avg_opp=f[f'opp_l{num_games}'],
+                    form_score=(wins / count - 0.5) * 2,
+                    streak=int(min(f['streak'], num_games)), streak_type='W' if f['won'] else 'L')
+
+def py_value(v):
+    v = float(v)
+    return None if np.isnan(v) else v
+
+# ── SEASON CACHE ─────────────────────────────────────────────────────────
+_tables = {}
+_lock = threading.Lock()        # bulk slate workers ask at once; build each season once
+
+def season_table(league, day, conn=None):
+    """FormTable of the season `day` falls in, rebuilt only when the warehouse has new games"""
+    conn = conn or warehouse.connect()
+    if conn is None:
+        return None
+    start = season_start(league, day).isoformat()
+    latest = conn.execute("SELECT MAX(date) AS d, COUNT(*) AS n FROM games WHERE league = ? AND date >= ?",
+                          (league['key'], start)).fetchone()
+    key = (league['key'], start)
+    with _lock:
+        cached = _tables.get(key)
+        if cached and cached[0] == tuple(latest):
+            return cached[1]
+        table = FormTable(warehouse.games(league['key'], start, conn=conn))
+        _tables[key] = (tuple(latest), table)
+        return table
+
+def team_form(league, team_id, day=None, num_games=10):
+    """A team's form as of `day` (default today: every game through yesterday) from the warehouse, or None"""
+    day = day or datetime.utcnow().date()
+    table = season_table(league, day)
+    return table.form(team_id, day, num_games) if table else None
+
+# ── CLI ──────────────────────────────────────────────────────────────────
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Rolling form features from the game-log warehouse")
+    ap.add_argument('--league', default='nba')
+    ap.add_argument('--date', type=date.fromisoformat, help="form as of this day (default today)")
+    ap.add_argument('--team', help="one team id (default every team)")
+    ap.add_argument('--db', help="warehouse file")
+    args = ap.parse_args(argv)
+    try:
+        league = parse_leagues(args.league)[0]
+    except ValueError as e:
+        ap.error(str(e))
+    day = args.date or datetime.utcnow().date()
+    conn = warehouse.connect(args.db)
+    if conn is None:
+        print(f"  ⚠ No warehouse at {args.db or warehouse.DB_FILE} — run warehouse.py ingest first")
+        return 1
+
+    t0 = time.perf_counter()
+    table = season_table(league, day, conn)
+    print(f"  📈 {league['name']}: {len(table)} team-games, {len(table.teams)} teams "
+          f"built in {(time.perf_counter() - t0) * 1000:.0f}ms — form as of {day}")
+    if args.team:
+        f = table.features(args.team, day)
+        if f is None:
+            print(f"  No games for team {args.team} before {day}")
+            return 1
+        for k, v in f.items():
+            print(f"     {k:<14} {'—' if v is None else round(v, 3)}")
+        return
+    snap = sorted(table.snapshot(day).items(), key=lambda kv: -kv[1]['ewm_diff'])
+    print(f"     {'team':<8} {'GP':>3} {'L5':>5} {'L10':>5} {'L20':>5} {'diff10':>7} {'ewm':>6} "
+          f"{'home':>5} {'away':>5} {'strk':>5} {'rest':>4}")
+    pct = lambda v: '  —  ' if v is None else f"{v:.3f}"[1:] if v < 1 else '1.000'
+    for tid, f in snap:
+        print(f"     {tid:<8} {int(f['games']):>3} {pct(f['win_pct_l5']):>5} {pct(f['win_pct_l10']):>5} "
+              f"{pct(f['win_pct_l20']):>5} {f['diff_l10']:>+7.1f} {f['ewm_diff']:>+6.1f} "
+              f"{pct(f['home_win_pct']):>5} {pct(f['away_win_pct']):>5} "
+              f"{('W' if f['won'] else 'L') + str(int(f['streak'])):>5} {f['rest_days']:>4}")
+
+if __name__ == '__main__':
+    sys.exit(main())
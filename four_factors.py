@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+four_factors.py
+Possessions, pace, offensive / defensive rating and the Four Factors on
+both sides of the ball, for every team as of any date. They are computed
+from the warehouse's per-game box totals (warehouse.py) in one vectorized
+pass. ESPN's team statistics payload rarely carries offensiveRating,
+defensiveRating or pace, so without this those inputs sat at the league
+defaults.
+
+Rates are ratios of season-to-date sums, not averages of per-game rates.
+Each box key is averaged over the games that have it. The scoreboard
+carries shooting and assists; `warehouse.py ingest --box` adds rebounds,
+turnovers, steals and blocks. With the full box a team's stats need no
+ESPN request at all.
+
+  python3 four_factors.py --league nba
+  python3 four_factors.py --league ncaab --date 2026-02-14 --team 150
+"""
+import argparse
+import sys
+import threading
+import time
+from datetime import date, datetime
+
+import numpy as np
+
+import warehouse
+from form_features import AsOfTable, group_starts, py_value
+from leagues import parse_leagues, season_start
+
+FT_WEIGHT  = 0.44     # free throws per possession-ending trip
+OT_MINUTES = 5
+
+# Each factor: (numerator keys and weights, denominator keys and weights) over
+# the team's own ('own') or its opponents' ('opp') box totals
+FACTORS = {
+    'efg':         ({('own', 'fgm'): 1, ('own', 'fg3m'): 0.5}, {('own', 'fga'): 1}),
+    'tov_pct':     ({('own', 'tov'): 1}, {('own', 'fga'): 1, ('own', 'fta'): FT_WEIGHT, ('own', 'tov'): 1}),
+    'orb_pct':     ({('own', 'orb'): 1}, {('own', 'orb'): 1, ('opp', 'drb'): 1}),
+    'ft_rate':     ({('own', 'ftm'): 1}, {('own', 'fga'): 1}),
+    'opp_efg':     ({('opp', 'fgm'): 1, ('opp', 'fg3m'): 0.5}, {('opp', 'fga'): 1}),
+    'opp_tov_pct': ({('opp', 'tov'): 1}, {('opp', 'fga'): 1, ('opp', 'fta'): FT_WEIGHT, ('opp', 'tov'): 1}),
+    'drb_pct':     ({('own', 'drb'): 1}, {('own', 'drb'): 1, ('opp', 'orb'): 1}),
+    'opp_ft_rate': ({('opp', 'ftm'): 1}, {('opp', 'fga'): 1}),
+}
+
+# ── POSSESSIONS ──────────────────────────────────────────────────────────
+def column(games, key):
+    """One warehouse column as floats, NaN where it is missing"""
+    return np.array([g.get(key) for g in games], dtype=float)       # None → NaN
+
+def game_minutes(games, league):
+    """Minutes played per game, overtime included"""
+    periods = np.nan_to_num(column(games, 'periods'), nan=league['periods'])
+    return league['minutes'] + OT_MINUTES * np.maximum(periods - league['periods'], 0)
+
+def possessions(games, league):
+    """
+    Possessions per game: FGA − ORB + TOV + 0.44·FTA averaged over both
+    teams. Rebounds and turnovers fall back to the league profile when only
+    the scoreboard box was stored, and the whole estimate falls back to the
+    league's pace (stretched for overtime) when there is no box at all.
+    """
+    per_side = []
+    for side in ('home', 'away'):
+        fga, fta, orb, tov = (column(games, f'{side}_{k}') for k in ('fga', 'fta', 'orb', 'tov'))
+        orb = np.where(np.isnan(orb), league['stats']['orb'], orb)
+        tov = np.where(np.isnan(tov), league['stats']['tov'], tov)
+        per_side.append(fga - orb + tov + FT_WEIGHT * fta)
+    poss = (per_side[0] + per_side[1]) / 2
+    fallback = league['stats']['pace'] * game_minutes(games, league) / league['minutes']
+    return np.where(np.isnan(poss) | (poss <= 0), fallback, poss)
+
+def _season_sums(M, starts):
+    """Inclusive running sums along each row of M (quantities × team-game rows), within each team's rows"""
+    cs = np.cumsum(M, axis=1)
+    before = np.where(starts > 0, cs[:, np.maximum(starts - 1, 0)], 0.0)
+    return cs - before
+
+# ── TABLE ────────────────────────────────────────────────────────────────
+class BoxTable(AsOfTable):
+    """Season-to-date efficiency, pace, box averages and Four Factors of every team after each game"""
+
+    def __init__(self, games, league):
+        self.league = league
+        n = len(games)
+        order = self._sort_rows(games)
+        if not n:
+            return
+
+        def sides(key):
+            home, away = column(games, f'home_{key}'), column(games, f'away_{key}')
+            return {'own': np.concatenate([home, away])[order], 'opp': np.concatenate([away, home])[order]}
+
+        box = {k: sides(k) for k in warehouse.BOX_KEYS}
+        score = sides('score')
+        parts = {
+            'games':   np.ones(2 * n),
+            'pts':     score['own'],
+            'opp_pts': score['opp'],
+            'poss':    np.tile(possessions(games, league), 2)[order],
+            'minutes': np.tile(game_minutes(games, league), 2)[order],
+        }
+        for k in warehouse.BOX_KEYS:
+            parts[k] = np.nan_to_num(box[k]['own'])
+            parts[f'n_{k}'] = ~np.isnan(box[k]['own'])
+        # A factor only counts games that have every one of its inputs
+        for name, (num, den) in FACTORS.items():
+            have = np.logical_and.reduce([~np.isnan(box[k][side]) for side, k in {**num, **den}])
+            for part, terms in (('num', num), ('den', den)):
+                parts[f'{name}_{part}'] = np.where(have, sum(w * np.nan_to_num(box[k][side])
+                                                             for (side, k), w in terms.items()), 0.0)
+
+        names = list(parts)
+        S = _season_sums(np.vstack([parts[k] for k in names]).astype(float), group_starts(self.team))
+        tot = dict(zip(names, S))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cols = {
+                'games':   tot['games'],
+                'ppg':     tot['pts'] / tot['games'],
+                'opp_ppg': tot['opp_pts'] / tot['games'],
+                'ortg':    100 * tot['pts'] / tot['poss'],
+                'drtg':    100 * tot['opp_pts'] / tot['poss'],
+                'pace':    tot['poss'] * league['minutes'] / tot['minutes'],
+            }
+            cols['net'] = cols['ortg'] - cols['drtg']
+            for k in warehouse.BOX_KEYS:
+                cols[k] = np.where(tot[f'n_{k}'] > 0, tot[k] / tot[f'n_{k}'], np.nan)
+            for name in FACTORS:
+                cols[name] = np.where(tot[f'{name}_den'] > 0, tot[f'{name}_num'] / tot[f'{name}_den'], np.nan)
+        cols['box_games'] = tot['n_orb']
+        self.columns = cols
+
+    def features(self, team_id, day):
+        """Every column for a team as of `day` (games before it), NaNs left out — or None"""
+        r = self.row(team_id, day)
+        if r is None:
+            return None
+        return {name: v for name, v in ((name, py_value(col[r])) for name, col in self.columns.items())
+                if v is not None}
+
+def has_full_box(stats):
+    """True if warehouse stats cover every box key predict_game reads"""
+    return bool(stats) and all(k in stats for k in warehouse.BOX_KEYS)
+
+# ── SEASON CACHE ─────────────────────────────────────────────────────────
+_tables = {}
+_lock = threading.Lock()        # bulk slate workers ask at once; build each season once
+
+def season_table(league, day, conn=None):
+    """BoxTable of the season `day` falls in, rebuilt only when the warehouse changes"""
+    conn = conn or warehouse.connect()
+    if conn is None:
+        return None
+    start = season_start(league, day).isoformat()
+    sig = tuple(conn.execute("SELECT COUNT(*), MAX(date), SUM(home_orb IS NOT NULL) FROM games "
+                             "WHERE league = ? AND date >= ?", (league['key'], start)).fetchone())
+    key = (league['key'], start)
+    with _lock:
+        cached = _tables.get(key)
+        if cached and cached[0] == sig:
+            return cached[1]
+        table = BoxTable(warehouse.games(league['key'], start, conn=conn), league)
+        _tables[key] = (sig, table)
+        return table
+
+def team_stats(league, team_id, day=None):
+    """A team's season-to-date box stats as of `day` (default today) from the warehouse, or None"""
+    day = day or datetime.utcnow().date()
+    table = season_table(league, day)
+    return table.features(team_id, day) if table else None
+
+# ── CLI ──────────────────────────────────────────────────────────────────
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Possessions, efficiency and Four Factors from the warehouse")
+    ap.add_argument('--league', default='nba')
+    ap.add_argument('--date', type=date.fromisoformat, help="stats from games before this day (default today)")
+    ap.add_argument('--team', help="one team id (default every team)")
+    ap.add_argument('--db', help="warehouse file")
+    args = ap.parse_args(argv)
+    try:
+        league = parse_leagues(args.league)[0]
+    except ValueError as e:
+        ap.error(str(e))
+    day = args.date or datetime.utcnow().date()
+    conn = warehouse.connect(args.db)
+    if conn is None:
+        print(f"  ⚠ No warehouse at {args.db or warehouse.DB_FILE} — run warehouse.py ingest first")
+        return 1
+
+    t0 = time.perf_counter()
+    table = season_table(league, day, conn)
+    print(f"  🧮 {league['name']}: {len(table)} team-games, {len(table.teams)} teams "
+          f"built in {(time.perf_counter() - t0) * 1000:.0f}ms — stats as of {day}")
+    if args.team:
+        f = table.features(args.team, day)
+        if f is None:
+            print(f"  No games for team {args.team} before {day}")
+            return 1
+        for k, v in f.items():
+            print(f"     {k:<12} {round(v, 3)}")
+        return
+    snap = sorted(table.snapshot(day).items(), key=lambda kv: -kv[1]['net'])
+    print(f"     {'team':<8} {'GP':>3} {'ORtg':>6} {'DRtg':>6} {'Net':>6} {'Pace':>5} "
+          f"{'eFG':>5} {'TOV':>5} {'ORB':>5} {'FTr':>5} {'oeFG':>5} {'oTOV':>5} {'DRB':>5} {'oFTr':>5}")
+    pct = lambda v: '  —  ' if v is None else f"{v:.3f}"[1:] if v < 1 else f"{v:.2f}"
+    for tid, f in snap:
+        factors = ' '.join(f"{pct(f.get(name)):>5}" for name in FACTORS)
+        print(f"     {tid:<8} {int(f['games']):>3} {f['ortg']:>6.1f} {f['drtg']:>6.1f} {f['net']:>+6.1f} "
+              f"{f['pace']:>5.1f} {factors}")
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Import-time breakdown for a module's cold start.
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter
+and summarises the log: total, slowest packages (cumulative) and slowest
+single modules (self). Modules a bare interpreter already imports at
+startup (site, encodings, certifi's .pth hook, ...) are left out, so the
+numbers are the module's own imports only. Heavy dependencies should not show up here — they
+are imported on the code paths that use them.
+
+  python3 import_profile.py nba_predictor
+  python3 import_profile.py football_beast --path football_beast
+  python3 nba_predictor.py --import-profile
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+TOP = 15
+
+def import_times(module, path=None):
+    """→ list of (self_us, cumulative_us, depth, name) in import order"""
+    env = dict(os.environ)
+    if path:
+        env['PYTHONPATH'] = os.pathsep.join(filter(None, [path, env.get('PYTHONPATH')]))
+    code = f'import {module}' if module else 'pass'
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                          capture_output=True, text=True, env=env, cwd=path or None)
+    if proc.returncode:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else 'import failed')
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cum_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((int(self_us), int(cum_us), depth, name.strip()))
+    return rows
+
+def bare_startup(runs=3):
+    """Best-of-N wall time of an interpreter that imports nothing (seconds)"""
+    best = float('inf')
+    for _ in range(runs):
+        t = time.perf_counter()
+        subprocess.run([sys.executable, '-c', 'pass'], check=True)
+        best = min(best, time.perf_counter() - t)
+    return best
+
+def cold_start(module, path=None, runs=3):
+    env = dict(os.environ)
+    if path:
+        env['PYTHONPATH'] = os.pathsep.join(filter(None, [path, env.get('PYTHONPATH')]))
+    best = float('inf')
+    for _ in range(runs):
+        t = time.perf_counter()
+        subprocess.run([sys.executable, '-c', f'import {module}'], check=True, env=env, cwd=path or None)
+        best = min(best, time.perf_counter() - t)
+    return best
+
+def print_profile(module, path=None, top=TOP):
+    startup = {r[3] for r in import_times(None, path)}
+    rows = [r for r in import_times(module, path) if r[3] not in startup]
+    total = sum(r[1] for r in rows if r[2] == 0)
+    top_level = [r for r in rows if r[2] == 1]         # imported directly by the module
+    print()
+    print("=" * 70)
+    print(f"  ⏱  IMPORT PROFILE — import {module}")
+    print("=" * 70)
+    print(f"  cold start {cold_start(module, path)*1000:7.1f} ms   "
+          f"(bare interpreter {bare_startup()*1000:.1f} ms)")
+    print(f"  imports    {total/1000:7.1f} ms across {len(rows)} modules")
+    print()
+    print(f"  {'SLOWEST PACKAGES (cumulative)':<44} {'ms':>8}")
+    for self_us, cum_us, _, name in sorted(top_level, key=lambda r: -r[1])[:top]:
+        print(f"  {name:<44} {cum_us/1000:8.1f}")
+    print()
+    print(f"  {'SLOWEST MODULES (self)':<44} {'ms':>8}")
+    for self_us, cum_us, _, name in sorted(rows, key=lambda r: -r[0])[:top]:
+        print(f"  {name:<44} {self_us/1000:8.1f}")
+    print("=" * 70)
+    print()
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Import-time breakdown for a module's cold start")
+    ap.add_argument('module')
+    ap.add_argument('--path', help="directory to import from (added to PYTHONPATH)")
+    ap.add_argument('--top', type=int, default=TOP)
+    args = ap.parse_args(argv)
+    print_profile(args.module, args.path, args.top)
+
+if __name__ == '__main__':
+    main()
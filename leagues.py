@@ -0,0 +1,115 @@
+"""
+leagues.py
+League profiles for the basketball engine (nba_predictor.py --league).
+Everything that differs between the NBA, WNBA and college game lives
+here: ESPN / Odds API paths, game length, the model's Pythagorean
+exponent and home-court value, default team stats for a failed lookup,
+the fallback betting lines, which log the predictions go to and the
+finals cache update_results.py settles them from.
+
+`elo` is elo_ratings.py's K factor, home-court value in rating points and
+the share of a rating carried into the next season.
+
+`season` is the (month, day) the regular season starts and the month
+the playoffs end, for warehouse.py's season backfill.
+
+`workers` > 1 puts a league in bulk slate mode (bulk_slate.py): college
+Saturdays are 150+ games, too many to fetch one game at a time.
+"""
+from oracle_http import ESPN_BASE_URL
+
+def _default_stats(ppg, pace, ortg):
+    """NBA-shaped season averages scaled to a league's pace and efficiency"""
+    k = pace / 98.0
+    box = {'fgm': 40.0, 'fga': 88.0, 'fg3m': 12.0, 'fg3a': 34.0, 'ftm': 18.0, 'fta': 23.0,
+           'orb': 10.0, 'drb': 33.0, 'ast': 25.0, 'tov': 13.0, 'stl': 7.0, 'blk': 5.0}
+    return {'ppg': ppg, 'opp_ppg': ppg,
+            **{key: round(v * k, 1) for key, v in box.items()},
+            'ortg': ortg, 'drtg': ortg, 'pace': pace}
+
+def _profile(key, name, espn, odds, **kw):
+    return {'key': key, 'name': name, 'espn': espn, 'odds': odds,
+            'url': f"{ESPN_BASE_URL}/apis/site/v2/sports/{espn}", **kw}
+
+LEAGUES = {
+    'nba': _profile(
+        'nba', 'NBA', 'basketball/nba', 'basketball_nba',
+        periods=4, minutes=48, season=((10, 20), 6),
+        pyth_exp=13.91,          # Daryl Morey's NBA exponent
+        home_adv=0.045,          # ~3.2 pts ≈ 4.5% win prob
+        ou_line=224.5, fh_line=107.0,
+        stats={
+            'ppg': 110.0, 'opp_ppg': 110.0,
+            'fgm': 40.0, 'fga': 88.0,
+            'fg3m': 12.0, 'fg3a': 34.0,
+            'ftm': 18.0, 'fta': 23.0,
+            'orb': 10.0, 'drb': 33.0,
+            'ast': 25.0, 'tov': 13.0,
+            'stl': 7.0,  'blk': 5.0,
+            'ortg': 112.0, 'drtg': 112.0,
+            'pace': 98.0,
+        },
+        elo={'k': 20, 'home': 100, 'carry': 0.75},
+        log='nba_predictions_log.json', meta='nba_predictions_meta.json',
+        finals='nba_finals_cache.json',
+        workers=1,
+    ),
+    'wnba': _profile(
+        'wnba', 'WNBA', 'basketball/wnba', 'basketball_wnba',
+        periods=4, minutes=40, season=((5, 14), 10),
+        pyth_exp=10.0,
+        home_adv=0.040,
+        ou_line=163.5, fh_line=81.0,
+        stats=_default_stats(ppg=82.0, pace=80.0, ortg=102.0),
+        elo={'k': 20, 'home': 90, 'carry': 0.75},
+        log='wnba_predictions_log.json', meta='wnba_predictions_meta.json',
+        finals='wnba_finals_cache.json',
+        workers=1,
+    ),
+    'ncaab': _profile(
+        'ncaab', 'NCAA Men', 'basketball/mens-college-basketball', 'basketball_ncaab',
+        periods=2, minutes=40, season=((11, 1), 4),
+        pyth_exp=11.5,           # KenPom's college exponent
+        home_adv=0.060,          # ~3.5 pts, and a bigger share of a lower-scoring game
+        ou_line=141.5, fh_line=66.5,
+        stats=_default_stats(ppg=72.0, pace=68.0, ortg=105.0),
+        elo={'k': 30, 'home': 90, 'carry': 0.60},     # more roster turnover
+        log='ncaa_predictions_log.json', meta='ncaa_predictions_meta.json',
+        finals='ncaa_finals_cache.json',
+        workers=16, scoreboard_query='groups=50&limit=500',      # every D-I game, not just the featured ones
+    ),
+    'ncaaw': _profile(
+        'ncaaw', 'NCAA Women', 'basketball/womens-college-basketball', 'basketball_wncaab',
+        periods=4, minutes=40, season=((11, 1), 4),
+        pyth_exp=10.0,
+        home_adv=0.055,
+        ou_line=132.5, fh_line=64.5,
+        stats=_default_stats(ppg=67.0, pace=70.0, ortg=96.0),
+        elo={'k': 30, 'home': 80, 'carry': 0.60},
+        log='ncaaw_predictions_log.json', meta='ncaaw_predictions_meta.json',
+        finals='ncaaw_finals_cache.json',
+        workers=16, scoreboard_query='groups=50&limit=500',
+    ),
+}
+
+NBA = LEAGUES['nba']
+
+def scoreboard_url(league, date_str=None):
+    """A league's scoreboard — today, or YYYYMMDD"""
+    query = '&'.join(q for q in (league.get('scoreboard_query'), date_str and f"dates={date_str}") if q)
+    return f"{league['url']}/scoreboard" + (f"?{query}" if query else "")
+
+def season_start(league, day):
+    """First day of the season `day` falls in (or of the last one, in the off-season)"""
+    (month, dom), _ = league['season']
+    start = day.replace(month=month, day=dom)
+    return start if day >= start else start.replace(year=day.year - 1)
+
+def parse_leagues(text):
+    """'nba,ncaab' / 'all' → [profile, ...] in the order given"""
+    keys = list(LEAGUES) if text.strip().lower() == 'all' else \
+        [k.strip().lower() for k in text.split(',') if k.strip()]
+    unknown = [k for k in keys if k not in LEAGUES]
+    if unknown or not keys:
+        raise ValueError(f"unknown league {', '.join(unknown) or text!r} (choose from {', '.join(LEAGUES)} or all)")
+    return [LEAGUES[k] for k in dict.fromkeys(keys)]
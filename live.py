@@ -0,0 +1,208 @@
+"""
+live.py
+In-game mode for nba_predictor.py (--live).
+One poller covers the whole slate: a single conditional scoreboard request
+per cycle, whatever the number of live games. Each in-progress game starts
+from its pregame predict_game output and is updated from score, period and
+clock only when those change. The poll interval backs off while nothing
+changes and tightens near the end of close games.
+"""
+import time
+from datetime import datetime
+from statistics import NormalDist
+
+from oracle_http import conditional_get
+
+# ── CONFIG ───────────────────────────────────────────────────────────────
+PERIODS        = 4
+PERIOD_SECS    = 12 * 60
+OT_SECS        = 5 * 60
+MARGIN_SD      = 12.0      # full-game final margin st.dev (NBA)
+
+POLL_BASE      = 30        # seconds, games live and moving
+POLL_FAST      = 10        # crunch time in a close game
+POLL_MAX       = 180       # ceiling while nothing changes
+POLL_IDLE      = 300       # no game live yet
+BACKOFF        = 1.5
+CLOSE_MARGIN   = 8
+CLOSE_SECS     = 5 * 60
+
+_NORM = NormalDist()
+
+# ── GAME CLOCK ───────────────────────────────────────────────────────────
+def parse_clock(clock):
+    """'5:32' / '45.2' → seconds left in the period"""
+    try:
+        if ':' in clock:
+            m, s = clock.split(':')
+            return int(m) * 60 + float(s)
+        return float(clock)
+    except (TypeError, ValueError):
+        return 0.0
+
+def seconds_left(period, clock):
+    """Regulation seconds remaining (0 once in overtime)"""
+    left = parse_clock(clock)
+    if period > PERIODS:
+        return left
+    return (PERIODS - period) * PERIOD_SECS + left
+
+def elapsed_secs(period, clock):
+    if period > PERIODS:
+        return PERIODS * PERIOD_SECS + (period - PERIODS - 1) * OT_SECS + (OT_SECS - parse_clock(clock))
+    return (period - 1) * PERIOD_SECS + (PERIOD_SECS - parse_clock(clock))
+
+# ── IN-GAME MODEL ────────────────────────────────────────────────────────
+def pregame_state(prediction):
+    """The bits of predict_game output the live model starts from"""
+    wp = min(max(prediction['wp'], 0.01), 0.99)
+    return {
+        'pre_wp': prediction['wp'],
+        'pre_total': prediction['est_total'],
+        'pre_margin': MARGIN_SD * _NORM.inv_cdf(wp),   # expected home margin
+    }
+
+def live_update(state, home_score, away_score, period, clock):
+    """
+    Update one game's win probability and projected total in place.
+    Remaining margin ~ Normal(pre_margin * r, MARGIN_SD * sqrt(r)) where r is
+    the fraction of regulation left; the scoring rate blends the pregame
+    total with the observed pace, weighted by time played.
+    """
+    game_secs = PERIODS * PERIOD_SECS
+    left = seconds_left(period, clock)
+    r = left / game_secs
+    lead = home_score - away_score
+
+    if period > PERIODS:
+        # Overtime: treat the OT period as a tiny remaining slice of a game
+        r = max(left, 1.0) / game_secs
+    if r <= 0:
+        wp = 1.0 if lead > 0 else 0.0 if lead < 0 else 0.5
+    else:
+        wp = _NORM.cdf((lead + state['pre_margin'] * r) / (MARGIN_SD * r ** 0.5))
+
+    played = max(elapsed_secs(period, clock), 1.0)
+    now_total = home_score + away_score
+    pre_rate = state['pre_total'] / game_secs
+    obs_rate = now_total / played
+    w = min(played / game_secs, 1.0)
+    rate = (1 - w) * pre_rate + w * obs_rate
+    state.update({
+        'home_score': home_score, 'away_score': away_score,
+        'period': period, 'clock': clock,
+        'wp': wp,
+        'proj_total': now_total + rate * left,
+    })
+    return state
+
+def is_crunch_time(state):
+    return (state.get('period', 0) >= PERIODS
+            and seconds_left(state['period'], state['clock']) <= CLOSE_SECS
+            and abs(state['home_score'] - state['away_score']) <= CLOSE_MARGIN)
+
+# ── POLLER ───────────────────────────────────────────────────────────────
+class LivePoller:
+    """
+    Polls one scoreboard URL for every live game on the slate.
+    pregame(event) must return that game's predict_game output (it is only
+    called the first time a game is seen live).
+    """
+
+    def __init__(self, url, pregame):
+        self.url = url
+        self.pregame = pregame
+        self.validators = {}
+        self.games = {}          # event id → live state
+        self.last_seen = {}      # event id → (score, period, clock)
+        self.finished = set()    # final before we ever saw it live
+        self.interval = POLL_BASE
+        self.requests = 0
+
+    def poll(self):
+        """One cycle → list of event ids whose state changed"""
+        status, data, self.validators = conditional_get(self.url, self.validators)
+        self.requests += 1
+        if status != 200 or not data:
+            return []
+        changed = []
+        for ev in data.get('events', []):
+            st = ev.get('status', {})
+            state = st.get('type', {}).get('state')
+            if state not in ('in', 'post'):
+                continue
+            eid = ev.get('id')
+            comp = ev['competitions'][0]
+            home_c, away_c = comp['competitors'][0], comp['competitors'][1]
+            hs = int(float(home_c.get('score') or 0))
+            as_ = int(float(away_c.get('score') or 0))
+            period = int(st.get('period') or 1)
+            clock = st.get('displayClock', '12:00')
+            if state == 'post':
+                clock, period = '0:00', max(period, PERIODS)
+            key = (hs, as_, period, clock)
+            if self.last_seen.get(eid) == key:
+                continue
+            if eid not in self.games:
+                if state == 'post':
+                    self.finished.add(eid)   # settlement handles it
+                    continue
+                try:
+                    g = pregame_state(self.pregame(ev))
+                except Exception as e:
+                    print(f"  ⚠️  No pregame prediction for event {eid}: {e}")
+                    continue
+                g['home'] = home_c['team']['displayName']
+                g['away'] = away_c['team']['displayName']
+                self.games[eid] = g
+            live_update(self.games[eid], hs, as_, period, clock)
+            self.games[eid]['final'] = state == 'post'
+            self.last_seen[eid] = key
+            changed.append(eid)
+        return changed
+
+    def next_interval(self, changed):
+        live = [g for g in self.games.values() if not g.get('final')]
+        if not live:
+            return POLL_IDLE
+        if any(is_crunch_time(g) for g in live):
+            self.interval = POLL_FAST
+        elif changed:
+            self.interval = POLL_BASE
+        else:
+            self.interval = min(self.interval * BACKOFF, POLL_MAX)
+        return self.interval
+
+    def done(self, slate_ids):
+        return bool(slate_ids) and all(i in self.finished or self.games.get(i, {}).get('final')
+                                       for i in slate_ids)
+
+# ── DISPLAY ──────────────────────────────────────────────────────────────
+def print_board(games, changed):
+    print()
+    print(f"  🔴 LIVE — {datetime.now().strftime('%H:%M:%S')}")
+    print("  " + "─" * 66)
+    for eid, g in games.items():
+        mark = '•' if eid in changed else ' '
+        per = 'F' if g.get('final') else (f"Q{g['period']}" if g['period'] <= PERIODS else f"OT{g['period']-PERIODS}")
+        clock = '' if g.get('final') else g['clock']
+        print(f"  {mark} {g['away'][:14]:<14} {g['away_score']:>3} @ {g['home'][:14]:<14} {g['home_score']:>3}  "
+              f"{per:<3} {clock:>5}  home {g['wp']*100:5.1f}% (pre {g['pre_wp']*100:4.1f}%)  "
+              f"proj {g['proj_total']:.0f} (pre {g['pre_total']:.0f})")
+
+def run_live(url, pregame, slate_ids=None, sleep=time.sleep):
+    """Poll until every game on the slate is final (Ctrl-C to stop)"""
+    poller = LivePoller(url, pregame)
+    print(f"  📡 Live mode — polling {url}")
+    try:
+        while True:
+            changed = poller.poll()
+            if changed:
+                print_board(poller.games, changed)
+            if poller.done(slate_ids or list(poller.games)):
+                print(f"\n  ✅ All games final — {poller.requests} scoreboard requests")
+                return poller
+            sleep(poller.next_interval(changed))
+    except KeyboardInterrupt:
+        print(f"\n  ⏹  Stopped — {poller.requests} scoreboard requests")
+    return poller
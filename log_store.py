@@ -0,0 +1,167 @@
+"""
+log_store.py
+Canonical reader/writer for nba_predictions_log.json and the dashboard export.
+Every writer goes through here so the files come out byte-identical for the
+same data: fixed key order, newest date first, stable game order within a
+day and rounded floats. Run timestamps live in small *_meta.json files so a
+re-run only touches the lines of the games that actually changed.
+"""
+import json
+import os
+
+LOG_FILE  = 'nba_predictions_log.json'
+META_FILE = 'nba_predictions_meta.json'
+
+# ── KEY ORDER ───────────────────────────────────────────────────────────
+# Keys are ordered by the list for their parent key; unknown keys follow
+# alphabetically so new fields never reshuffle the known ones.
+ENTRY_KEYS = ['date', 'predictions', 'result']
+PREDICTION_KEYS = [
+    'matchup', 'pick', 'conf', 'confidence',
+    'ou', 'ou_pick', 'ou_line', 'total', 'est_total', 'estimated',
+    'fh_ou', 'fh_line', 'god', 'tipoff', 'day', 'edge', 'strong_ou',
+    'line_source', 'ml_odds', 'ou_odds', 'flags', 'result', 'actual_away', 'actual_home', 'actual_total',
+]
+RESULT_KEYS  = ['hits', 'total', 'pct']
+STATS_KEYS   = ['total_hits', 'total_picks', 'accuracy', 'best_day', 'best_pct', 'days_tracked']
+HISTORY_KEYS = ['date', 'result', 'total', 'ci']
+EXPORT_KEYS  = ['stats', 'nba_today', 'ncaa_today', 'nba_history', 'intervals']
+CI_KEYS      = ['estimate', 'pct', 'lo', 'hi', 'n']
+
+KEY_ORDER = {
+    None:          ENTRY_KEYS + EXPORT_KEYS,
+    'predictions': PREDICTION_KEYS,
+    'result':      RESULT_KEYS,
+    'stats':       STATS_KEYS,
+    'nba_today':   ENTRY_KEYS,
+    'ncaa_today':  ENTRY_KEYS,
+    'nba_history': HISTORY_KEYS,
+    'intervals':   ['accuracy', 'ml_hit_rate', 'ou_hit_rate', 'ml_roi', 'ou_roi', 'brier'],
+    'ci':          CI_KEYS,
+    'accuracy':    CI_KEYS,
+    'ml_hit_rate': CI_KEYS,
+    'ou_hit_rate': CI_KEYS,
+    'ml_roi':      CI_KEYS,
+    'ou_roi':      CI_KEYS,
+    'brier':       CI_KEYS,
+}
+
+# Decimal places per key (default FLOAT_DIGITS_DEFAULT)
+FLOAT_DIGITS = {
+    'conf': 4, 'wp': 4,
+    'total': 1, 'est_total': 1, 'estimated': 1, 'ou_line': 1, 'fh_line': 1,
+    'edge': 1, 'confidence': 1, 'pct': 1, 'accuracy': 1, 'best_pct': 1,
+    'lo': 1, 'hi': 1, 'estimate': 4,
+}
+FLOAT_DIGITS_DEFAULT = 3
+
+# Every float under these keys, whatever its own name: the Brier interval's
+# lo / hi are scores near 0.2, not percentages
+FLOAT_DIGITS_WITHIN = {'brier': 4}
+
+# Fields that change on every run — never written into the data files
+VOLATILE_KEYS = ('last_updated', 'saved_at', 'updated')
+
+# ── CANONICAL FORM ──────────────────────────────────────────────────────
+def _round(key, value, digits=None):
+    value = round(value, digits if digits is not None else FLOAT_DIGITS.get(key, FLOAT_DIGITS_DEFAULT))
+    return 0.0 if value == 0 else value   # no "-0.0"
+
+def canonical(obj, key=None, digits=None):
+    """Return a copy of obj with ordered keys, rounded floats and no volatile fields"""
+    digits = FLOAT_DIGITS_WITHIN.get(key, digits)
+    if isinstance(obj, dict):
+        order = KEY_ORDER.get(key, [])
+        rank  = {k: i for i, k in enumerate(order)}
+        keys  = sorted((k for k in obj if k not in VOLATILE_KEYS),
+                       key=lambda k: (rank.get(k, len(order)), str(k)))
+        return {k: canonical(obj[k], k, digits) for k in keys}
+    if isinstance(obj, (list, tuple)):
+        return [canonical(v, key, digits) for v in obj]
+    if isinstance(obj, float):
+        return _round(key, obj, digits)
+    return obj
+
+def dumps(obj):
+    return json.dumps(canonical(obj), indent=2, default=str) + '\n'
+
+def write_json(path, obj):
+    """Write obj canonically; skips the write when nothing changed. Returns True if written."""
+    text = dumps(obj)
+    try:
+        with open(path) as f:
+            if f.read() == text:
+                return False
+    except OSError:
+        pass
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        f.write(text)
+    os.replace(tmp, path)
+    return True
+
+# ── LOG ─────────────────────────────────────────────────────────────────
+def load_log(path=LOG_FILE):
+    """
+    Load a predictions log as a list of day entries ([] if there is no file
+    yet). A corrupt log raises ValueError rather than reading as empty, so
+    the next save can't overwrite it with [].
+    """
+    try:
+        with open(path) as f:
+            raw = json.load(f)
+    except FileNotFoundError:
+        return []
+    return raw if isinstance(raw, list) else raw.get('entries', [])
+
+def sort_log(log):
+    """Newest date first; entries with the same date keep their order"""
+    return sorted(log, key=lambda e: e.get('date', ''), reverse=True)
+
+def save_log(log, path=LOG_FILE):
+    return write_json(path, sort_log(log))
+
+# Describe the run that wrote a prediction — dropped when a re-run doesn't set them
+RUN_KEYS = ('flags',)
+
+def merge_predictions(old, new):
+    """
+    Merge a fresh run into an existing day without reordering it.
+    Known matchups keep their slot (and any settled result), new ones are
+    appended, and games missing from the new run (already tipped) are kept.
+    """
+    fresh = {p.get('matchup'): p for p in new}
+    merged = []
+    for p in old:
+        m = p.get('matchup')
+        if m in fresh:
+            upd = {k: v for k, v in p.items() if k not in RUN_KEYS}
+            upd.update(fresh.pop(m))
+            if p.get('result') not in (None, 'pending'):
+                for k in ('result', 'actual_away', 'actual_home', 'actual_total'):
+                    if k in p:
+                        upd[k] = p[k]
+            merged.append(upd)
+        else:
+            merged.append(p)
+    merged.extend(p for p in new if p.get('matchup') in fresh)
+    return merged
+
+# ── META ────────────────────────────────────────────────────────────────
+def write_meta(path=META_FILE, **fields):
+    """Record run metadata (timestamps etc.) next to the data file"""
+    try:
+        with open(path) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        meta = {}
+    meta.update(fields)
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(meta, f, indent=2, sort_keys=True)
+        f.write('\n')
@@ -10,63 +10,108 @@ Upgraded with NBA-specific factors:
   - Four Factors model
   - Recent form (last 10 games)
   - Vegas odds comparison (optional)
+
+League-parameterized (leagues.py): `--league nba,ncaab,ncaaw,wnba` runs
+several leagues in one process — one HTTP pool, cache and rate limiter —
+with every league's slate fetched concurrently.
 """
 
-import requests
+import argparse
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import math
+import re
 import sys
 
+from leagues import LEAGUES, NBA, parse_leagues, scoreboard_url
+from log_store import load_log, save_log, merge_predictions, write_meta
+import oracle_http
+from oracle_http import ODDS_BASE_URL, cached_get, safe_get
+import oracle_metrics
+import oracle_profile
+import elo_ratings
+import warehouse
+
 # ── CONFIG ──────────────────────────────────────────────────────────────
-ODDS_API_KEY = ""  # Optional: paste your key from the-odds-api.com
-NBA_LEAGUE   = "basketball_nba"
+ODDS_API_KEY = os.environ.get("ODDS_API_KEY", "")  # Optional: key from the-odds-api.com
+NBA_LEAGUE   = NBA['odds']
 SHOW_BOTH_DAYS = True  # Show today + tomorrow fixtures
+SCOREBOARD_URL = f"{NBA['url']}/scoreboard"
 
 # ── HELPERS ─────────────────────────────────────────────────────────────
 def sigmoid(x):
     return 1 / (1 + math.exp(-x))
 
-def pythagorean_wp(ppg, opp_ppg, exp=13.91):
-    """NBA Pythagorean Win Expectation — proven formula used by front offices"""
+def pythagorean_wp(ppg, opp_ppg, exp=NBA['pyth_exp']):
+    """Pythagorean Win Expectation — proven formula used by front offices"""
     if opp_ppg == 0:
         return 0.5
     return (ppg ** exp) / (ppg ** exp + opp_ppg ** exp)
 
-def safe_get(url, timeout=10):
-    try:
-        r = requests.get(url, timeout=timeout)
-        r.raise_for_status()
-        return r.json()
-    except Exception as e:
-        return None
-
 # ── ESPN API ─────────────────────────────────────────────────────────────
-def get_scoreboard(date_str=None):
-    """Get NBA scoreboard — today or specific date (YYYYMMDD)"""
-    if date_str:
-        url = f"https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard?dates={date_str}"
-    else:
-        url = "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard"
-    return safe_get(url)
-
-def get_team_stats(team_id):
-    """Get full season stats for a team"""
-    url = f"https://site.api.espn.com/apis/site/v2/sports/basketball/nba/teams/{team_id}/statistics"
-    data = safe_get(url)
-    stats = {
-        'ppg': 110.0, 'opp_ppg': 110.0,
-        'fgm': 40.0, 'fga': 88.0,
-        'fg3m': 12.0, 'fg3a': 34.0,
-        'ftm': 18.0, 'fta': 23.0,
-        'orb': 10.0, 'drb': 33.0,
-        'ast': 25.0, 'tov': 13.0,
-        'stl': 7.0,  'blk': 5.0,
-        'ortg': 112.0, 'drtg': 112.0,
-        'pace': 98.0
-    }
+def tag_source(obj, meta, kind):
+    """Mark fetched inputs with where they came from ('live' / 'stale' + age_h)"""
+    obj['source'] = meta['source']
+    if meta['source'] == 'stale':
+        obj['age_h'] = round(meta['age_s'] / 3600, 1)
+        oracle_metrics.inc('oracle_team_stale', kind=kind)
+    return obj
+
+def score_value(score):
+    """Competitor score — a string on the scoreboard, {'value', 'displayValue'} on team schedules"""
+    if isinstance(score, dict):
+        score = score.get('value')
+    return float(score or 0)
+
+def get_scoreboard(date_str=None, priority='critical', league=NBA):
+    """Get a league's scoreboard — today or specific date (YYYYMMDD)"""
+    return safe_get(scoreboard_url(league, date_str), priority=priority)
+
+def get_team_stats(team_id, league=NBA, priority='normal'):
+    """
+    Season stats for a team. When the warehouse is current, they come from
+    its box scores (four_factors) and ESPN is only asked for what the stored
+    box lacks. Then ortg / drtg / pace are opponent-adjusted where the
+    warehouse can rate the team.
+    """
+    box = None
+    if warehouse.covers(league, yesterday()):
+        from four_factors import has_full_box, team_stats   # numpy, like form_features
+        box = team_stats(league, team_id)
+        if has_full_box(box):
+            return adjust_stats(dict(league['stats'], **box, source='warehouse'), team_id, league)
+    stats = espn_team_stats(team_id, league, priority)
+    if box:
+        stats.update(box)               # real ortg / drtg / pace and the scoreboard's shooting at least
+    return adjust_stats(stats, team_id, league)
+
+def adjust_stats(stats, team_id, league=NBA):
+    """
+    Swap raw ortg / drtg / pace for adjusted_efficiency's schedule-adjusted
+    ratings when the warehouse is current through yesterday (raw values kept as raw_*)
+    """
+    if not warehouse.covers(league, yesterday()):
+        return stats
+    from adjusted_efficiency import team_rating     # numpy, like form_features
+    rating = team_rating(league, team_id)
+    if not rating:
+        return stats
+    return dict(stats, ortg=rating['ortg'], drtg=rating['drtg'], pace=rating['pace'],
+                raw_ortg=stats['ortg'], raw_drtg=stats['drtg'], raw_pace=stats['pace'],
+                ratings='adjusted')
+
+def espn_team_stats(team_id, league=NBA, priority='normal'):
+    """Get full season stats for a team (league defaults when the lookup fails)"""
+    url = f"{league['url']}/teams/{team_id}/statistics"
+    data, meta = cached_get(url, priority=priority)
+    stats = dict(league['stats'], source='default')
+    oracle_metrics.inc('oracle_team_fetches', kind='stats')
     if not data:
+        oracle_metrics.inc('oracle_team_defaults', kind='stats')
         return stats
+    found = False
     try:
         mapping = {
             'avgPoints': 'ppg',
@@ -95,88 +140,122 @@ def get_team_stats(team_id):
                     val = float(s.get('value', 0) or 0)
                     if val > 0:
                         stats[key] = val
+                        found = True
     except:
         pass
-    return stats
+    if not found:
+        oracle_metrics.inc('oracle_team_defaults', kind='stats')
+        return stats
+    return tag_source(stats, meta, 'stats')
 
-def get_recent_form(team_id, num_games=10):
-    """Get last N games form — wins, avg pts scored/allowed, streak"""
-    url = f"https://site.api.espn.com/apis/site/v2/sports/basketball/nba/teams/{team_id}/schedule"
-    data = safe_get(url)
+def form_from_games(games, num_games=10):
+    """Form over a team's last N games — games are (won, pts, opp_pts), oldest first; None if empty"""
+    recent = games[-num_games:]
+    if not recent:
+        return None
+    count = len(recent)
+    wins = sum(1 for won, _, _ in recent if won)
+    streak_type = 'W' if recent[-1][0] else 'L'
+    streak = 0
+    for won, _, _ in reversed(recent):
+        if ('W' if won else 'L') != streak_type:
+            break
+        streak += 1
+    return {
+        'wins': wins, 'losses': count - wins,
+        'avg_pts': sum(p for _, p, _ in recent) / count,
+        'avg_opp': sum(o for _, _, o in recent) / count,
+        'form_score': (wins / count - 0.5) * 2,   # -1 to +1
+        'streak': streak, 'streak_type': streak_type,
+    }
+
+def yesterday():
+    return (datetime.utcnow() - timedelta(days=1)).date()
+
+def get_recent_form(team_id, num_games=10, league=NBA, priority='normal'):
+    """
+    Get last N games form — wins, avg pts scored/allowed, streak. Read from
+    the warehouse's rolling form table (with the L5/L20, EWMA and home/away
+    features alongside) when it is current through yesterday, else from ESPN.
+    """
+    oracle_metrics.inc('oracle_team_fetches', kind='form')
+    if warehouse.covers(league, yesterday()):
+        from form_features import team_form         # numpy: only load it once the warehouse is in play
+        form = team_form(league, team_id, num_games=num_games)
+        if form:
+            return dict(form, source='warehouse')
+
+    url = f"{league['url']}/teams/{team_id}/schedule"
+    data, meta = cached_get(url, priority=priority)
     result = {
         'wins': 5, 'losses': 5,
-        'avg_pts': 110.0, 'avg_opp': 110.0,
+        'avg_pts': league['stats']['ppg'], 'avg_opp': league['stats']['ppg'],
         'form_score': 0.0,
-        'streak': 0, 'streak_type': 'W'
+        'streak': 0, 'streak_type': 'W',
+        'source': 'default'
     }
     if not data:
+        oracle_metrics.inc('oracle_team_defaults', kind='form')
         return result
+    form = None
     try:
-        events = data.get('events', [])
-        completed = [e for e in events
-                     if e.get('competitions', [{}])[0].get('status', {}).get('type', {}).get('completed')]
-        recent = completed[-num_games:]
-        wins = 0; pts = 0; opp = 0; count = 0
-        streak = 0; streak_type = None
-        for ev in recent:
+        games = []
+        for ev in data.get('events', []):
             comp = ev['competitions'][0]
+            if not comp.get('status', {}).get('type', {}).get('completed'):
+                continue
             me   = next((c for c in comp['competitors'] if c['team']['id'] == str(team_id)), None)
             them = next((c for c in comp['competitors'] if c['team']['id'] != str(team_id)), None)
             if me and them:
-                tp = float(me.get('score') or 0)
-                op = float(them.get('score') or 0)
-                win = me.get('winner', False)
-                if win: wins += 1
-                pts += tp; opp += op; count += 1
-                if streak_type is None:
-                    streak_type = 'W' if win else 'L'
-                if (win and streak_type == 'W') or (not win and streak_type == 'L'):
-                    streak += 1
-                else:
-                    break
-        if count > 0:
-            result['wins']       = wins
-            result['losses']     = count - wins
-            result['avg_pts']    = pts / count
-            result['avg_opp']    = opp / count
-            result['form_score'] = (wins / count - 0.5) * 2   # -1 to +1
-            result['streak']     = streak
-            result['streak_type']= streak_type or 'W'
+                games.append((me.get('winner', False), score_value(me.get('score')), score_value(them.get('score'))))
+        form = form_from_games(games, num_games)
     except:
         pass
-    return result
+    if not form:
+        oracle_metrics.inc('oracle_team_defaults', kind='form')
+        return result
+    return tag_source(dict(result, **form), meta, 'form')
 
-def get_team_record(team_id):
+def get_team_record(team_id, league=NBA):
     """Get current season W-L record"""
-    url = f"https://site.api.espn.com/apis/site/v2/sports/basketball/nba/teams/{team_id}"
-    data = safe_get(url)
+    url = f"{league['url']}/teams/{team_id}"
+    data, _ = cached_get(url, priority='low')
     try:
         return data['team']['record']['items'][0]['summary']
     except:
         return '?-?'
 
-def detect_b2b(all_events, team_id):
-    """Check if team played yesterday (back-to-back)"""
-    yesterday = (datetime.utcnow() - timedelta(days=1)).strftime('%Y-%m-%d')
+def game_day(event):
+    """US calendar day a game is played on — its UTC tipoff pulled back six hours"""
+    try:
+        return (datetime.strptime(event['date'], '%Y-%m-%dT%H:%MZ') - timedelta(hours=6)).date()
+    except (KeyError, ValueError):
+        return datetime.utcnow().date()
+
+def detect_b2b(all_events, team_id, league=NBA, day=None):
+    """
+    Check if team also played the day before `day` (default today) — a
+    back-to-back. From the warehouse if it has that day, else the fetched slate.
+    """
+    prev = (day or datetime.utcnow().date()) - timedelta(days=1)
+    if warehouse.covers(league, prev):
+        return warehouse.played_on(league['key'], team_id, prev)
     for ev in all_events:
-        date = ev.get('date', '')[:10]
-        if date != yesterday:
+        if game_day(ev) != prev:
             continue
         comp = ev.get('competitions', [{}])[0]
         for c in comp.get('competitors', []):
             if c.get('team', {}).get('id') == str(team_id):
-                status = comp.get('status', {}).get('type', {}).get('completed', False)
-                if status:
-                    return True
+                return True
     return False
 
 # ── VEGAS ODDS ────────────────────────────────────────────────────────────
-def get_vegas_odds():
+def get_vegas_odds(league=NBA):
     if not ODDS_API_KEY:
         return {}
-    url = (f"https://api.the-odds-api.com/v4/sports/{NBA_LEAGUE}/odds/"
+    url = (f"{ODDS_BASE_URL}/v4/sports/{league['odds']}/odds/"
            f"?apiKey={ODDS_API_KEY}&regions=us&markets=h2h,totals&oddsFormat=american")
-    data = safe_get(url)
+    data, meta = cached_get(url)
     odds_map = {}
     if not isinstance(data, list):
         return {}
@@ -206,6 +285,8 @@ def get_vegas_odds():
             if h2h and total:
                 break
         odds_map[key] = {'h2h': h2h, 'total': total, 'home': home, 'away': away}
+        if meta['source'] == 'stale':
+            odds_map[key]['age_h'] = round(meta['age_s'] / 3600, 1)
     return odds_map
 
 def find_vegas(home_name, away_name, odds_map):
@@ -221,9 +302,9 @@ def find_vegas(home_name, away_name, odds_map):
     return None
 
 # ── PREDICTION ENGINE ─────────────────────────────────────────────────────
-def predict_game(home_stats, away_stats, home_form, away_form, home_b2b, away_b2b, vegas=None):
+def predict_game(home_stats, away_stats, home_form, away_form, home_b2b, away_b2b, vegas=None, league=NBA, elo=None):
     """
-    Multi-factor NBA prediction model:
+    Multi-factor prediction model (constants from the league profile):
     1. Pythagorean Win Expectation (30%)
     2. Adjusted Efficiency Matchup (30%)
     3. Win % (20%)
@@ -231,12 +312,13 @@ def predict_game(home_stats, away_stats, home_form, away_form, home_b2b, away_b2
     5. Home Court Advantage (constant)
     6. B2B Fatigue (adjustment)
     7. Vegas comparison (signal only)
+    8. Elo comparison (signal only)
     """
     signals = []
 
     # ── 1. PYTHAGOREAN EXPECTATION ──
-    h_pyth = pythagorean_wp(home_stats['ppg'], home_stats['opp_ppg'])
-    a_pyth = pythagorean_wp(away_stats['ppg'], away_stats['opp_ppg'])
+    h_pyth = pythagorean_wp(home_stats['ppg'], home_stats['opp_ppg'], league['pyth_exp'])
+    a_pyth = pythagorean_wp(away_stats['ppg'], away_stats['opp_ppg'], league['pyth_exp'])
     pyth_edge = h_pyth - a_pyth
 
     # ── 2. ADJUSTED EFFICIENCY (Ortg vs opponent Drtg) ──
@@ -257,6 +339,14 @@ def predict_game(home_stats, away_stats, home_form, away_form, home_b2b, away_b2
     # FTR
     h_ftr = home_stats['ftm'] / max(home_stats['fga'], 1)
     a_ftr = away_stats['ftm'] / max(away_stats['fga'], 1)
+    # Matchup: meet each offense halfway with what the other defense allows (warehouse stats have it)
+    if 'opp_efg' in home_stats and 'opp_efg' in away_stats:
+        h_efg, a_efg = (h_efg + away_stats['opp_efg']) / 2, (a_efg + home_stats['opp_efg']) / 2
+    if 'opp_tov_pct' in home_stats and 'opp_tov_pct' in away_stats:
+        h_tov_rate = (h_tov_rate + away_stats['opp_tov_pct']) / 2
+        a_tov_rate = (a_tov_rate + home_stats['opp_tov_pct']) / 2
+    if 'opp_ft_rate' in home_stats and 'opp_ft_rate' in away_stats:
+        h_ftr, a_ftr = (h_ftr + away_stats['opp_ft_rate']) / 2, (a_ftr + home_stats['opp_ft_rate']) / 2
 
     four_factors = (
         (h_efg - a_efg) * 0.40 +
@@ -268,8 +358,8 @@ def predict_game(home_stats, away_stats, home_form, away_form, home_b2b, away_b2
     # ── 4. RECENT FORM (L10) ──
     form_edge = (home_form['form_score'] - away_form['form_score'])
 
-    # ── 5. HOME COURT ── (~3.2 pts = ~4.5% win prob in NBA)
-    home_adv = 0.045
+    # ── 5. HOME COURT ── (NBA ~3.2 pts = ~4.5% win prob)
+    home_adv = league['home_adv']
 
     # ── 6. BACK-TO-BACK FATIGUE ──
     b2b_adj = 0
@@ -293,8 +383,9 @@ def predict_game(home_stats, away_stats, home_form, away_form, home_b2b, away_b2
 
     # ── PACE-ADJUSTED TOTAL ESTIMATE ──
     avg_pace = (home_stats['pace'] + away_stats['pace']) / 2
-    h_score_est = ((home_stats['ortg'] + (100 - away_stats['drtg'])) / 2) * (avg_pace / 100)
-    a_score_est = ((away_stats['ortg'] + (100 - home_stats['drtg'])) / 2) * (avg_pace / 100)
+    # Points per 100: halfway between a team's offense and what the opponent's defense allows
+    h_score_est = ((home_stats['ortg'] + away_stats['drtg']) / 2) * (avg_pace / 100)
+    a_score_est = ((away_stats['ortg'] + home_stats['drtg']) / 2) * (avg_pace / 100)
     # Blend with recent form scoring
     h_score_est = h_score_est * 0.6 + home_form['avg_pts'] * 0.4
     a_score_est = a_score_est * 0.6 + away_form['avg_pts'] * 0.4
@@ -333,9 +424,9 @@ def predict_game(home_stats, away_stats, home_form, away_form, home_b2b, away_b2
     if a_efg > h_efg + 0.03:
         signals.append(f"🎯 Away eFG% edge ({a_efg:.3f} vs {h_efg:.3f})")
 
-    if est_total > 240:
+    if est_total > league['ou_line'] + 15.5:
         signals.append("💨 High-pace shootout expected")
-    elif est_total < 215:
+    elif est_total < league['ou_line'] - 9.5:
         signals.append("🛡️  Defensive grind expected")
 
     # ── VEGAS COMPARISON ──
@@ -349,8 +440,19 @@ def predict_game(home_stats, away_stats, home_form, away_form, home_b2b, away_b2
             signals.append(f"💰 VALUE BET: {side} edge {pct:.1f}% vs Vegas line!")
             value_bet = {'side': side, 'edge': edge, 'our_wp': wp, 'vegas_wp': vegas_wp}
 
+    # ── ELO COMPARISON ──
+    elo_wp = elo['wp'] if elo else None
+    if elo_wp is not None:
+        if (elo_wp > 0.5) != (wp > 0.5) and abs(elo_wp - 0.5) >= 0.10:
+            side = "HOME" if elo_wp > 0.5 else "AWAY"
+            signals.append(f"♟️  Elo disagrees: {side} {max(elo_wp, 1 - elo_wp)*100:.0f}% "
+                           f"({elo['home']:.0f} vs {elo['away']:.0f})")
+        elif abs(elo_wp - wp) <= 0.05 and max(wp, 1 - wp) >= 0.65:
+            signals.append(f"♟️  Elo agrees ({elo_wp*100:.0f}% home)")
+
     return {
         'wp': wp,
+        'elo_wp': elo_wp,
         'est_total': est_total,
         'h_score': h_score_est,
         'a_score': a_score_est,
@@ -371,7 +473,7 @@ def confidence_bar(conf, width=20):
     bar = '█' * filled + '░' * (width - filled)
     return f"[{bar}] {conf*100:.1f}%"
 
-def print_game(game_data, idx):
+def print_game(game_data, idx, league=NBA):
     home = game_data['home_name']
     away = game_data['away_name']
     p    = game_data['prediction']
@@ -386,10 +488,10 @@ def print_game(game_data, idx):
     conf = wp if wp > 0.5 else 1 - wp
     pick = home if wp > 0.5 else away
 
-    ou_line = 224.5
+    ou_line = league['ou_line']
     ou_label = "OVER" if p['est_total'] > ou_line else "UNDER"
     fh_est   = p['est_total'] * 0.475
-    fh_line  = 107.0
+    fh_line  = league['fh_line']
     fh_label = "OVER" if fh_est > fh_line else "UNDER"
 
     is_god    = conf >= 0.70
@@ -403,6 +505,8 @@ def print_game(game_data, idx):
     print(f"  GAME {idx}{god_tag}{val_tag}{b2b_tag}")
     print(f"  {away} ({a_rec}) @ {home} ({h_rec})")
     print(f"  Tip-off: {tipoff}")
+    if game_data.get('flags'):
+        print(f"  ⚠️  DEGRADED INPUTS: {', '.join(game_data['flags'])}")
     print_separator('─')
 
     # Win probability bar
@@ -449,9 +553,9 @@ def print_game(game_data, idx):
 
     print()
 
-def print_summary(results):
+def print_summary(results, league=NBA):
     print_separator('═')
-    print("  📊 SESSION SUMMARY")
+    print(f"  📊 {league['name']} SESSION SUMMARY")
     print_separator('─')
 
     god_picks   = [(r['pick'], r['conf']) for r in results if r['conf'] >= 0.70]
@@ -459,6 +563,7 @@ def print_summary(results):
     overs       = [r for r in results if r['ou'] == 'OVER']
     avg_conf    = sum(r['conf'] for r in results) / len(results) if results else 0
     avg_total   = sum(r['total'] for r in results) / len(results) if results else 0
+    degraded    = [r for r in results if r.get('flags')]
 
     print(f"  Total games analyzed : {len(results)}")
     print(f"  Average confidence   : {avg_conf*100:.1f}%")
@@ -466,6 +571,8 @@ def print_summary(results):
     print(f"  Value bets vs Vegas  : {len(value_bets)}")
     print(f"  Overs / Unders       : {len(overs)} / {len(results)-len(overs)}")
     print(f"  Avg total estimate   : {avg_total:.0f} pts")
+    if degraded:
+        print(f"  ⚠️  Degraded inputs    : {len(degraded)} game(s) — stale or default stats / form / odds")
     print()
 
     if god_picks:
@@ -488,93 +595,379 @@ def print_summary(results):
     print("     • Never bet more than you can afford to lose")
     print_separator('═')
   
-def save_to_log(results):
-    """Writes session predictions to the JSON log for the dashboard"""
-    LOG_FILE = 'nba_predictions_log.json'
-    try:
-        with open(LOG_FILE, 'r') as f:
-            log = json.load(f)
-    except:
-        log = []
+def save_to_log(results, league=NBA):
+    """Writes session predictions to the league's JSON log for the dashboard"""
+    log_file = league['log']
+    log = load_log(log_file)
 
     today_str = datetime.now().strftime('%Y-%m-%d')
-    new_entry = {
-        "date": today_str,
-        "last_updated": datetime.now().strftime('%Y-%m-%d, %H:%M'),
-        "predictions": [{
-            "matchup": r['matchup'],
-            "pick": r['pick'],
-            "confidence": round(r['conf'] * 100, 1),
-            "est_total": round(r['total'], 1),
-            "ou_pick": r['ou'],
-            "ou_line": 224.5,
-            "result": "pending"
-        } for r in results]
+    predictions = [{
+        "matchup": r['matchup'],
+        "pick": r['pick'],
+        "confidence": round(r['conf'] * 100, 1),
+        "est_total": round(r['total'], 1),
+        "ou_pick": r['ou'],
+        "ou_line": league['ou_line'],
+        **({"ml_odds": r['ml_odds']} if r.get('ml_odds') is not None else {}),
+        **({"flags": r['flags']} if r.get('flags') else {}),
+        "result": "pending"
+    } for r in results]
+
+    # Merge into today's entry so re-runs keep game order and settled results
+    existing = next((item for item in log if item["date"] == today_str), None)
+    if existing is not None:
+        existing["predictions"] = merge_predictions(existing.get("predictions", []), predictions)
+    else:
+        log.append({"date": today_str, "predictions": predictions})
+
+    changed = save_log(log, log_file)
+    write_meta(league['meta'], last_updated=datetime.now().strftime('%Y-%m-%d, %H:%M'), last_date=today_str)
+    print(f"✅ Dashboard data saved to {log_file}" + ("" if changed else " (no changes)"))
+
+# ── CHECKPOINTS ─────────────────────────────────────────────────────────
+RUNS_DIR = 'runs'
+
+def run_dir_for(day=None):
+    return os.path.join(RUNS_DIR, day or datetime.now().strftime('%Y-%m-%d'))
+
+def league_run_dir(run_dir, league):
+    """NBA checkpoints stay at the top of the run directory, other leagues get a subdirectory"""
+    return run_dir if league['key'] == 'nba' else os.path.join(run_dir, league['key'])
+
+def load_checkpoint(run_dir, name):
+    try:
+        with open(os.path.join(run_dir, name)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def save_checkpoint(run_dir, name, obj):
+    """Atomic write so a killed run never leaves a half-written checkpoint"""
+    path = os.path.join(run_dir, name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(obj, f)
+    os.replace(tmp, path)
+
+def cached_fetch(run_dir, name, fetch, resume):
+    """Reuse a fetched payload from the run directory on --resume"""
+    if resume:
+        data = load_checkpoint(run_dir, name)
+        oracle_profile.cache('checkpoint', data is not None)
+        if data is not None:
+            return data, True
+    data = fetch()
+    if data is not None:
+        save_checkpoint(run_dir, name, data)
+    return data, False
+
+# ── GAME PIPELINE ─────────────────────────────────────────────────────────
+def event_teams(event):
+    comp = event['competitions'][0]
+    home_c = comp['competitors'][0]
+    away_c = comp['competitors'][1]
+    return (home_c['team']['id'], away_c['team']['id'],
+            home_c['team']['displayName'], away_c['team']['displayName'])
+
+def format_tipoff(event):
+    """Tipoff time (convert to Nigeria WAT = UTC+1)"""
+    try:
+        tipoff_utc = datetime.strptime(event['date'], '%Y-%m-%dT%H:%MZ')
+        tipoff_nga = tipoff_utc + timedelta(hours=1)
+        return tipoff_nga.strftime('%I:%M %p WAT (Nigeria)')
+    except (KeyError, ValueError):
+        return "TBD"
+
+def fetch_game_inputs(event, all_events, vegas_map, league=NBA):
+    """Every fetched input predict_game needs for one game ('shed' set if the deadline cut any)"""
+    home_id, away_id, home_name, away_name = event_teams(event)
+    stage = oracle_profile.stage
+    shed_before = oracle_http.shed_count()
+    inputs = {}
+    with stage('team_stats'):
+        inputs['home_stats'] = get_team_stats(home_id, league)
+        inputs['away_stats'] = get_team_stats(away_id, league)
+    with stage('team_form'):
+        inputs['home_form'] = get_recent_form(home_id, league=league)
+        inputs['away_form'] = get_recent_form(away_id, league=league)
+    with stage('team_record'):
+        inputs['home_rec'] = get_team_record(home_id, league)
+        inputs['away_rec'] = get_team_record(away_id, league)
+    inputs['home_b2b'] = detect_b2b(all_events, home_id, league, game_day(event))
+    inputs['away_b2b'] = detect_b2b(all_events, away_id, league, game_day(event))
+    inputs['vegas'] = find_vegas(home_name, away_name, vegas_map)
+    inputs['elo'] = elo_ratings.matchup(league, home_id, away_id)
+    if oracle_http.shed_count() != shed_before:
+        inputs['shed'] = True
+    return inputs
+
+def input_flags(inputs):
+    """Model inputs that are not from a live fetch, e.g. ['home stats stale 6.2h', 'away form default']"""
+    flags = []
+    for side in ('home', 'away'):
+        for kind in ('stats', 'form'):
+            value = inputs.get(f'{side}_{kind}') or {}
+            source = value.get('source', 'live')
+            if source == 'stale':
+                flags.append(f"{side} {kind} stale {value.get('age_h', 0):.1f}h")
+            elif source == 'default':
+                flags.append(f"{side} {kind} default")
+    vegas = inputs.get('vegas')
+    if vegas and vegas.get('age_h') is not None:
+        flags.append(f"odds stale {vegas['age_h']:.1f}h")
+    return flags
+
+def build_game(event, inputs, league=NBA):
+    """Run the model on fetched inputs → (game_data for print_game, summary row)"""
+    home_id, away_id, home_name, away_name = event_teams(event)
+    vegas = inputs['vegas']
+    with oracle_profile.stage('predict_game'):
+        prediction = predict_game(
+            inputs['home_stats'], inputs['away_stats'],
+            inputs['home_form'], inputs['away_form'],
+            inputs['home_b2b'], inputs['away_b2b'],
+            vegas, league, inputs.get('elo')
+        )
+
+    game_data = {
+        'home_name': home_name,
+        'away_name': away_name,
+        'home_rec': inputs['home_rec'],
+        'away_rec': inputs['away_rec'],
+        'tipoff': format_tipoff(event),
+        'home_b2b': inputs['home_b2b'],
+        'away_b2b': inputs['away_b2b'],
+        'prediction': prediction,
+        'vegas': vegas,
+        'flags': input_flags(inputs),
     }
 
-    # Replace today's entry if it exists, 
-    existing = next((i for i, item in enumerate(log) if item["date"] == today_str), None)
-    if existing is not None:
-        log[existing] = new_entry
+    wp   = prediction['wp']
+    conf = wp if wp > 0.5 else 1 - wp
+    pick = home_name if wp > 0.5 else away_name
+    ou   = "OVER" if prediction['est_total'] > league['ou_line'] else "UNDER"
+    h2h  = (vegas or {}).get('h2h') or {}
+    ml_odds = h2h.get('home_odds' if wp > 0.5 else 'away_odds')
+
+    row = {
+        'pick': pick,
+        'conf': conf,
+        'total': prediction['est_total'],
+        'ou': ou,
+        'matchup': f"{away_name} @ {home_name}",
+        'is_value': bool(prediction['value_bet']),
+        'value_bet': prediction['value_bet'],
+        'ml_odds': ml_odds,
+        'flags': game_data['flags'],
+    }
+    return game_data, row
+
+def game_checkpoint(event):
+    return os.path.join('games', f"{event.get('id') or '_'.join(event_teams(event)[:2])}.json")
+
+def run_game(event, all_events, vegas_map, run_dir, resume, league=NBA, fetch=None):
+    """
+    One game, checkpointed: inputs are saved as soon as they are fetched and
+    outputs once the prediction is done. On --resume a finished game is
+    replayed from disk, an interrupted one continues from its saved inputs
+    and a failed one is retried — as is one whose inputs were cut short by
+    the --deadline budget. `fetch` replaces fetch_game_inputs (bulk mode
+    hands in inputs it already has).
+    """
+    name = game_checkpoint(event)
+    ckpt = load_checkpoint(run_dir, name) if resume else None
+    if ckpt and ckpt.get('status') == 'done':
+        return ckpt['game_data'], ckpt['row'], True
+
+    # Inputs survive a kill mid-game; a failed game refetches (the payload may have been bad)
+    inputs = ckpt.get('inputs') if ckpt and ckpt.get('status') == 'fetched' else None
+    if inputs is None:
+        inputs = (fetch or fetch_game_inputs)(event, all_events, vegas_map, league)
+        complete = not inputs.pop('shed', False)
+        save_checkpoint(run_dir, name, {'status': 'fetched' if complete else 'shed', 'inputs': inputs})
     else:
-        log.append(new_entry)
+        complete = True
+    try:
+        game_data, row = build_game(event, inputs, league)
+    except Exception as e:
+        save_checkpoint(run_dir, name, {'status': 'failed', 'inputs': inputs,
+                                        'error': f"{type(e).__name__}: {e}"})
+        raise
+    save_checkpoint(run_dir, name, {'status': 'done' if complete else 'shed', 'inputs': inputs,
+                                    'game_data': game_data, 'row': row})
+    return game_data, row, False
 
-    with open(LOG_FILE, 'w') as f:
-        json.dump(log, f, indent=2)
-    print(f"✅ Dashboard data saved to {LOG_FILE}")
 # ── MAIN ──────────────────────────────────────────────────────────────────
-def main():
+def parse_duration(text):
+    """'90s', '2m', '1.5h' or plain seconds → seconds"""
+    m = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([smh]?)\s*', text.lower())
+    if not m:
+        raise argparse.ArgumentTypeError(f"bad duration {text!r} (e.g. 90s, 2m)")
+    return float(m[1]) * {'': 1, 's': 1, 'm': 60, 'h': 3600}[m[2]]
+
+def league_list(text):
+    try:
+        return parse_leagues(text)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(description="NBA ORACLE — God Mode prediction engine")
+    ap.add_argument('--resume', action='store_true',
+                    help="continue today's run from runs/<date>/ — no refetching, failed games retried")
+    ap.add_argument('--run-dir', help="checkpoint directory (default runs/<today>)")
+    ap.add_argument('--live', action='store_true',
+                    help="follow today's games in progress — live win probability and projected totals")
+    ap.add_argument('--profile', nargs='?', const='profile.json', metavar='JSON',
+                    help="time every stage, game and HTTP request; table at the end + JSON (default profile.json)")
+    ap.add_argument('--import-profile', action='store_true',
+                    help="print the import-time breakdown of a cold start and exit")
+    ap.add_argument('--daemon', action='store_true',
+                    help="stay running: predict each game just before tipoff, settle after the final")
+    ap.add_argument('--league', type=league_list, default=[NBA], metavar='LEAGUES',
+                    help=f"comma-separated leagues to predict in one run ({', '.join(LEAGUES)} or all; "
+                         f"default nba) — --live and --daemon are NBA only")
+    ap.add_argument('--workers', type=int, metavar='N',
+                    help="bulk slate mode with N concurrent team loads for every league "
+                         "(default: the league's own — 1 = one game at a time for NBA / WNBA)")
+    ap.add_argument('--deadline', type=parse_duration, metavar='DURATION',
+                    help="finish within this wall time (e.g. 90s, 2m): requests are capped to the time left "
+                         "and records / tomorrow's games are dropped first; dropped inputs are logged")
+    return ap.parse_args(argv)
+
+def live_mode(run_dir):
+    """
+    In-game updates seeded from today's pregame predictions. Games already
+    predicted in this run directory are read from their checkpoints; any
+    other game is predicted once (and checkpointed) when it first goes live.
+    """
+    from live import run_live
+
+    def odds_map():
+        saved = load_checkpoint(run_dir, 'odds.json') or {}
+        return {tuple(k.split('|')): v for k, v in saved.items()}
+
+    today = load_checkpoint(run_dir, 'scoreboard_today.json') or get_scoreboard() or {}
+    all_events = today.get('events', [])
+    vegas_map = odds_map()
+
+    def pregame(event):
+        game_data, _, _ = run_game(event, all_events, vegas_map, run_dir, resume=True)
+        return game_data['prediction']
+
+    run_live(SCOREBOARD_URL, pregame, slate_ids=[e.get('id') for e in all_events])
+
+def main(argv=None):
+    args = parse_args(argv)
+    run_dir = args.run_dir or run_dir_for()
+    resume = args.resume
+    if args.import_profile:
+        from import_profile import print_profile
+        print_profile('nba_predictor')
+        return
+    if args.live:
+        live_mode(run_dir)
+        return
+    if args.daemon:
+        from oracle_daemon import run_daemon
+        run_daemon()
+        return
+
+    if args.deadline:
+        oracle_http.set_deadline(args.deadline)
+    profile = oracle_profile.start() if args.profile else None
+    try:
+        with oracle_metrics.job('nba_predictor'):
+            predict_slate(run_dir, resume, args.league, args.workers)
+    finally:
+        if profile:
+            profile.print_report()
+            profile.write(args.profile)
+            print(f"  ⏱  Profile written to {args.profile}")
+            print()
+
+def fetch_slate(league, run_dir, resume):
+    """Odds and today's + tomorrow's scoreboards for one league (checkpointed)"""
+    stage = oracle_profile.stage
+    # JSON keys must be strings — checkpoint as "a|b" and restore the tuple keys
+    with stage('odds'):
+        vegas_map, odds_cached = cached_fetch(run_dir, 'odds.json',
+                                              lambda: {'|'.join(k): v for k, v in get_vegas_odds(league).items()}, resume)
+    with stage('scoreboard'):
+        today_data, _ = cached_fetch(run_dir, 'scoreboard_today.json', lambda: get_scoreboard(league=league), resume)
+    tomorrow_str = (datetime.utcnow() + timedelta(days=1)).strftime('%Y%m%d')
+    with stage('scoreboard'):
+        tomorrow_data, _ = cached_fetch(run_dir, 'scoreboard_tomorrow.json',
+                                        lambda: get_scoreboard(tomorrow_str, priority='low', league=league), resume)
+    return {
+        'vegas_map': {tuple(k.split('|')): v for k, v in (vegas_map or {}).items()},
+        'odds_cached': odds_cached,
+        'today': today_data.get('events', []) if today_data else [],
+        'tomorrow': tomorrow_data.get('events', []) if tomorrow_data else [],
+    }
+
+def fetch_slates(leagues, run_dir, resume):
+    """Every league's slate at once — they share the HTTP pool, caches and rate limiter"""
+    with ThreadPoolExecutor(max_workers=len(leagues)) as pool:
+        futures = [pool.submit(fetch_slate, lg, league_run_dir(run_dir, lg), resume) for lg in leagues]
+        return [f.result() for f in futures]
+
+def predict_slate(run_dir, resume, leagues=(NBA,), workers=None):
     print()
     print_separator('═')
-    print("  🏀  NBA ORACLE — GOD MODE PREDICTION ENGINE")
+    print(f"  🏀  {' + '.join(lg['name'] for lg in leagues)} ORACLE — GOD MODE PREDICTION ENGINE")
     print(f"  📅  {datetime.now().strftime('%A, %B %d %Y  %H:%M')}")
+    if resume:
+        print(f"  ♻️   Resuming from {run_dir}")
     print_separator('═')
     print()
 
-    # Load Vegas odds
-    print("  Loading Vegas odds...", end='', flush=True)
-    vegas_map = get_vegas_odds()
-    if vegas_map:
-        print(f" ✓ {len(vegas_map)} games loaded")
-    else:
-        print(" (no API key — skipping)")
+    print(f"  Loading Vegas odds and schedules ({', '.join(lg['key'] for lg in leagues)})...", end='', flush=True)
+    slates = fetch_slates(leagues, run_dir, resume)
+    print(" ✓")
+    for league, slate in zip(leagues, slates):
+        odds = (f"{len(slate['vegas_map'])} odds" + (" (checkpoint)" if slate['odds_cached'] else "")
+                if slate['vegas_map'] else "no odds")
+        print(f"  {league['name']:<11} {len(slate['today'])} today + {len(slate['tomorrow'])} tomorrow, {odds}")
+
+    for league, slate in zip(leagues, slates):
+        predict_league(league, slate, league_run_dir(run_dir, league), resume, workers)
+    print_deadline_report()
+    print()
 
-    # Get today's games
-    print("  Fetching today's NBA schedule...", end='', flush=True)
-    today_data = get_scoreboard()
-    today_events = today_data.get('events', []) if today_data else []
-
-    # Get tomorrow's games
-    tomorrow_str = (datetime.utcnow() + timedelta(days=1)).strftime('%Y%m%d')
-    print(f" ✓")
-    print("  Fetching tomorrow's NBA schedule...", end='', flush=True)
-    tomorrow_data = get_scoreboard(tomorrow_str)
-    tomorrow_events = tomorrow_data.get('events', []) if tomorrow_data else []
-    print(f" ✓")
+def predict_league(league, slate, run_dir, resume, workers=None):
+    """Predict, print and log one league's scheduled games from its fetched slate"""
+    workers = workers or league['workers']
+    if workers > 1:
+        from bulk_slate import predict_bulk
+        return predict_bulk(league, slate, run_dir, resume, workers)
+    stage = oracle_profile.stage
+    vegas_map = slate['vegas_map']
 
     # All events for B2B detection
-    all_events = today_events + tomorrow_events
+    all_events = slate['today'] + slate['tomorrow']
 
     # Filter scheduled only
-    today_scheduled    = [e for e in today_events    if e.get('status', {}).get('type', {}).get('state') == 'pre']
-    tomorrow_scheduled = [e for e in tomorrow_events if e.get('status', {}).get('type', {}).get('state') == 'pre']
+    today_scheduled    = [e for e in slate['today']    if e.get('status', {}).get('type', {}).get('state') == 'pre']
+    tomorrow_scheduled = [e for e in slate['tomorrow'] if e.get('status', {}).get('type', {}).get('state') == 'pre']
 
     all_scheduled = [('TODAY', e) for e in today_scheduled] + \
                     [('TOMORROW', e) for e in tomorrow_scheduled]
 
+    print()
     if not all_scheduled:
-        print()
-        print("  ⚠️  No scheduled games found right now.")
-        print("  NBA games tip off between 12:00–09:00 Nigeria time.")
+        print(f"  ⚠️  No scheduled {league['name']} games found right now.")
+        if league['key'] == 'nba':
+            print("  NBA games tip off between 12:00–09:00 Nigeria time.")
         print("  Try running this again closer to game time.")
-        print()
         return
 
     total = len(all_scheduled)
-    print(f"  Found {len(today_scheduled)} today + {len(tomorrow_scheduled)} tomorrow = {total} total games")
-    print()
+    print(f"  {league['name']}: {len(today_scheduled)} today + {len(tomorrow_scheduled)} tomorrow = {total} total games")
 
     results = []
+    failed = []
     game_idx = 1
     current_day = None
 
@@ -586,90 +979,64 @@ def main():
             date_str = "TODAY" if day_label == 'TODAY' else f"TOMORROW ({(datetime.utcnow()+timedelta(days=1)).strftime('%b %d')})"
             print()
             print(f"  {'━'*60}")
-            print(f"  📅  {date_str} — {len(today_scheduled) if day_label=='TODAY' else len(tomorrow_scheduled)} GAMES")
+            print(f"  📅  {league['name']} {date_str} — {len(today_scheduled) if day_label=='TODAY' else len(tomorrow_scheduled)} GAMES")
             print(f"  {'━'*60}")
             print()
 
-        try:
-            comp = event['competitions'][0]
-            home_c = comp['competitors'][0]
-            away_c = comp['competitors'][1]
-            home_id   = home_c['team']['id']
-            away_id   = away_c['team']['id']
-            home_name = home_c['team']['displayName']
-            away_name = away_c['team']['displayName']
-
-            # Tipoff time (convert to Nigeria WAT = UTC+1)
-            tipoff_str = "TBD"
-            try:
-                tipoff_utc = datetime.strptime(event['date'], '%Y-%m-%dT%H:%MZ')
-                tipoff_nga = tipoff_utc + timedelta(hours=1)
-                tipoff_str = tipoff_nga.strftime('%I:%M %p WAT (Nigeria)')
-            except:
-                pass
+        # Out of time for the low-value half of the slate — tomorrow is predicted again next run
+        if day_label == 'TOMORROW' and oracle_http.should_shed('low'):
+            _, _, home_name, away_name = event_teams(event)
+            oracle_http.shed(f"{league['key']} game {away_name} @ {home_name} (tomorrow)", 'low')
+            print(f"  ⏭  Skipped (deadline): {away_name} @ {home_name}")
+            continue
 
+        try:
+            _, _, home_name, away_name = event_teams(event)
             print(f"  ⏳ Analyzing: {away_name} @ {home_name}...", flush=True)
 
-            home_stats = get_team_stats(home_id)
-            away_stats = get_team_stats(away_id)
-            home_form  = get_recent_form(home_id)
-            away_form  = get_recent_form(away_id)
-            home_rec   = get_team_record(home_id)
-            away_rec   = get_team_record(away_id)
-            home_b2b   = detect_b2b(all_events, home_id)
-            away_b2b   = detect_b2b(all_events, away_id)
-            vegas      = find_vegas(home_name, away_name, vegas_map)
-
-            prediction = predict_game(
-                home_stats, away_stats,
-                home_form, away_form,
-                home_b2b, away_b2b,
-                vegas
-            )
-
-            game_data = {
-                'home_name': home_name,
-                'away_name': away_name,
-                'home_rec': home_rec,
-                'away_rec': away_rec,
-                'tipoff': tipoff_str,
-                'home_b2b': home_b2b,
-                'away_b2b': away_b2b,
-                'prediction': prediction,
-                'vegas': vegas,
-            }
-
-            print_game(game_data, game_idx)
-
-            wp   = prediction['wp']
-            conf = wp if wp > 0.5 else 1 - wp
-            pick = home_name if wp > 0.5 else away_name
-            ou   = "OVER" if prediction['est_total'] > 224.5 else "UNDER"
-
-            results.append({
-                'pick': pick,
-                'conf': conf,
-                'total': prediction['est_total'],
-                'ou': ou,
-                'matchup': f"{away_name} @ {home_name}",
-                'is_value': bool(prediction['value_bet']),
-                'value_bet': prediction['value_bet'],
-            })
-
+            with oracle_profile.game(f"{league['name']}: {away_name} @ {home_name}"):
+                game_data, row, replayed = run_game(event, all_events, vegas_map, run_dir, resume, league)
+                if replayed:
+                    print("     ♻️  from checkpoint")
+                with stage('print_game'):
+                    print_game(game_data, game_idx, league)
+            results.append(row)
+            oracle_metrics.inc('oracle_games_predicted')
+            if row.get('flags'):
+                oracle_metrics.inc('oracle_games_degraded')
             game_idx += 1
 
         except Exception as e:
+            # Checkpointed as failed — `--resume` retries it instead of dropping it
             print(f"  ⚠️  Error processing game: {e}")
+            failed.append(event.get('id', '?'))
+            oracle_metrics.inc('oracle_games_skipped', reason=type(e).__name__)
             continue
 
     # Final summary
     if results:
         print()
-        print_summary(results)
-    print()
+        with stage('summary'):
+            print_summary(results, league)
+        with stage('save_to_log'):
+            save_to_log(results, league)
+    if failed:
+        print(f"  ⚠️  {len(failed)} {league['name']} game(s) failed — run again with --resume to retry them")
+
+def print_deadline_report():
+    """What the --deadline budget dropped, if anything (also in the --profile JSON)"""
+    state = oracle_http.deadline_state()
+    if not state:
+        return
+    left = state['remaining_s']
+    print(f"  ⏱  Deadline {state['budget_s']:g}s — " +
+          (f"finished with {left:.1f}s to spare" if left > 0 else f"overran by {-left:.1f}s"))
+    if not state['shed']:
+        return
+    print(f"  ✂️  Shed {len(state['shed'])} input(s) to finish on time:")
+    for s in state['shed']:
+        oracle_metrics.inc('oracle_fetches_shed', priority=s['priority'])
+        print(f"     [{s['priority']:<8}] +{s['at_s']:>5.1f}s  {s['what']}")
 
 if __name__ == '__main__':
     main()
-if results:
-        print_summary(results)
-        save_to_log(results) # <--- Add this
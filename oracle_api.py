@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""
+NBA ORACLE — Local Prediction API
+A small HTTP service over the warm OracleState (see oracle_daemon.py):
+
+  GET  /slate?date=YYYY-MM-DD         predictions for that day's scheduled games
+  POST /predict                       {"games": [{"home": "Celtics", "away": "1"}, ...]}
+  GET  /history?from=&to=&team=       logged predictions
+  GET  /team/{id}                     registry entry, stats, form and record
+  GET  /events                        server-sent events: prediction / result / odds deltas
+  GET  /metrics                       OpenMetrics (HTTP, cache and model health; see oracle_metrics.py)
+
+Responses are encoded once and cached against the snapshot they were built
+from (the state version, or the log's mtime for /history), so repeat calls
+are a dict lookup. The state only notices a change when something refetches,
+so state-backed responses also expire every shortest-TTL window, whether or
+not the daemon is running. Identical requests that arrive while one is being built
+wait for it instead of fetching again.
+
+/events pushes only what changed. One watcher diffs the log and the odds
+cache and encodes each delta once; idle subscribers just sleep on a
+condition variable, so open dashboards cost nothing between changes.
+
+  python3 oracle_api.py --port 8765            # API only
+  python3 oracle_api.py --port 8765 --daemon   # API + daemon scheduler
+"""
+
+import argparse
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import oracle_metrics
+from log_store import LOG_FILE, load_log
+from oracle_daemon import OracleDaemon, OracleState
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+MAX_BATCH    = 64
+CACHE_SIZE   = 512
+WATCH_EVERY  = 5            # seconds between log / odds checks
+KEEPALIVE    = 25           # seconds between SSE comments on an idle stream
+BACKLOG      = 500          # deltas kept for reconnecting clients (Last-Event-ID)
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+# ── COALESCING + RESPONSE CACHE ──────────────────────────────────────────
+class Coalescer:
+    """Concurrent calls with the same key share one computation"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight = {}         # key → (Event, result holder)
+
+    def do(self, key, fn):
+        with self._lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = (threading.Event(), {})
+        done, holder = flight
+        if not leader:
+            done.wait()
+        else:
+            try:
+                holder['value'] = fn()
+            except Exception as e:
+                holder['error'] = e
+            finally:
+                with self._lock:
+                    del self._inflight[key]
+                done.set()
+        if 'error' in holder:
+            raise holder['error']
+        return holder['value']
+
+class ResponseCache:
+    """Encoded responses keyed by request, valid for one snapshot version"""
+
+    def __init__(self, size=CACHE_SIZE):
+        self.size = size
+        self._lock = threading.Lock()
+        self._items = {}            # key → (version, body)
+
+    def get(self, key, version):
+        with self._lock:
+            hit = self._items.get(key)
+        return hit[1] if hit and hit[0] == version else None
+
+    def put(self, key, version, body):
+        with self._lock:
+            if len(self._items) >= self.size and key not in self._items:
+                self._items.pop(next(iter(self._items)))
+            self._items[key] = (version, body)
+
+# ── DELTA FEED ───────────────────────────────────────────────────────────
+def _prediction_index(log):
+    return {(e.get('date'), p.get('matchup')): p for e in log for p in e.get('predictions', [])}
+
+def _odds_index(odds):
+    out = {}
+    for v in odds.values():
+        h2h, tot = v.get('h2h') or {}, v.get('total') or {}
+        out[f"{v.get('away')} @ {v.get('home')}"] = {
+            'away': h2h.get('away_odds'), 'home': h2h.get('home_odds'), 'total': tot.get('line')}
+    return out
+
+class DeltaFeed:
+    """
+    Diffs the prediction log and the odds cache into a numbered stream of
+    SSE messages. Each message is encoded once and shared by every client.
+    """
+
+    def __init__(self, api, every=WATCH_EVERY):
+        self.api = api
+        self.every = every
+        self.seq = 0
+        self.backlog = deque(maxlen=BACKLOG)     # (seq, encoded message)
+        self.cond = threading.Condition()
+        self._preds = _prediction_index(api.log())
+        self._odds = _odds_index(api.state.odds())
+        self._started = False
+
+    def start(self):
+        with self.cond:
+            if self._started:
+                return
+            self._started = True
+        threading.Thread(target=self._watch, daemon=True).start()
+
+    def _watch(self):
+        log_v = self.api.log_version()
+        while True:
+            time.sleep(self.every)
+            if self.api.log_version() != log_v:
+                log_v = self.api.log_version()
+                self.publish(self.log_deltas())
+            self.publish(self.odds_deltas())
+
+    def log_deltas(self):
+        new = _prediction_index(self.api.log())
+        out = []
+        for (date, matchup), p in new.items():
+            old = self._preds.get((date, matchup))
+            if old == p:
+                continue
+            settled = p.get('result') not in (None, 'pending')
+            if settled and (old or {}).get('result') in (None, 'pending'):
+                out.append(('result', {'date': date, 'matchup': matchup, 'result': p['result'],
+                                       'actual_away': p.get('actual_away'),
+                                       'actual_home': p.get('actual_home'),
+                                       'actual_total': p.get('actual_total')}))
+            elif not settled:
+                out.append(('prediction', {'date': date, 'prediction': p}))
+        self._preds = new
+        return out
+
+    def odds_deltas(self):
+        new = _odds_index(self.api.state.odds())
+        out = [('odds', dict(line, matchup=m)) for m, line in new.items() if self._odds.get(m) != line]
+        self._odds = new
+        return out
+
+    def publish(self, deltas):
+        if not deltas:
+            return
+        with self.cond:
+            for kind, data in deltas:
+                self.seq += 1
+                msg = f"id: {self.seq}\nevent: {kind}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+                self.backlog.append((self.seq, msg.encode()))
+            self.cond.notify_all()
+
+    def since(self, last_id):
+        """(seq, message) pairs after last_id, or None if the client fell out of the backlog"""
+        with self.cond:
+            if last_id == self.seq:
+                return []
+            if last_id > self.seq or not self.backlog or self.backlog[0][0] > last_id + 1:
+                return None
+            return [(i, m) for i, m in self.backlog if i > last_id]
+
+    def wait(self, last_id, timeout=KEEPALIVE):
+        with self.cond:
+            self.cond.wait_for(lambda: self.seq > last_id, timeout)
+            return self.seq
+
+# ── HANDLERS ─────────────────────────────────────────────────────────────
+class OracleApi:
+    def __init__(self, state=None, log_file=LOG_FILE):
+        self.state = state or OracleState()
+        self.log_file = log_file
+        self.cache = ResponseCache()
+        self.flights = Coalescer()
+        self._log = (None, [])      # (mtime, parsed log)
+        self._feed = None
+        self._feed_lock = threading.Lock()
+
+    def feed(self):
+        with self._feed_lock:
+            if self._feed is None:
+                self._feed = DeltaFeed(self)
+                self._feed.start()
+            return self._feed
+
+    # ── snapshots ──
+    def log_version(self):
+        try:
+            return os.path.getmtime(self.log_file)
+        except OSError:
+            return None
+
+    def log(self):
+        mtime = self.log_version()
+        if self._log[0] != mtime:
+            self._log = (mtime, load_log(self.log_file))
+        return self._log[1]
+
+    # ── endpoints ──
+    def slate(self, q):
+        date = q.get('date') or datetime.now().strftime('%Y-%m-%d')
+        try:
+            day = datetime.strptime(date, '%Y-%m-%d').strftime('%Y%m%d')
+        except ValueError:
+            raise ApiError(400, f"bad date {date!r} (expected YYYY-MM-DD)")
+        games = []
+        for event in self.state.scoreboard(day):
+            if event.get('status', {}).get('type', {}).get('state') != 'pre':
+                continue
+            game_data, row = self.state.predict(event)
+            games.append(self._game(event.get('id'), game_data, row))
+        return {'date': date, 'games': games}
+
+    def predict(self, body):
+        pairs = (body or {}).get('games')
+        if not isinstance(pairs, list) or not pairs:
+            raise ApiError(400, 'body must be {"games": [{"home": ..., "away": ...}, ...]}')
+        if len(pairs) > MAX_BATCH:
+            raise ApiError(400, f"at most {MAX_BATCH} games per request")
+        games = []
+        for pair in pairs:
+            home, away = self.resolve(pair.get('home')), self.resolve(pair.get('away'))
+            game_data, row = self.state.predict(self._event(home, away))
+            games.append(self._game(None, game_data, row))
+        return {'games': games}
+
+    def history(self, q):
+        date_from, date_to = q.get('from'), q.get('to')
+        team = (q.get('team') or '').lower()
+        out = []
+        for entry in self.log():
+            date = entry.get('date', '')
+            if (date_from and date < date_from) or (date_to and date > date_to):
+                continue
+            preds = entry.get('predictions', [])
+            if team:
+                preds = [p for p in preds if team in p.get('matchup', '').lower()]
+                if not preds:
+                    continue
+            out.append({'date': date, 'predictions': preds})
+        return {'history': out}
+
+    def team(self, team_id):
+        info = self.state.teams().get(team_id)
+        if info is None:
+            raise ApiError(404, f"unknown team id {team_id!r}")
+        return dict(info,
+                    stats=self.state.team_stats(team_id),
+                    form=self.state.team_form(team_id),
+                    record=self.state.team_record(team_id))
+
+    # ── helpers ──
+    def resolve(self, ref):
+        """Team id, abbreviation, full name or nickname → registry entry"""
+        if not ref:
+            raise ApiError(400, "every game needs home and away")
+        teams = self.state.teams()
+        ref = str(ref)
+        if ref in teams:
+            return teams[ref]
+        low = ref.lower()
+        for t in teams.values():
+            if low in (t['abbr'].lower(), t['name'].lower(), t['name'].lower().split()[-1]):
+                return t
+        raise ApiError(404, f"unknown team {ref!r}")
+
+    @staticmethod
+    def _event(home, away):
+        return {'id': None, 'competitions': [{'competitors': [
+            {'homeAway': 'home', 'team': {'id': home['id'], 'displayName': home['name']}},
+            {'homeAway': 'away', 'team': {'id': away['id'], 'displayName': away['name']}},
+        ]}]}
+
+    @staticmethod
+    def _game(event_id, game_data, row):
+        p = game_data['prediction']
+        return {
+            'id': event_id,
+            'matchup': row['matchup'],
+            'tipoff': game_data['tipoff'],
+            'pick': row['pick'],
+            'conf': round(row['conf'], 4),
+            'home_wp': round(p['wp'], 4),
+            'est_total': round(p['est_total'], 1),
+            'ou': row['ou'],
+            'ml_odds': row['ml_odds'],
+        }
+
+    # ── dispatch ──
+    def handle(self, method, raw_path, body=b''):
+        """→ (status, encoded JSON body)"""
+        url = urlparse(raw_path)
+        q = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        path = url.path.rstrip('/') or '/'
+        key = (method, path, url.query, body)
+        if path == '/history':
+            version = self.log_version()
+        else:           # version alone never moves if nothing refetches; the window makes stale entries miss
+            version = (self.state.version, int(self.state.clock() // min(self.state.ttl.values())))
+        hit = self.cache.get(key, version)
+        if hit is not None:
+            return 200, hit
+
+        def build():
+            if method == 'GET' and path == '/slate':
+                payload = self.slate(q)
+            elif method == 'POST' and path == '/predict':
+                try:
+                    payload = self.predict(json.loads(body or b'{}'))
+                except ValueError:
+                    raise ApiError(400, "body is not valid JSON")
+            elif method == 'GET' and path == '/history':
+                payload = self.history(q)
+            elif method == 'GET' and path.startswith('/team/'):
+                payload = self.team(path[len('/team/'):])
+            else:
+                raise ApiError(404, f"no route for {method} {path}")
+            return json.dumps(payload, separators=(',', ':')).encode()
+
+        try:
+            encoded = self.flights.do(key, build)
+        except ApiError as e:
+            return e.status, json.dumps({'error': str(e)}).encode()
+        except Exception as e:
+            return 500, json.dumps({'error': f"{type(e).__name__}: {e}"}).encode()
+        # Store against the version the response was built from, not the one after
+        self.cache.put(key, version, encoded)
+        return 200, encoded
+
+# ── SERVER ───────────────────────────────────────────────────────────────
+def make_handler(api):
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self, status, body, content_type='application/json'):
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            path = urlparse(self.path).path.rstrip('/')
+            if path == '/events':
+                return self._stream()
+            if path == '/metrics':
+                return self._reply(200, oracle_metrics.render().encode(),
+                                   'application/openmetrics-text; version=1.0.0; charset=utf-8')
+            self._reply(*api.handle('GET', self.path))
+
+        def _stream(self):
+            feed = api.feed()
+            q = parse_qs(urlparse(self.path).query)
+            last = self.headers.get('Last-Event-ID') or (q.get('since') or [None])[-1]
+            try:
+                last = int(last) if last is not None else None
+            except ValueError:
+                last = None
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            try:
+                # A fresh client has just loaded the full JSON — start from now
+                last = feed.seq if last is None else last
+                self.wfile.write(b"retry: 5000\n\n")
+                last = self._send(feed, last)
+                while True:
+                    if feed.wait(last) == last:
+                        self.wfile.write(b": keepalive\n\n")
+                        self.wfile.flush()
+                    else:
+                        last = self._send(feed, last)
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+        def _send(self, feed, last):
+            msgs = feed.since(last)
+            if msgs is None:
+                # Missed deltas are gone — the client reloads the full JSON once
+                last = feed.seq
+                self.wfile.write(f"id: {last}\nevent: reset\ndata: {{}}\n\n".encode())
+            elif msgs:
+                last = msgs[-1][0]
+                self.wfile.write(b''.join(m for _, m in msgs))
+            self.wfile.flush()
+            return last
+
+        def do_POST(self):
+            n = int(self.headers.get('Content-Length') or 0)
+            self._reply(*api.handle('POST', self.path, self.rfile.read(n)))
+
+        def do_OPTIONS(self):
+            self.send_response(204)
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
+            self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+            self.end_headers()
+
+        def log_message(self, fmt, *args):
+            pass
+    return Handler
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, state=None, daemon=False):
+    api = OracleApi(state)
+    server = ThreadingHTTPServer((host, port), make_handler(api))
+    server.daemon_threads = True
+    if daemon:
+        threading.Thread(target=OracleDaemon(api.state).start, daemon=True).start()
+    print(f"  🌐 NBA Oracle API on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n  ⏹  Stopped")
+    finally:
+        server.server_close()
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Local HTTP API over the NBA Oracle predictor")
+    ap.add_argument('--host', default=DEFAULT_HOST)
+    ap.add_argument('--port', type=int, default=DEFAULT_PORT)
+    ap.add_argument('--daemon', action='store_true', help="also run the daemon scheduler in-process")
+    args = ap.parse_args(argv)
+    serve(args.host, args.port, daemon=args.daemon)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+NBA ORACLE — Daemon Mode
+One long-running process instead of cold-started cron runs. The team
+registry, stats snapshot, schedule index and odds stay in memory (each
+with its own freshness window), and work is scheduled around the slate:
+
+  • every hour      refresh the schedule, plan any new games
+  • tipoff − 20m    final prediction for that game → nba_predictions_log.json
+  • tipoff + 2h45m  settle results (rechecked every 15m until final)
+
+A refresh only refetches what went stale, so a pre-tipoff prediction is
+usually two form lookups and one odds call.
+
+  python3 nba_predictor.py --daemon
+"""
+
+import calendar
+import sched
+import threading
+import time
+from datetime import datetime, timedelta
+
+import elo_ratings
+import nba_predictor as nba
+import oracle_metrics
+import oracle_profile
+from oracle_http import ESPN_NBA_URL, safe_get
+
+# ── CONFIG ───────────────────────────────────────────────────────────────
+TEAMS_URL     = f"{ESPN_NBA_URL}/teams"
+
+# Seconds before a cached item is refetched
+TTL = {
+    'teams':      24 * 3600,
+    'stats':       6 * 3600,
+    'record':      6 * 3600,
+    'form':        3 * 3600,
+    'scoreboard':       300,
+    'odds':             600,
+}
+
+PLAN_EVERY    = 3600
+PREDICT_LEAD  = 20 * 60
+SETTLE_AFTER  = 2 * 3600 + 45 * 60
+SETTLE_RETRY  = 15 * 60
+
+# ── WARM STATE ───────────────────────────────────────────────────────────
+def _defaulted(value):
+    """get_team_stats / get_recent_form answer a failed lookup with league defaults, not None"""
+    return value.get('source') == 'default'
+
+class OracleState:
+    """
+    In-memory caches shared by the daemon (and anything else in-process).
+    `version` goes up whenever a cached value actually changes, so callers
+    can tell whether anything they derived from the state is out of date.
+    """
+
+    def __init__(self, ttl=None, clock=time.time):
+        self.ttl = dict(TTL, **(ttl or {}))
+        self.clock = clock
+        self.version = 0
+        self._cache = {}                 # (kind, key) → (fetched_at, value)
+        self._lock = threading.RLock()
+
+    def get(self, kind, key, fetch, force=False, failed=None):
+        """
+        Cached value of fetch(), refetched after its TTL. A failed fetch
+        (None, or `failed(value)` for fetchers that return placeholders)
+        keeps the last good copy, and a placeholder is never cached, so the
+        next call retries.
+        """
+        now = self.clock()
+        with self._lock:
+            hit = self._cache.get((kind, key))
+        fresh = hit and not force and now - hit[0] < self.ttl[kind]
+        oracle_profile.cache(kind, bool(fresh))
+        if fresh:
+            return hit[1]
+        value = fetch()
+        if value is None and hit:
+            return hit[1]                # keep the last good copy on a failed fetch
+        if value is not None and failed and failed(value):
+            return hit[1] if hit else value
+        with self._lock:
+            if not hit or hit[1] != value:
+                self.version += 1
+            self._cache[(kind, key)] = (now, value)
+        return value
+
+    def invalidate(self, kind, key=None):
+        with self._lock:
+            for k in [k for k in self._cache if k[0] == kind and (key is None or k[1] == key)]:
+                del self._cache[k]
+
+    # ── cached fetchers ──
+    def teams(self, force=False):
+        """Team registry: id → {'id', 'name', 'abbr'}"""
+        def fetch():
+            data = safe_get(TEAMS_URL)
+            if not data:
+                return None
+            try:
+                raw = data['sports'][0]['leagues'][0]['teams']
+            except (KeyError, IndexError):
+                return None
+            return {t['team']['id']: {'id': t['team']['id'],
+                                      'name': t['team'].get('displayName', ''),
+                                      'abbr': t['team'].get('abbreviation', '')}
+                    for t in raw if 'team' in t}
+        return self.get('teams', None, fetch, force) or {}
+
+    def scoreboard(self, date_str=None, force=False):
+        """Scoreboard for YYYYMMDD (None = today) → list of events"""
+        data = self.get('scoreboard', date_str, lambda: nba.get_scoreboard(date_str), force)
+        return (data or {}).get('events', [])
+
+    def schedule(self, force=False):
+        """Schedule index: event id → event, today + tomorrow"""
+        tomorrow = (datetime.utcnow() + timedelta(days=1)).strftime('%Y%m%d')
+        events = self.scoreboard(None, force) + self.scoreboard(tomorrow, force)
+        return {e.get('id'): e for e in events}
+
+    def odds(self, force=False):
+        return self.get('odds', None, nba.get_vegas_odds, force) or {}
+
+    def team_stats(self, team_id, force=False):
+        return self.get('stats', team_id, lambda: nba.get_team_stats(team_id), force, _defaulted)
+
+    def team_form(self, team_id, force=False):
+        return self.get('form', team_id, lambda: nba.get_recent_form(team_id), force, _defaulted)
+
+    def team_record(self, team_id, force=False):
+        return self.get('record', team_id, lambda: nba.get_team_record(team_id), force,
+                        lambda rec: rec == '?-?')
+
+    # ── prediction ──
+    def game_inputs(self, event, fresh=False):
+        """Same inputs as nba_predictor.fetch_game_inputs, served from the warm caches"""
+        home_id, away_id, home_name, away_name = nba.event_teams(event)
+        all_events = list(self.schedule().values())
+        return {
+            'home_stats': self.team_stats(home_id),
+            'away_stats': self.team_stats(away_id),
+            'home_form':  self.team_form(home_id, force=fresh),
+            'away_form':  self.team_form(away_id, force=fresh),
+            'home_rec':   self.team_record(home_id),
+            'away_rec':   self.team_record(away_id),
+            'home_b2b':   nba.detect_b2b(all_events, home_id, day=nba.game_day(event)),
+            'away_b2b':   nba.detect_b2b(all_events, away_id, day=nba.game_day(event)),
+            'vegas':      nba.find_vegas(home_name, away_name, self.odds(force=fresh)),
+            'elo':        elo_ratings.matchup(nba.NBA, home_id, away_id),
+        }
+
+    def predict(self, event, fresh=False):
+        """→ (game_data, row) exactly as the CLI builds them"""
+        return nba.build_game(event, self.game_inputs(event, fresh))
+
+# ── SCHEDULER ────────────────────────────────────────────────────────────
+def tipoff_epoch(event):
+    try:
+        return calendar.timegm(time.strptime(event['date'], '%Y-%m-%dT%H:%MZ'))
+    except (KeyError, ValueError):
+        return None
+
+def event_state(event):
+    return event.get('status', {}).get('type', {}).get('state')
+
+def _stamp(ts=None):
+    return datetime.fromtimestamp(ts or time.time()).strftime('%H:%M:%S')
+
+class OracleDaemon:
+    def __init__(self, state=None, scheduler=None):
+        self.state = state or OracleState()
+        self.sched = scheduler or sched.scheduler(time.time, time.sleep)
+        self.planned = set()       # event ids with a final prediction scheduled
+        self.settling = set()      # event ids with settlement scheduled
+
+    def log(self, msg):
+        print(f"  [{_stamp()}] {msg}", flush=True)
+
+    def start(self):
+        self.log("🏀 NBA Oracle daemon starting — warming caches")
+        self.state.teams()
+        self.plan(preview=True)
+        self.sched.run()
+
+    def plan(self, preview=False):
+        """Refresh the schedule and queue work for games not seen before"""
+        now = time.time()
+        events = self.state.schedule(force=True)
+        new = []
+        for eid, event in events.items():
+            tip = tipoff_epoch(event)
+            if tip is None:
+                continue
+            if event_state(event) == 'pre' and eid not in self.planned:
+                self.planned.add(eid)
+                self.sched.enterabs(max(tip - PREDICT_LEAD, now), 1, self.predict, (eid,))
+                new.append(event)
+            if event_state(event) != 'post' and eid not in self.settling:
+                self.settling.add(eid)
+                self.sched.enterabs(max(tip + SETTLE_AFTER, now), 2, self.settle, (eid,))
+        if new:
+            self.log(f"📅 Planned {len(new)} new game(s)")
+            # Warm the stats snapshot now so pre-tipoff runs only refresh form / odds
+            rows = []
+            for event in new:
+                try:
+                    home_id, away_id, _, _ = nba.event_teams(event)
+                    for tid in (home_id, away_id):
+                        self.state.team_stats(tid)
+                        self.state.team_record(tid)
+                    if preview and self._is_today(event):
+                        rows.append(self.state.predict(event)[1])
+                except Exception as e:      # one bad game must not stop the scheduler
+                    self.log(f"⚠️  {event.get('id')} preview failed: {e}")
+                    oracle_metrics.inc('oracle_games_skipped', reason=type(e).__name__)
+            self.write(rows)
+        self.sched.enter(PLAN_EVERY, 3, self.plan)
+
+    def _is_today(self, event):
+        return event.get('date', '')[:10] <= datetime.utcnow().strftime('%Y-%m-%d')
+
+    def predict(self, eid):
+        event = self.state.schedule().get(eid)
+        if not event or event_state(event) != 'pre':
+            self.log(f"⏭  {eid} no longer scheduled — skipping prediction")
+            return
+        try:
+            game_data, row = self.state.predict(event, fresh=True)
+        except Exception as e:
+            self.log(f"⚠️  {eid} prediction failed: {e}")
+            oracle_metrics.inc('oracle_games_skipped', reason=type(e).__name__)
+            return
+        self.log(f"🎯 {row['matchup']}: {row['pick']} {row['conf']*100:.1f}% | {row['ou']} {row['total']:.0f}")
+        self.write([row])
+
+    def settle(self, eid):
+        event = self.state.schedule(force=True).get(eid)
+        if event and event_state(event) != 'post':
+            self.sched.enter(SETTLE_RETRY, 2, self.settle, (eid,))
+            return
+        self.settling.discard(eid)
+        from update_results import update_log
+        self.log(f"🏁 {eid} final — settling")
+        update_log()
+
+    def write(self, rows):
+        if rows:
+            nba.save_to_log(rows)
+            oracle_metrics.inc('oracle_games_predicted', len(rows))
+
+def run_daemon():
+    daemon = OracleDaemon()
+    try:
+        daemon.start()
+    except KeyboardInterrupt:
+        daemon.log("⏹  Stopped")
+
+if __name__ == '__main__':
+    run_daemon()
@@ -0,0 +1,448 @@
+"""
+oracle_http.py
+Shared HTTP helpers for the NBA Oracle scripts.
+One pooled session (keep-alive) for every ESPN / Odds API call, plus
+conditional GETs (ETag / Last-Modified) for pollers.
+requests is imported on the first call, so CLIs that never touch the
+network (--help, --import-profile, replaying checkpoints) start fast.
+ESPN_BASE_URL / ODDS_BASE_URL point every script at another host (e.g.
+the stand-in server in benchmarks/stub_server.py) for end-to-end runs.
+
+Every request first takes a token from its host's bucket (RATE_LIMITS).
+A 429 halves that host's rate and honours Retry-After; each success after
+that wins back a little until the configured rate is reached again.
+
+set_deadline() gives the run a wall-clock budget: every request's timeout
+is capped to what is left, and fetches are shed by priority ('low' first,
+then 'normal', 'critical' only when time is up) and recorded for the log.
+
+cached_get() adds two safety nets for model inputs: the last good payload
+of every URL is kept on disk (CACHE_DIR) and served, tagged with its age,
+when a fetch fails — a background refresh is kicked off at the same time —
+and a per-endpoint circuit breaker stops calling an endpoint after
+BREAKER_FAILURES failures in a row, trying again after BREAKER_COOLDOWN.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlparse
+
+ESPN_BASE_URL = os.environ.get('ESPN_BASE_URL', 'https://site.api.espn.com').rstrip('/')
+ODDS_BASE_URL = os.environ.get('ODDS_BASE_URL', 'https://api.the-odds-api.com').rstrip('/')
+ESPN_NBA_URL  = f"{ESPN_BASE_URL}/apis/site/v2/sports/basketball/nba"
+
+# host → (requests per second, burst); hosts not listed get DEFAULT_RATE.
+# ESPN comes last so it wins when both base URLs point at one stub host.
+RATE_LIMITS = {
+    urlparse(ODDS_BASE_URL).netloc: (2.0, 2),
+    urlparse(ESPN_BASE_URL).netloc: (20.0, 40),
+}
+DEFAULT_RATE     = (5.0, 10)
+MIN_RATE         = 0.2        # never back off below one request per 5s
+RECOVER_STEPS    = 20         # successes to climb from MIN_RATE back to the configured rate
+MAX_RETRY_AFTER  = 120        # cap on a server's Retry-After, seconds
+
+CACHE_DIR        = os.environ.get('ORACLE_CACHE_DIR', '.oracle_cache')
+STALE_MAX_AGE    = 7 * 24 * 3600   # older payloads are not worth serving
+REVALIDATE_AFTER = 5               # seconds before the background refresh of a failed URL
+BREAKER_FAILURES = 3
+BREAKER_COOLDOWN = 60
+
+# A fetch of each priority is shed once less than this share of the run
+# deadline is left (see set_deadline); DEADLINE_MARGIN is kept for wrapping up
+SHED_BELOW       = {'low': 0.5, 'normal': 0.15, 'critical': 0.0}
+DEADLINE_MARGIN  = 0.5
+
+_session = None
+_hooks = []          # fn(url, status, nbytes, latency_s, response=, error=) after every request
+
+def add_hook(fn):
+    """Observe every request (used by --profile)"""
+    _hooks.append(fn)
+
+_ID = re.compile(r'/\d+(?=/|$)')
+
+def endpoint(url):
+    """Host + path with numeric ids folded (query strings, incl. API keys, dropped)"""
+    u = urlparse(url)
+    return u.netloc + _ID.sub('/{id}', u.path)
+
+# ── RATE LIMITING ────────────────────────────────────────────────────────
+def retry_after_seconds(value, now=None):
+    """Retry-After as seconds — delta-seconds or an HTTP date; None if absent / unparseable"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    from email.utils import parsedate_to_datetime
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - (now or time.time()))
+    except (TypeError, ValueError):
+        return None
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with additive-increase / multiplicative-decrease.
+    reserve() books a token and says how long to wait for it, so async code
+    can `await asyncio.sleep(bucket.reserve())`; acquire() sleeps itself.
+    """
+
+    def __init__(self, rate, burst, clock=time.monotonic):
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.burst = burst
+        self.tokens = float(burst)
+        self.clock = clock
+        self.updated = clock()
+        self.blocked_until = 0.0
+        self.acquired = 0
+        self.throttled = 0
+        self.waited = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self):
+        with self._lock:
+            now = self.clock()
+            self._refill(now)
+            self.tokens -= 1
+            wait = max(-self.tokens / self.rate if self.tokens < 0 else 0.0, self.blocked_until - now)
+            self.acquired += 1
+            self.waited += wait
+            return wait
+
+    def acquire(self):
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def feedback(self, status, retry_after=None):
+        """Adapt to a response: back off on 429, creep back up on success"""
+        with self._lock:
+            now = self.clock()
+            if status == 429:
+                self._refill(now)
+                self.throttled += 1
+                self.rate = max(MIN_RATE, self.rate / 2)
+                self.tokens = min(self.tokens, 0.0)
+                if retry_after is not None:
+                    self.blocked_until = max(self.blocked_until, now + min(retry_after, MAX_RETRY_AFTER))
+            elif 200 <= status < 400 and self.rate < self.max_rate:
+                self._refill(now)
+                self.rate = min(self.max_rate, self.rate + (self.max_rate - MIN_RATE) / RECOVER_STEPS)
+
+    def state(self):
+        with self._lock:
+            self._refill(self.clock())
+            return {'rate': round(self.rate, 3), 'max_rate': self.max_rate, 'burst': self.burst,
+                    'tokens': round(self.tokens, 2), 'acquired': self.acquired,
+                    'throttled': self.throttled, 'waited_s': round(self.waited, 3)}
+
+_buckets = {}
+_registry_lock = threading.Lock()
+
+def limiter(host):
+    """The process-wide bucket for a host"""
+    with _registry_lock:
+        b = _buckets.get(host)
+        if b is None:
+            b = _buckets[host] = TokenBucket(*RATE_LIMITS.get(host, DEFAULT_RATE))
+        return b
+
+def rate_limit_state():
+    """host → bucket state, for --profile"""
+    with _registry_lock:
+        buckets = dict(_buckets)
+    return {host: b.state() for host, b in sorted(buckets.items())}
+
+# ── RUN DEADLINE ─────────────────────────────────────────────────────────
+class DeadlineExceeded(Exception):
+    pass
+
+_deadline = None      # {'budget', 'started', 'ends', 'shed': [...]} while a deadline is set
+_shed_local = threading.local()
+
+def set_deadline(seconds):
+    """Give the rest of the run `seconds` (None clears it)"""
+    global _deadline
+    now = time.monotonic()
+    _deadline = None if seconds is None else {'budget': seconds, 'started': now,
+                                              'ends': now + seconds, 'shed': []}
+
+def remaining():
+    """Seconds left before the run deadline, or None without one"""
+    return None if _deadline is None else _deadline['ends'] - time.monotonic()
+
+def should_shed(priority='normal'):
+    left = remaining()
+    return left is not None and (left <= DEADLINE_MARGIN or left < SHED_BELOW[priority] * _deadline['budget'])
+
+def shed(what, priority='normal'):
+    """Record a fetch (or a whole game) dropped to finish on time"""
+    if _deadline is not None:
+        with _registry_lock:
+            _deadline['shed'].append({'what': what, 'priority': priority,
+                                      'at_s': round(time.monotonic() - _deadline['started'], 1)})
+        _shed_local.count = shed_count() + 1
+
+def shed_count():
+    """Fetches shed so far by the calling thread — compare before / after a unit of work"""
+    return getattr(_shed_local, 'count', 0)
+
+def deadline_state():
+    """Budget, time left and everything shed — None when no deadline is set"""
+    if _deadline is None:
+        return None
+    with _registry_lock:
+        shed_list = list(_deadline['shed'])
+    return {'budget_s': _deadline['budget'], 'remaining_s': round(remaining(), 1), 'shed': shed_list}
+
+def _budget(timeout):
+    """Cap a timeout to the run deadline; DeadlineExceeded once it is (nearly) up"""
+    left = remaining()
+    if left is None:
+        return timeout
+    if left <= DEADLINE_MARGIN:
+        raise DeadlineExceeded(f"{_deadline['budget']}s run deadline reached")
+    return min(timeout, left - DEADLINE_MARGIN)
+
+# ── REQUESTS ─────────────────────────────────────────────────────────────
+def _get(url, timeout, headers=None):
+    """
+    Rate-limited session().get that reports to the hooks; status 0 = network
+    error. Never waits or runs past the run deadline (DeadlineExceeded).
+    """
+    _budget(timeout)
+    bucket = limiter(urlparse(url).netloc)
+    wait = bucket.reserve()
+    if wait > 0:
+        left = remaining()
+        if left is not None and wait >= left - DEADLINE_MARGIN:
+            raise DeadlineExceeded(f"rate limit wait {wait:.1f}s exceeds the run deadline")
+        time.sleep(wait)
+    timeout = _budget(timeout)
+    t = time.perf_counter()
+    try:
+        r = session().get(url, headers=headers, timeout=timeout)
+    except Exception as e:
+        for fn in _hooks:
+            fn(url, 0, 0, time.perf_counter() - t, error=type(e).__name__)
+        raise
+    bucket.feedback(r.status_code, retry_after_seconds(r.headers.get('Retry-After')))
+    for fn in _hooks:
+        fn(url, r.status_code, len(r.content), time.perf_counter() - t, response=r)
+    return r
+
+def session():
+    """Process-wide pooled session"""
+    global _session
+    if _session is None:
+        import requests
+        import requests.adapters
+        _session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=32)
+        _session.mount('https://', adapter)
+        _session.mount('http://', adapter)
+    return _session
+
+def _fetch_json(url, timeout):
+    """GET → parsed JSON, raising on any error. A 429 is retried once, after the limiter's back-off"""
+    r = _get(url, timeout)
+    if r.status_code == 429:
+        r = _get(url, timeout)
+    r.raise_for_status()
+    return r.json()
+
+def safe_get(url, timeout=10, priority='normal'):
+    """
+    GET → parsed JSON, or None on any error. Under a run deadline the fetch
+    is shed (and recorded) when too little time is left for its priority.
+    """
+    if should_shed(priority):
+        shed(urlparse(url).path, priority)
+        return None
+    try:
+        return _fetch_json(url, timeout)
+    except DeadlineExceeded:
+        shed(urlparse(url).path, priority)
+        return None
+    except Exception:
+        return None
+
+# ── CIRCUIT BREAKER ──────────────────────────────────────────────────────
+class CircuitBreaker:
+    """
+    closed → open after `failures` failures in a row; open → half-open once
+    `cooldown` has passed, letting one trial call through; that call closes
+    it again or reopens it for another cooldown.
+    """
+
+    def __init__(self, failures=BREAKER_FAILURES, cooldown=BREAKER_COOLDOWN, clock=time.monotonic):
+        self.threshold = failures
+        self.cooldown = cooldown
+        self.clock = clock
+        self.failures = 0
+        self.opened_at = None
+        self.trial = False
+        self.trips = 0
+        self.short_circuited = 0
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if not self.trial and self.clock() - self.opened_at >= self.cooldown:
+                self.trial = True           # half-open: this caller is the trial
+                return True
+            self.short_circuited += 1
+            return False
+
+    def record(self, ok):
+        with self._lock:
+            if ok:
+                self.failures, self.opened_at, self.trial = 0, None, False
+                return
+            self.failures += 1
+            if self.trial or (self.opened_at is None and self.failures >= self.threshold):
+                self.trips += self.opened_at is None
+                self.opened_at, self.trial = self.clock(), False
+
+    def state(self):
+        with self._lock:
+            status = 'closed' if self.opened_at is None else ('half-open' if self.trial else 'open')
+            return {'state': status, 'failures': self.failures, 'trips': self.trips,
+                    'short_circuited': self.short_circuited}
+
+_breakers = {}
+
+def breaker(ep):
+    """The process-wide breaker for an endpoint (see endpoint())"""
+    with _registry_lock:
+        b = _breakers.get(ep)
+        if b is None:
+            b = _breakers[ep] = CircuitBreaker()
+        return b
+
+def breaker_state():
+    """endpoint → breaker state, for every breaker that has tripped"""
+    with _registry_lock:
+        breakers = dict(_breakers)
+    return {ep: st for ep, b in sorted(breakers.items()) if (st := b.state())['trips']}
+
+# ── LAST-GOOD CACHE ──────────────────────────────────────────────────────
+def _cache_path(url):
+    u = urlparse(url)
+    query = urlencode([(k, v) for k, v in parse_qsl(u.query) if k.lower() != 'apikey'])
+    key = hashlib.sha1(f"{u.netloc}{u.path}?{query}".encode()).hexdigest()
+    return os.path.join(CACHE_DIR, key[:2], f"{key}.json")
+
+def load_last_good(url):
+    """→ (fetched_at epoch, payload) from the on-disk cache, or None"""
+    try:
+        with open(_cache_path(url)) as f:
+            entry = json.load(f)
+        return entry['fetched_at'], entry['data']
+    except (OSError, ValueError, KeyError):
+        return None
+
+def store_last_good(url, data):
+    path = _cache_path(url)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, 'w') as f:
+            json.dump({'url': endpoint(url), 'fetched_at': time.time(), 'data': data}, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass                            # a read-only checkout just loses the fallback
+
+_revalidating = set()
+
+def _revalidate(url, timeout):
+    """Refresh a URL in the background so the next caller gets a live copy"""
+    with _registry_lock:
+        if url in _revalidating:
+            return
+        _revalidating.add(url)
+
+    def run():
+        try:
+            time.sleep(REVALIDATE_AFTER)
+            br = breaker(endpoint(url))
+            if br.allow():
+                data = safe_get(url, timeout)
+                br.record(data is not None)
+                if data is not None:
+                    store_last_good(url, data)
+        finally:
+            with _registry_lock:
+                _revalidating.discard(url)
+    threading.Thread(target=run, daemon=True).start()
+
+def cached_get(url, timeout=10, priority='normal'):
+    """
+    safe_get with a fallback tier → (data, meta). meta['source'] is 'live',
+    'stale' (last good copy, meta['age_s'] old; refresh started) or 'none'.
+    A fetch shed for the run deadline goes straight to the fallback tier.
+    """
+    br = breaker(endpoint(url))
+    data = None
+    shedding = should_shed(priority)
+    if not shedding and br.allow():
+        try:
+            data = _fetch_json(url, timeout)
+            br.record(True)
+        except DeadlineExceeded:
+            shedding = True
+        except Exception:
+            br.record(False)
+    if shedding:
+        shed(urlparse(url).path, priority)
+    if data is not None:
+        store_last_good(url, data)
+        return data, {'source': 'live', 'age_s': 0}
+    hit = load_last_good(url)
+    if hit and time.time() - hit[0] <= STALE_MAX_AGE:
+        if not shedding:
+            _revalidate(url, timeout)
+        return hit[1], {'source': 'stale', 'age_s': round(time.time() - hit[0])}
+    return None, {'source': 'none', 'age_s': None}
+
+def conditional_get(url, validators=None, timeout=10):
+    """
+    GET with If-None-Match / If-Modified-Since from a previous response.
+    Returns (status, data, validators): status 304 → data is None (unchanged),
+    status 0 → network error.
+    """
+    validators = validators or {}
+    headers = {}
+    if validators.get('etag'):
+        headers['If-None-Match'] = validators['etag']
+    if validators.get('last_modified'):
+        headers['If-Modified-Since'] = validators['last_modified']
+    try:
+        r = _get(url, timeout, headers)
+    except Exception:
+        return 0, None, validators
+    if r.status_code == 304:
+        return 304, None, validators
+    try:
+        r.raise_for_status()
+        data = r.json()
+    except Exception:
+        return r.status_code, None, validators
+    return r.status_code, data, {
+        'etag': r.headers.get('ETag'),
+        'last_modified': r.headers.get('Last-Modified'),
+    }
@@ -0,0 +1,203 @@
+"""
+oracle_metrics.py
+OpenMetrics counters, gauges and histograms shared by nba_predictor.py,
+update_results.py, export_predictions.py and the local API.
+
+Recording is a dict update, so it is always on. Batch scripts wrap their
+work in job('name'): when ORACLE_METRICS_DIR is set, the job's metrics are
+written to <dir>/<job>.prom for node-exporter's textfile collector. Counters
+and histograms there are cumulative across runs (the totals are kept next to
+the .prom file), so rate() / increase() work over a run history. The API
+process serves the same registry live on GET /metrics.
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+import oracle_http
+
+METRICS_DIR_ENV = 'ORACLE_METRICS_DIR'
+ODDS_HOST       = urlparse(oracle_http.ODDS_BASE_URL).netloc
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+RUN_BUCKETS     = (1, 5, 15, 30, 60, 120, 300, 600)
+LAG_BUCKETS     = (6, 12, 24, 36, 48, 72, 168)        # hours
+
+# name → (type, help, buckets)
+METRICS = {
+    'oracle_run_duration_seconds':        ('histogram', 'Wall time of one job run', RUN_BUCKETS),
+    'oracle_last_run_timestamp_seconds':  ('gauge', 'Unix time the job last finished', None),
+    'oracle_last_run_success':            ('gauge', '1 if the last run finished without an exception', None),
+    'oracle_http_requests':               ('counter', 'HTTP requests by host and status class', None),
+    'oracle_http_errors':                 ('counter', 'Failed HTTP requests by host and kind (timeout, network, http)', None),
+    'oracle_http_request_duration_seconds': ('histogram', 'HTTP request latency', LATENCY_BUCKETS),
+    'oracle_http_rate_limit':             ('gauge', 'Current requests/second allowed by the host rate limiter', None),
+    'oracle_odds_quota_remaining':        ('gauge', 'Odds API requests left this month (x-requests-remaining)', None),
+    'oracle_odds_quota_used':             ('gauge', 'Odds API requests used this month (x-requests-used)', None),
+    'oracle_team_fetches':                ('counter', 'Team stats / form lookups', None),
+    'oracle_team_defaults':               ('counter', 'Team lookups that fell back to hard-coded defaults', None),
+    'oracle_team_stale':                  ('counter', 'Team lookups served from the last-good cache', None),
+    'oracle_games_degraded':              ('counter', 'Games predicted with a stale or defaulted input', None),
+    'oracle_fetches_shed':                ('counter', 'Fetches and games dropped to meet the run deadline', None),
+    'oracle_slate_games_per_second':      ('gauge', 'Bulk slate mode throughput of the last run, by league', None),
+    'oracle_games_predicted':             ('counter', 'Games predicted', None),
+    'oracle_games_skipped':               ('counter', 'Games dropped by the per-game exception handler', None),
+    'oracle_predictions_settled':         ('counter', 'Predictions settled, by result and league', None),
+    'oracle_predictions_pending':         ('gauge', 'Predictions still unsettled after the last settlement run, by league', None),
+    'oracle_settlement_lag_hours':        ('histogram', 'Hours from the game date to settlement', LAG_BUCKETS),
+    'oracle_export_days':                 ('gauge', 'Days in the exported dashboard history', None),
+    'oracle_export_accuracy_ratio':       ('gauge', 'Overall pick accuracy in the dashboard export', None),
+}
+
+_lock = threading.Lock()
+_values = {}         # (name, labels) → float, or [bucket counts..., sum, count] for histograms
+
+def _key(name, labels):
+    return name, tuple(sorted(labels.items()))
+
+def inc(name, value=1, **labels):
+    k = _key(name, labels)
+    with _lock:
+        _values[k] = _values.get(k, 0) + value
+
+def set_gauge(name, value, **labels):
+    with _lock:
+        _values[_key(name, labels)] = value
+
+def observe(name, value, **labels):
+    buckets = METRICS[name][2]
+    k = _key(name, labels)
+    with _lock:
+        h = _values.get(k)
+        if h is None:
+            h = _values[k] = [0] * (len(buckets) + 2)
+        for i, b in enumerate(buckets):
+            if value <= b:
+                h[i] += 1
+        h[-2] += value
+        h[-1] += 1
+
+def snapshot():
+    with _lock:
+        return {k: (list(v) if isinstance(v, list) else v) for k, v in _values.items()}
+
+# ── HTTP HOOK ────────────────────────────────────────────────────────────
+def _http(url, status, nbytes, latency, response=None, error=None):
+    host = urlparse(url).netloc
+    inc('oracle_http_requests', host=host, code=f"{status // 100}xx" if status else 'none')
+    observe('oracle_http_request_duration_seconds', latency, host=host)
+    set_gauge('oracle_http_rate_limit', oracle_http.limiter(host).rate, host=host)
+    if error:
+        inc('oracle_http_errors', host=host, kind='timeout' if 'Timeout' in error else 'network')
+    elif status >= 400:
+        inc('oracle_http_errors', host=host, kind='http')
+    if response is not None and host == ODDS_HOST:
+        for header, name in (('x-requests-remaining', 'oracle_odds_quota_remaining'),
+                             ('x-requests-used', 'oracle_odds_quota_used')):
+            try:
+                set_gauge(name, float(response.headers[header]))
+            except (KeyError, TypeError, ValueError):
+                pass
+
+oracle_http.add_hook(_http)
+
+# ── OPENMETRICS TEXT ─────────────────────────────────────────────────────
+def _fmt_labels(labels, extra=()):
+    items = list(labels) + list(extra)
+    if not items:
+        return ''
+    esc = lambda v: str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    return '{' + ','.join(f'{k}="{esc(v)}"' for k, v in items) + '}'
+
+def _num(v):
+    v = float(v)
+    return str(int(v)) if v.is_integer() else repr(v)
+
+def render(values=None, const_labels=(), openmetrics=True):
+    """
+    Text exposition of the registry (or a given snapshot). OpenMetrics for
+    /metrics; openmetrics=False gives the Prometheus 0.0.4 flavour node-exporter's
+    textfile collector parses (counter families named *_total, no # EOF).
+    """
+    values = snapshot() if values is None else values
+    by_name = {}
+    for (name, labels), v in values.items():
+        by_name.setdefault(name, []).append((labels, v))
+    lines = []
+    for name in sorted(by_name):
+        mtype, help_, buckets = METRICS[name]
+        family = name if openmetrics or mtype != 'counter' else f"{name}_total"
+        lines.append(f"# TYPE {family} {mtype}")
+        lines.append(f"# HELP {family} {help_}")
+        for labels, v in sorted(by_name[name]):
+            labels = tuple(const_labels) + labels
+            if mtype == 'counter':
+                lines.append(f"{name}_total{_fmt_labels(labels)} {_num(v)}")
+            elif mtype == 'gauge':
+                lines.append(f"{name}{_fmt_labels(labels)} {_num(v)}")
+            else:
+                for b, c in zip(buckets, v):
+                    lines.append(f"{name}_bucket{_fmt_labels(labels, [('le', _num(b))])} {c}")
+                lines.append(f"{name}_bucket{_fmt_labels(labels, [('le', '+Inf')])} {v[-1]}")
+                lines.append(f"{name}_sum{_fmt_labels(labels)} {_num(v[-2])}")
+                lines.append(f"{name}_count{_fmt_labels(labels)} {v[-1]}")
+    if openmetrics:
+        lines.append('# EOF')
+    return '\n'.join(lines) + '\n'
+
+# ── TEXTFILE ─────────────────────────────────────────────────────────────
+def _merge(previous, current):
+    """Cumulative counters / histograms; gauges take the latest value"""
+    out = dict(previous)
+    for k, v in current.items():
+        mtype = METRICS[k[0]][0]
+        old = out.get(k)
+        if mtype == 'counter' and old is not None:
+            out[k] = old + v
+        elif mtype == 'histogram' and old is not None:
+            out[k] = [a + b for a, b in zip(old, v)]
+        else:
+            out[k] = v
+    return out
+
+def write_textfile(job, directory=None):
+    directory = directory or os.environ.get(METRICS_DIR_ENV)
+    if not directory:
+        return None
+    os.makedirs(directory, exist_ok=True)
+    state_path = os.path.join(directory, f"{job}.state.json")
+    try:
+        with open(state_path) as f:
+            previous = {(n, tuple(map(tuple, l))): v for n, l, v in json.load(f)}
+    except (OSError, ValueError):
+        previous = {}
+    totals = _merge(previous, snapshot())
+    path = os.path.join(directory, f"{job}.prom")
+    for target, text in ((state_path, json.dumps([[n, l, v] for (n, l), v in totals.items()])),
+                         (path, render(totals, [('job', job)], openmetrics=False))):
+        tmp = target + '.tmp'
+        with open(tmp, 'w') as f:
+            f.write(text)
+        os.replace(tmp, target)   # the collector never sees a half-written file
+    return path
+
+def finish_job(name, started, ok=True):
+    """Record a batch run that started at perf_counter() == started, then write its textfile"""
+    observe('oracle_run_duration_seconds', time.perf_counter() - started)
+    set_gauge('oracle_last_run_timestamp_seconds', round(time.time()))
+    set_gauge('oracle_last_run_success', int(ok))
+    return write_textfile(name)
+
+@contextmanager
+def job(name):
+    """Time a batch run and write its textfile (if configured) on the way out"""
+    started = time.perf_counter()
+    ok = False
+    try:
+        yield
+        ok = True
+    finally:
+        finish_job(name, started, ok)
@@ -0,0 +1,186 @@
+"""
+oracle_profile.py
+Run profiling for the NBA Oracle scripts (--profile).
+Records wall and CPU time per stage and per game, every HTTP request
+(count, bytes, latency per endpoint), cache hits / misses and each host's
+rate limiter (current rate, 429s, time spent waiting). Everything
+is a no-op until start() is called, so unprofiled runs pay nothing.
+"""
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+import oracle_http
+from oracle_http import endpoint
+
+_active = None
+
+def start():
+    global _active
+    _active = Profile()
+    oracle_http.add_hook(_active.http)
+    return _active
+
+def active():
+    return _active
+
+def stage(name):
+    return _active.stage(name) if _active else nullcontext()
+
+def game(label):
+    return _active.game(label) if _active else nullcontext()
+
+def cache(kind, hit):
+    if _active:
+        _active.cache(kind, hit)
+
+# ── HELPERS ──────────────────────────────────────────────────────────────
+def percentile(sorted_vals, q):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_vals:
+        return None
+    k = max(0, min(len(sorted_vals) - 1, math.ceil(q * len(sorted_vals) / 100) - 1))
+    return sorted_vals[k]
+
+# ── PROFILE ──────────────────────────────────────────────────────────────
+class Profile:
+    def __init__(self):
+        self.t0 = (time.perf_counter(), time.process_time())
+        self.stages = {}       # name → {'calls', 'wall', 'cpu'}
+        self.games = []        # {'game', 'wall', 'cpu'}
+        self.requests = {}     # endpoint → {'count', 'errors', 'bytes', 'latency': [...]}
+        self.caches = {}       # kind → {'hits', 'misses'}
+        self._lock = threading.Lock()      # hooks fire from bulk slate and slate-fetch worker threads
+
+    @contextmanager
+    def _timed(self):
+        w, c = time.perf_counter(), time.process_time()
+        span = {}
+        try:
+            yield span
+        finally:
+            span['wall'] = time.perf_counter() - w
+            span['cpu'] = time.process_time() - c
+
+    @contextmanager
+    def stage(self, name):
+        with self._timed() as span:
+            yield
+        with self._lock:
+            s = self.stages.setdefault(name, {'calls': 0, 'wall': 0.0, 'cpu': 0.0})
+            s['calls'] += 1
+            s['wall'] += span['wall']
+            s['cpu'] += span['cpu']
+
+    @contextmanager
+    def game(self, label):
+        with self._timed() as span:
+            yield
+        with self._lock:
+            self.games.append({'game': label, 'wall': span['wall'], 'cpu': span['cpu']})
+
+    def http(self, url, status, nbytes, latency, response=None, error=None):
+        ep = endpoint(url)
+        with self._lock:
+            r = self.requests.setdefault(ep, {'count': 0, 'errors': 0, 'bytes': 0, 'latency': []})
+            r['count'] += 1
+            r['errors'] += not (200 <= status < 400)
+            r['bytes'] += nbytes
+            r['latency'].append(latency)
+
+    def cache(self, kind, hit):
+        with self._lock:
+            c = self.caches.setdefault(kind, {'hits': 0, 'misses': 0})
+            c['hits' if hit else 'misses'] += 1
+
+    # ── output ──
+    def summary(self):
+        wall = time.perf_counter() - self.t0[0]
+        cpu = time.process_time() - self.t0[1]
+        with self._lock:         # a background refresh can still be recording
+            reqs = {}
+            for ep, r in sorted(self.requests.items()):
+                lat = sorted(r['latency'])
+                reqs[ep] = {
+                    'count': r['count'], 'errors': r['errors'], 'bytes': r['bytes'],
+                    'p50_ms': round(percentile(lat, 50) * 1000, 1),
+                    'p90_ms': round(percentile(lat, 90) * 1000, 1),
+                    'p99_ms': round(percentile(lat, 99) * 1000, 1),
+                    'total_ms': round(sum(lat) * 1000, 1),
+                }
+            summary = {
+                'generated_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'wall_s': round(wall, 3),
+                'cpu_s': round(cpu, 3),
+                'stages': {k: {'calls': v['calls'], 'wall_s': round(v['wall'], 4), 'cpu_s': round(v['cpu'], 4)}
+                           for k, v in self.stages.items()},
+                'games': [{'game': g['game'], 'wall_s': round(g['wall'], 4), 'cpu_s': round(g['cpu'], 4)}
+                          for g in self.games],
+                'http': reqs,
+                'http_totals': {
+                    'requests': sum(r['count'] for r in self.requests.values()),
+                    'errors': sum(r['errors'] for r in self.requests.values()),
+                    'bytes': sum(r['bytes'] for r in self.requests.values()),
+                },
+                'cache': {k: dict(v) for k, v in self.caches.items()},
+            }
+        return dict(summary,
+                    rate_limits=oracle_http.rate_limit_state(),
+                    breakers=oracle_http.breaker_state(),
+                    deadline=oracle_http.deadline_state())
+
+    def write(self, path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(self.summary(), f, indent=2)
+
+    def print_report(self):
+        s = self.summary()
+        print()
+        print("═" * 70)
+        print(f"  ⏱  RUN PROFILE — {s['wall_s']:.2f}s wall, {s['cpu_s']:.2f}s CPU")
+        print("═" * 70)
+        print(f"  {'STAGE':<24} {'calls':>6} {'wall s':>9} {'cpu s':>9} {'% wall':>7}")
+        for name, st in sorted(s['stages'].items(), key=lambda kv: -kv[1]['wall_s']):
+            share = st['wall_s'] / s['wall_s'] * 100 if s['wall_s'] else 0
+            print(f"  {name:<24} {st['calls']:>6} {st['wall_s']:>9.3f} {st['cpu_s']:>9.3f} {share:>6.1f}%")
+        if s['games']:
+            print()
+            print(f"  {'GAME':<44} {'wall s':>9} {'cpu s':>9}")
+            for g in sorted(s['games'], key=lambda g: -g['wall_s']):
+                print(f"  {g['game'][:44]:<44} {g['wall_s']:>9.3f} {g['cpu_s']:>9.3f}")
+        if s['http']:
+            t = s['http_totals']
+            print()
+            print(f"  HTTP — {t['requests']} requests, {t['errors']} errors, {t['bytes']/1024:.0f} KiB")
+            print(f"  {'ENDPOINT':<44} {'n':>4} {'KiB':>6} {'p50':>6} {'p90':>6} {'p99':>6}")
+            for ep, r in sorted(s['http'].items(), key=lambda kv: -kv[1]['total_ms']):
+                print(f"  {ep[-44:]:<44} {r['count']:>4} {r['bytes']/1024:>6.0f} "
+                      f"{r['p50_ms']:>6.0f} {r['p90_ms']:>6.0f} {r['p99_ms']:>6.0f}")
+        if s['cache']:
+            print()
+            print("  CACHE  " + "  ".join(f"{k}: {v['hits']} hit / {v['misses']} miss"
+                                          for k, v in sorted(s['cache'].items())))
+        if s['rate_limits']:
+            print()
+            print(f"  {'RATE LIMIT':<32} {'req/s':>7} {'max':>6} {'taken':>6} {'429s':>5} {'waited s':>9}")
+            for host, b in s['rate_limits'].items():
+                print(f"  {host[-32:]:<32} {b['rate']:>7.2f} {b['max_rate']:>6.1f} {b['acquired']:>6} "
+                      f"{b['throttled']:>5} {b['waited_s']:>9.2f}")
+        if s['breakers']:
+            print()
+            print(f"  {'CIRCUIT BREAKER':<44} {'state':>9} {'trips':>6} {'skipped':>8}")
+            for ep, b in s['breakers'].items():
+                print(f"  {ep[-44:]:<44} {b['state']:>9} {b['trips']:>6} {b['short_circuited']:>8}")
+        if s['deadline']:
+            d = s['deadline']
+            shed = {}
+            for item in d['shed']:
+                shed[item['priority']] = shed.get(item['priority'], 0) + 1
+            print()
+            print(f"  DEADLINE {d['budget_s']:g}s  left {d['remaining_s']:.1f}s  shed " +
+                  (', '.join(f"{n} {p}" for p, n in sorted(shed.items())) or 'nothing'))
+        print("═" * 70)
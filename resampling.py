@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+NBA ORACLE — Bootstrap Confidence Intervals
+Resamples settled predictions to put error bars on hit rate, ROI and
+Brier score. Plain bootstrap resamples games; block bootstrap resamples
+whole dates, which keeps same-night correlation (shared refs, pace, lines).
+All resamples are drawn in one vectorized pass (chunked to bound memory),
+and a fixed seed keeps the dashboard export stable between runs.
+
+  python3 resampling.py --from 2026-02-22 --block
+"""
+
+import argparse
+
+import numpy as np
+
+from evaluate import load_settled, outcomes
+from log_store import LOG_FILE, load_log
+
+N_RESAMPLES = 5000
+ALPHA       = 0.05
+SEED        = 20260222
+MAX_CELLS   = 2_000_000   # resamples x units drawn per chunk (bounds memory)
+
+# ── CORE ─────────────────────────────────────────────────────────────────
+def _ratio_bootstrap(sums, counts, n_resamples, rng):
+    """
+    Bootstrap sum(sums)/sum(counts) over units (games or dates).
+    sums is (metrics, units); returns a (metrics, n_resamples) array.
+    Each resample is turned into a per-unit weight row with one bincount,
+    so every metric comes out of a single matrix product.
+    """
+    k = sums.shape[1]
+    out = np.empty((sums.shape[0], n_resamples))
+    X = np.vstack([sums, counts]).T            # (units, 2 * metrics)
+    m = sums.shape[0]
+    chunk = max(1, MAX_CELLS // max(k, 1))
+    for start in range(0, n_resamples, chunk):
+        stop = min(start + chunk, n_resamples)
+        c = stop - start
+        idx = rng.integers(0, k, size=(c, k)) + (np.arange(c) * k)[:, None]
+        W = np.bincount(idx.ravel(), minlength=c * k).reshape(c, k).astype(float)
+        agg = W @ X                              # (c, 2 * metrics)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            out[:, start:stop] = (agg[:, :m] / agg[:, m:]).T
+    return out
+
+def bootstrap_metrics(values, groups=None, n_resamples=N_RESAMPLES, alpha=ALPHA, seed=SEED):
+    """
+    values: {name: per-game array, NaN = not applicable}.
+    groups: optional per-game block labels (e.g. dates) for a block bootstrap.
+    Returns {name: {'estimate', 'lo', 'hi', 'n'}}.
+    """
+    names = list(values)
+    V = np.vstack([np.asarray(values[n], dtype=float) for n in names]) if names else np.zeros((0, 0))
+    valid = ~np.isnan(V)
+    sums = np.where(valid, V, 0.0)
+    counts = valid.astype(float)
+    if groups is not None and V.shape[1]:
+        _, inv = np.unique(np.asarray(groups), return_inverse=True)
+        n_blocks = inv.max() + 1
+        sums = np.vstack([np.bincount(inv, weights=row, minlength=n_blocks) for row in sums])
+        counts = np.vstack([np.bincount(inv, weights=row, minlength=n_blocks) for row in counts])
+
+    result = {}
+    if not V.shape[1]:
+        return {n: {'estimate': None, 'lo': None, 'hi': None, 'n': 0} for n in names}
+    rng = np.random.default_rng(seed)
+    draws = _ratio_bootstrap(sums, counts, n_resamples, rng)
+    for i, name in enumerate(names):
+        n = int(counts[i].sum())
+        if not n:
+            result[name] = {'estimate': None, 'lo': None, 'hi': None, 'n': 0}
+            continue
+        lo, hi = np.nanquantile(draws[i], [alpha / 2, 1 - alpha / 2])
+        result[name] = {
+            'estimate': float(sums[i].sum() / n),
+            'lo': float(lo), 'hi': float(hi), 'n': n,
+        }
+    return result
+
+def bootstrap_mean(values, **kw):
+    """Interval for the mean of a single array (e.g. one day's 1/0 hits)"""
+    return bootstrap_metrics({'mean': values}, **kw)['mean']
+
+# ── LOG SLICES ───────────────────────────────────────────────────────────
+def log_intervals(log=None, date_from=None, date_to=None, block=True, **kw):
+    """Hit-rate / ROI / Brier intervals over a slice of the predictions log"""
+    g = load_settled(log, date_from, date_to)
+    o = outcomes(g)
+    values = {
+        'ml_hit_rate': o['ml_hit'],
+        'ou_hit_rate': o['ou_hit'],
+        'ml_roi':      o['ml_profit'],
+        'ou_roi':      o['ou_profit'],
+        'brier':       (g['conf'] - o['ml_hit']) ** 2,
+    }
+    return bootstrap_metrics(values, groups=g['date'] if block else None, **kw)
+
+def as_percent(ci, digits=1):
+    """Round an interval to percentages for the dashboard export"""
+    if ci['estimate'] is None:
+        return {'pct': None, 'lo': None, 'hi': None, 'n': 0}
+    return {'pct': round(ci['estimate'] * 100, digits),
+            'lo': round(ci['lo'] * 100, digits),
+            'hi': round(ci['hi'] * 100, digits),
+            'n': ci['n']}
+
+# ── MAIN ─────────────────────────────────────────────────────────────────
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Bootstrap confidence intervals over the predictions log")
+    ap.add_argument('--from', dest='date_from')
+    ap.add_argument('--to', dest='date_to')
+    ap.add_argument('--block', action='store_true', help="resample whole dates instead of games")
+    ap.add_argument('--n', type=int, default=N_RESAMPLES, help=f"resamples (default {N_RESAMPLES})")
+    ap.add_argument('--log', default=LOG_FILE)
+    args = ap.parse_args(argv)
+
+    cis = log_intervals(load_log(args.log), args.date_from, args.date_to,
+                        block=args.block, n_resamples=args.n)
+    kind = "BLOCK (by date)" if args.block else "GAME"
+    print()
+    print("=" * 70)
+    print(f"  🎲  BOOTSTRAP 95% INTERVALS — {kind}, {args.n} resamples")
+    print("=" * 70)
+    for name, ci in cis.items():
+        if ci['estimate'] is None:
+            print(f"  {name:<12} —  (no data)")
+            continue
+        scale, unit = (1, '') if name == 'brier' else (100, '%')
+        print(f"  {name:<12} {ci['estimate']*scale:7.3f}{unit}   "
+              f"[{ci['lo']*scale:7.3f}{unit}, {ci['hi']*scale:7.3f}{unit}]   n={ci['n']}")
+    print("=" * 70)
+    print()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+NBA ORACLE — Bet Slip Tracker
+Stores bet slips with any number of legs and settles them in batch from the
+same cached finals update_results.py uses (the league's finals cache,
+nba_finals_cache.json unless a slip names another league), so settling
+hundreds of slips costs one scoreboard fetch per unfinished date, not per slip.
+
+Leg markets:
+  moneyline   side = team name
+  full_game   side = OVER/UNDER, line = game total
+  team_total  side = OVER/UNDER, line = team points, team = team name
+  first_half  side = OVER/UNDER, line = 1st-half total
+
+  python3 slips.py add slip.json        # one slip or a list of slips
+  python3 slips.py settle               # settle every pending slip
+  python3 slips.py report               # leg + slip P&L over time
+"""
+
+import argparse
+import json
+from datetime import datetime
+
+from leagues import LEAGUES, NBA
+from log_store import load_log, write_json
+from update_results import fetch_results_for_date, load_finals_cache
+
+SLIPS_FILE       = 'slips.json'
+MARKETS          = ('moneyline', 'full_game', 'team_total', 'first_half')
+DEFAULT_LEG_ODDS = 1.91     # decimal, ≈ -110
+DEFAULT_STAKE    = 100      # naira
+
+# ── BUILDING SLIPS ───────────────────────────────────────────────────────
+def make_leg(away, home, market, side, line=None, team=None, odds=None):
+    if market not in MARKETS:
+        raise ValueError(f"unknown market {market!r} (expected one of {', '.join(MARKETS)})")
+    if market != 'moneyline' and side.upper() not in ('OVER', 'UNDER'):
+        raise ValueError(f"{market} leg needs side OVER/UNDER, got {side!r}")
+    if market != 'moneyline' and line is None:
+        raise ValueError(f"{market} leg needs a line")
+    leg = {'away': away, 'home': home, 'market': market,
+           'side': side if market == 'moneyline' else side.upper()}
+    if line is not None:
+        leg['line'] = float(line)
+    if team:
+        leg['team'] = team
+    if odds is not None:
+        leg['odds'] = float(odds)
+    leg['result'] = 'pending'
+    return leg
+
+def make_slip(date, legs, stake=DEFAULT_STAKE, book='SportyBet', odds=None, slip_id=None, league='nba'):
+    if league not in LEAGUES:
+        raise ValueError(f"unknown league {league!r} (expected one of {', '.join(LEAGUES)})")
+    slip = {'id': slip_id, 'date': date, 'book': book, 'stake': stake,
+            'legs': legs, 'status': 'pending'}
+    if odds is not None:
+        slip['odds'] = float(odds)
+    if league != 'nba':
+        slip['league'] = league
+    return slip
+
+def load_slips(path=SLIPS_FILE):
+    return load_log(path)
+
+def save_slips(slips, path=SLIPS_FILE):
+    return write_json(path, sorted(slips, key=lambda s: (s.get('date', ''), s.get('id') or '')))
+
+def add_slips(new, slips):
+    """Append slips, assigning ids like 2026-02-24-1"""
+    for slip in new:
+        if not slip.get('id'):
+            n = sum(1 for s in slips if s.get('date') == slip['date']) + 1
+            slip['id'] = f"{slip['date']}-{n}"
+        slips.append(slip)
+    return slips
+
+# ── SETTLEMENT ───────────────────────────────────────────────────────────
+def team_key(name):
+    """Nickname key — 'OKC Thunder' and 'Oklahoma City Thunder' both → 'thunder'"""
+    return name.lower().replace('trail blazers', 'blazers').split()[-1]
+
+def index_finals(finals):
+    idx = {}
+    for game in finals.values():
+        idx[(team_key(game['away_team']), team_key(game['home_team']))] = game
+    return idx
+
+def find_final(leg, idx):
+    a, h = team_key(leg['away']), team_key(leg['home'])
+    return idx.get((a, h)) or idx.get((h, a))
+
+def settle_leg(leg, game, league=NBA):
+    """Returns (result, actual) — result is hit / miss / push"""
+    market = leg['market']
+    if market == 'moneyline':
+        home_side = team_key(leg['side']) == team_key(game['home_team'])
+        winner_home = game['home_score'] > game['away_score']
+        return ('hit' if home_side == winner_home else 'miss'), game['home_score'] - game['away_score']
+
+    if market == 'full_game':
+        actual = game['total']
+    elif market == 'team_total':
+        home_side = team_key(leg.get('team') or leg['home']) == team_key(game['home_team'])
+        actual = game['home_score'] if home_side else game['away_score']
+    else:  # first_half — Q1+Q2 in quarter leagues, H1 in college men's halves
+        hp, ap = game.get('home_periods') or [], game.get('away_periods') or []
+        n = league['periods'] // 2
+        if len(hp) < n or len(ap) < n:
+            return 'pending', None
+        actual = sum(hp[:n]) + sum(ap[:n])
+
+    if actual == leg['line']:
+        return 'push', actual
+    over = actual > leg['line']
+    return ('hit' if over == (leg['side'] == 'OVER') else 'miss'), actual
+
+def leg_pnl(leg):
+    """Profit per unit staked on the leg as a single"""
+    return {'hit': leg.get('odds', DEFAULT_LEG_ODDS) - 1, 'miss': -1.0}.get(leg['result'], 0.0)
+
+def grade_slip(slip):
+    """Slip status and P&L from its legs (pushed legs drop out of the parlay)"""
+    results = [leg['result'] for leg in slip['legs']]
+    stake = slip.get('stake', DEFAULT_STAKE)
+    if 'miss' in results:
+        slip['status'], slip['pnl'] = 'lost', -stake
+    elif 'pending' in results:
+        slip['status'] = 'pending'
+        slip.pop('pnl', None)
+    elif all(r == 'push' for r in results):
+        slip['status'], slip['pnl'] = 'void', 0
+    else:
+        if slip.get('odds') and 'push' not in results:
+            price = slip['odds']
+        else:
+            price = 1.0
+            for leg in slip['legs']:
+                if leg['result'] == 'hit':
+                    price *= leg.get('odds', DEFAULT_LEG_ODDS)
+        slip['status'], slip['pnl'] = 'won', round(stake * price - stake, 2)
+    return slip
+
+def settle_slips(slips, cache=None):
+    """
+    Settle every pending leg in one pass. Finals are loaded once per league
+    and date (from the cache when the day is complete) and shared by all
+    slips. `cache` is the NBA finals cache; other leagues load their own.
+    """
+    pending = sorted({(s.get('league', 'nba'), s['date']) for s in slips if s.get('status') == 'pending'})
+    caches = {'nba': cache} if cache is not None else {}
+    indexes = {}
+    for key, date in pending:
+        league = LEAGUES[key]
+        if key not in caches:
+            caches[key] = load_finals_cache(league['finals'])
+        indexes[key, date] = index_finals(fetch_results_for_date(date, caches[key], save=False, league=league))
+    for key in {key for key, _ in pending}:
+        write_json(LEAGUES[key]['finals'], caches[key])
+
+    settled = 0
+    for slip in slips:
+        if slip.get('status') != 'pending':
+            continue
+        league = LEAGUES[slip.get('league', 'nba')]
+        idx = indexes.get((league['key'], slip['date']), {})
+        for leg in slip['legs']:
+            if leg.get('result') != 'pending':
+                continue
+            game = find_final(leg, idx)
+            if not game:
+                continue
+            leg['result'], leg['actual'] = settle_leg(leg, game, league)
+            leg['pnl'] = round(leg_pnl(leg), 3)
+            settled += leg['result'] != 'pending'
+        grade_slip(slip)
+    return settled
+
+# ── REPORT ───────────────────────────────────────────────────────────────
+def _short(leg):
+    return f"{leg['away'].split()[-1]} @ {leg['home'].split()[-1]}"
+
+def _bet(leg):
+    if leg['market'] == 'moneyline':
+        return f"ML {leg['side'].split()[-1]}"
+    who = f"{leg['team'].split()[-1]} " if leg['market'] == 'team_total' else ''
+    tag = {'full_game': 'FG', 'team_total': 'TT', 'first_half': '1H'}[leg['market']]
+    return f"{tag} {who}{leg['side']} {leg['line']}"
+
+def print_slip(slip):
+    icon = {'won': '✅', 'lost': '❌', 'void': '➖'}.get(slip['status'], '⏳')
+    pnl = f"{slip['pnl']:+,.0f}" if 'pnl' in slip else '—'
+    print(f"  {icon} SLIP {slip['id']}  {slip.get('book', '')}  stake {slip.get('stake', DEFAULT_STAKE)}  "
+          f"→ {slip['status'].upper()}  P&L {pnl}")
+    for leg in slip['legs']:
+        li = {'hit': '✅', 'miss': '❌', 'push': '➖'}.get(leg['result'], '⏳')
+        actual = f"actual {leg['actual']}" if leg.get('actual') is not None else 'no result yet'
+        print(f"     {li} {_short(leg):<26} {_bet(leg):<28} | {actual}")
+    print()
+
+def print_report(slips):
+    print()
+    print("=" * 65)
+    print("  🎟️  BET SLIP TRACKER")
+    print("=" * 65)
+    print()
+    for slip in slips:
+        print_slip(slip)
+
+    graded = [s for s in slips if s['status'] in ('won', 'lost', 'void')]
+    legs = [leg for s in slips for leg in s['legs'] if leg['result'] in ('hit', 'miss', 'push')]
+    print("=" * 65)
+    if not graded and not legs:
+        print("  ⏳ No settled slips yet")
+        print("=" * 65)
+        print()
+        return
+
+    staked = sum(s.get('stake', DEFAULT_STAKE) for s in graded if s['status'] != 'void')
+    profit = sum(s.get('pnl', 0) for s in graded)
+    won = sum(s['status'] == 'won' for s in graded)
+    print(f"  📊  SLIPS: {won}/{len(graded)} won | staked {staked:,} | P&L {profit:+,.0f}"
+          + (f" ({profit/staked*100:+.1f}% ROI)" if staked else ""))
+
+    print("  📈  LEGS BY MARKET (1 unit singles):")
+    for market in MARKETS:
+        ml = [leg for leg in legs if leg['market'] == market]
+        if not ml:
+            continue
+        hits = sum(leg['result'] == 'hit' for leg in ml)
+        decided = sum(leg['result'] != 'push' for leg in ml)
+        units = sum(leg_pnl(leg) for leg in ml)
+        print(f"     {market:<11} {hits}/{decided} hit | {units:+.2f}u")
+
+    print("  📅  P&L OVER TIME:")
+    running = 0
+    for date in sorted({s['date'] for s in graded}):
+        day = sum(s.get('pnl', 0) for s in graded if s['date'] == date)
+        running += day
+        print(f"     {date}  {day:+8,.0f}   cumulative {running:+,.0f}")
+    print("=" * 65)
+    print()
+
+# ── MAIN ─────────────────────────────────────────────────────────────────
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Store and settle bet slips")
+    sub = ap.add_subparsers(dest='cmd', required=True)
+    a = sub.add_parser('add', help="add slip(s) from a JSON file")
+    a.add_argument('file')
+    sub.add_parser('settle', help="settle pending slips from cached finals")
+    sub.add_parser('report', help="print slips and P&L")
+    ap.add_argument('--slips', default=SLIPS_FILE)
+    args = ap.parse_args(argv)
+
+    slips = load_slips(args.slips)
+    if args.cmd == 'add':
+        with open(args.file) as f:
+            raw = json.load(f)
+        new = []
+        for s in (raw if isinstance(raw, list) else [raw]):
+            legs = [make_leg(l['away'], l['home'], l['market'], l['side'], l.get('line'),
+                             l.get('team'), l.get('odds')) for l in s['legs']]
+            new.append(make_slip(s.get('date') or datetime.now().strftime('%Y-%m-%d'), legs,
+                                 s.get('stake', DEFAULT_STAKE), s.get('book', 'SportyBet'), s.get('odds'),
+                                 league=s.get('league', 'nba')))
+        add_slips(new, slips)
+        save_slips(slips, args.slips)
+        print(f"✅ Added {len(new)} slip(s) to {args.slips}")
+    elif args.cmd == 'settle':
+        n = settle_slips(slips)
+        save_slips(slips, args.slips)
+        print(f"✅ Settled {n} legs across {len(slips)} slips")
+        print_report(slips)
+    else:
+        print_report(slips)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Opponent-adjusted ratings (adjusted_efficiency.py): the bincount ridge
+solver and the fit on games generated from known team strengths.
+"""
+import numpy as np
+import pytest
+
+from adjusted_efficiency import Ratings, _ridge
+from leagues import NBA
+
+PACE = NBA['stats']['pace']       # possessions when a game has no box score
+
+def test_ridge_matches_dense_solve():
+    rng = np.random.default_rng(7)
+    rows, size, free, ridge = 200, 12, 2, 1.5
+    cols = np.stack([np.zeros(rows, dtype=int), np.ones(rows, dtype=int),
+                     rng.integers(2, size, rows), rng.integers(2, size, rows)], axis=1)
+    vals = rng.normal(size=(rows, 4))
+    y = rng.normal(size=rows)
+    X = np.zeros((rows, size))
+    for j in range(4):
+        np.add.at(X, (np.arange(rows), cols[:, j]), vals[:, j])
+    penalty = np.diag([0.0] * free + [ridge] * (size - free))
+    expected = np.linalg.solve(X.T @ X + penalty, X.T @ y)
+    assert _ridge(cols, vals, y, size, free, ridge) == pytest.approx(expected)
+
+def _season(off, dfn, mean=110.0, home=2.0):
+    """Double round robin with every score exactly mean + off[team] + def[opponent] ± home per 100"""
+    games, n = [], len(off)
+    for h in range(n):
+        for a in range(n):
+            if h != a:
+                games.append({
+                    'date': '2026-01-01', 'home_id': str(h), 'away_id': str(a),
+                    'home_score': (mean + off[h] + dfn[a] + home) * PACE / 100,
+                    'away_score': (mean + off[a] + dfn[h] - home) * PACE / 100,
+                })
+    return games
+
+def test_recovers_planted_ratings():
+    off = np.array([6.0, 2.0, -1.0, -3.0, -4.0])
+    dfn = np.array([-5.0, 1.0, 3.0, -2.0, 3.0])
+    r = Ratings(_season(off, dfn), NBA, ridge=1e-9)
+    assert r.mean == pytest.approx(110.0)
+    assert r.home_adv == pytest.approx(2.0)
+    assert [r.team(str(i))['ortg'] for i in range(5)] == pytest.approx(110.0 + off)
+    assert [r.team(str(i))['drtg'] for i in range(5)] == pytest.approx(110.0 + dfn)
+    assert r.team('0')['pace'] == pytest.approx(PACE)
+    assert r.team('99') is None
+
+def test_ridge_shrinks_toward_average():
+    off = np.array([6.0, 2.0, -1.0, -3.0, -4.0])
+    dfn = np.zeros(5)
+    loose = Ratings(_season(off, dfn), NBA, ridge=1e-9)
+    tight = Ratings(_season(off, dfn), NBA, ridge=50.0)
+    spread = lambda r: np.ptp(r.ortg)
+    assert 0 < spread(tight) < spread(loose)
+
+def test_predict_is_symmetric_on_a_neutral_floor():
+    off = np.array([4.0, -4.0, 0.0])
+    dfn = np.array([0.0, 0.0, 0.0])
+    r = Ratings(_season(off, dfn), NBA, ridge=1e-9)
+    ab, ba = r.predict('0', '1', neutral=True), r.predict('1', '0', neutral=True)
+    assert ab['margin'] == pytest.approx(-ba['margin'])
+    assert ab['margin'] == pytest.approx(8.0 * PACE / 100)
+    assert r.predict('0', '1')['margin'] == pytest.approx(ab['margin'] + 4.0 * PACE / 100)
+    assert r.predict('0', 'nobody') is None
@@ -0,0 +1,154 @@
+"""
+Elo rating math (elo_ratings.py) and the catch-up walk that feeds it from
+settlement (update_results.update_elo). Offline: the scoreboard is faked
+and every file is written under a temporary working directory.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+import elo_ratings
+import update_results
+from leagues import NBA
+
+PARAMS = NBA['elo']
+
+# ── MODEL ────────────────────────────────────────────────────────────────
+def test_expected_is_symmetric():
+    assert elo_ratings.expected(0) == pytest.approx(0.5)
+    assert elo_ratings.expected(150) + elo_ratings.expected(-150) == pytest.approx(1.0)
+    assert elo_ratings.expected(400) == pytest.approx(10 / 11)
+
+def test_game_delta_signs_and_margin():
+    win = elo_ratings.game_delta(1500, 1500, 110, 100, PARAMS)
+    loss = elo_ratings.game_delta(1500, 1500, 100, 110, PARAMS)
+    blowout = elo_ratings.game_delta(1500, 1500, 130, 100, PARAMS)
+    assert win > 0 > loss
+    assert blowout > win
+    # Home court makes a home win less of a surprise than an away one
+    assert win < -loss
+
+def test_favourite_blowout_counts_less():
+    fav = elo_ratings.game_delta(1700, 1400, 130, 100, PARAMS)
+    even = elo_ratings.game_delta(1500, 1500, 130, 100, PARAMS)
+    assert 0 < fav < even
+
+def test_apply_is_zero_sum():
+    book = elo_ratings.EloBook(NBA)
+    rec = book.apply('2026-01-05', 'g1', 'A', 'B', 120, 101)
+    assert book.rating('A') + book.rating('B') == pytest.approx(2 * elo_ratings.MEAN)
+    assert rec['elo'] == [elo_ratings.MEAN, elo_ratings.MEAN]
+    assert book.rating('A') - elo_ratings.MEAN == pytest.approx(rec['delta'], abs=1e-3)
+    assert book.rating('C') is None
+
+def test_new_season_regresses_toward_mean():
+    book = elo_ratings.EloBook(NBA)
+    for i in range(10):
+        book.apply('2026-01-05', f"g{i}", 'A', 'B', 120, 100)
+    before = book.rating('A')
+    book.apply('2026-11-01', 'next', 'C', 'D', 100, 99)      # first game of the next season
+    after = book.rating('A')
+    assert after - elo_ratings.MEAN == pytest.approx(PARAMS['carry'] * (before - elo_ratings.MEAN))
+
+def test_replay_matches_incremental(tmp_path):
+    path = str(tmp_path / 'history.jsonl')
+    book = elo_ratings.EloBook(NBA)
+    for d in range(1, 6):
+        day = f"2026-01-0{d}"
+        finals = [_final(f"{d}-{i}", str(i), str(i + 5), 100 + 3 * i + d, 101 + d) for i in range(5)]
+        elo_ratings.record_finals(book, day, finals, complete=True, path=path)
+    assert book.through == '2026-01-05'
+    rebuilt = elo_ratings.replay(NBA, elo_ratings.read_history('nba', path))
+    for t in book.teams:
+        assert rebuilt.rating(t) == pytest.approx(book.rating(t))
+    # Recording the same finals again applies nothing
+    assert elo_ratings.record_finals(book, '2026-01-05', finals, complete=True, path=path) == 0
+    assert elo_ratings.ratings_on(NBA, '2026-01-03', path).keys() <= set(book.teams)
+
+# ── CATCH-UP WALK ────────────────────────────────────────────────────────
+def _final(game_id, home, away, home_pts, away_pts):
+    return {'game_id': game_id, 'home_id': home, 'away_id': away,
+            'home_score': home_pts, 'away_score': away_pts}
+
+def _event(game_id, home, away, home_pts, away_pts):
+    team = lambda tid, pts: {'score': str(pts), 'team': {'id': tid, 'displayName': f"Team {tid}"}}
+    return {'id': game_id,
+            'status': {'type': {'name': 'STATUS_FINAL', 'state': 'post', 'completed': True}},
+            'competitions': [{'competitors': [team(home, home_pts), team(away, away_pts)]}]}
+
+class FakeScoreboard:
+    """safe_get stand-in: {YYYYMMDD: events}; days in `down` fail like a dead fetch"""
+
+    def __init__(self, days):
+        self.days = days
+        self.down = set()
+
+    def __call__(self, url, *args, **kwargs):
+        day = url.split('dates=')[1][:8]
+        if day in self.down:
+            return None
+        return {'events': self.days.get(day, [])}
+
+@pytest.fixture
+def walk(tmp_path, monkeypatch):
+    """Four days of NBA finals ending yesterday, with the ratings current through the day before"""
+    monkeypatch.chdir(tmp_path)
+    today = datetime.now().date()
+    days = [today - timedelta(days=k) for k in (4, 3, 2, 1)]
+    board = FakeScoreboard({
+        d.strftime('%Y%m%d'): [_event(f"{d}-{i}", str(i), str(i + 4), 104 + 5 * i, 100 + (d.day % 7))
+                               for i in range(4)]
+        for d in days
+    })
+    monkeypatch.setattr(update_results, 'safe_get', board)
+    # save() skips books without teams, so write the starting point directly
+    with open(elo_ratings.RATINGS_FILE, 'w') as f:
+        f.write('{"nba":{"season":null,"through":"%s","teams":[],"ratings":[],"games":[]}}\n'
+                % (days[0] - timedelta(days=1)).isoformat())
+    return board, [d.isoformat() for d in days]
+
+def _history_days():
+    return sorted({r['date'] for r in elo_ratings.read_history('nba')})
+
+def test_failed_day_holds_through_and_is_retried(walk):
+    board, days = walk
+    board.down.add(days[1].replace('-', ''))
+
+    update_results.update_elo(update_results.load_finals_cache(NBA['finals']))
+    book = elo_ratings.load()['nba']
+    assert book.through == days[0]                      # stops before the gap
+    assert _history_days() == [days[0], days[2], days[3]]
+
+    board.down.clear()
+    update_results.update_elo(update_results.load_finals_cache(NBA['finals']))
+    book = elo_ratings.load()['nba']
+    assert _history_days() == days
+    assert len(elo_ratings.read_history('nba')) == 16
+    assert book.through == days[3]
+
+    # The gap was filled after later days: ratings equal an in-order replay
+    replayed = elo_ratings.replay(NBA, elo_ratings.read_history('nba'))
+    for t in book.teams:
+        assert book.rating(t) == pytest.approx(replayed.rating(t), abs=0.01)
+
+def test_unfinished_day_holds_through(walk):
+    board, days = walk
+    key = days[2].replace('-', '')
+    board.days[key][0]['status']['type'].update(name='STATUS_IN_PROGRESS', state='in', completed=False)
+
+    update_results.update_elo(update_results.load_finals_cache(NBA['finals']))
+    assert elo_ratings.load()['nba'].through == days[1]
+
+    board.days[key][0]['status']['type'].update(name='STATUS_FINAL', state='post', completed=True)
+    update_results.update_elo(update_results.load_finals_cache(NBA['finals']))
+    assert elo_ratings.load()['nba'].through == days[3]
+    assert len(elo_ratings.read_history('nba')) == 16
+
+def test_postponed_game_does_not_hold_through(walk):
+    board, days = walk
+    board.days[days[2].replace('-', '')][0]['status']['type'].update(
+        name='STATUS_POSTPONED', state='post', completed=False)
+
+    update_results.update_elo(update_results.load_finals_cache(NBA['finals']))
+    assert elo_ratings.load()['nba'].through == days[3]
+    assert len(elo_ratings.read_history('nba')) == 15
@@ -0,0 +1,84 @@
+"""
+Possessions, efficiency and Four Factors from box totals (four_factors.py),
+checked against sums worked out by hand.
+"""
+from datetime import date
+
+import pytest
+
+from four_factors import FT_WEIGHT, BoxTable, has_full_box, possessions
+from leagues import NBA
+
+def _box(fgm, fga, fg3m, ftm, fta, orb, drb, tov):
+    return {'fgm': fgm, 'fga': fga, 'fg3m': fg3m, 'fg3a': fg3m * 3, 'ftm': ftm, 'fta': fta,
+            'orb': orb, 'drb': drb, 'ast': 20, 'tov': tov, 'stl': 7, 'blk': 4}
+
+def _game(day, home, away, home_score, away_score, home_box, away_box, periods=4):
+    g = {'date': day, 'home_id': home, 'away_id': away, 'home_score': home_score,
+         'away_score': away_score, 'periods': periods}
+    g.update({f'home_{k}': v for k, v in home_box.items()})
+    g.update({f'away_{k}': v for k, v in away_box.items()})
+    return g
+
+BOX_A1 = _box(40, 85, 12, 18, 24, 10, 34, 12)
+BOX_B1 = _box(38, 90, 10, 15, 20, 12, 30, 14)
+BOX_A2 = _box(42, 88, 15, 20, 25, 9, 33, 11)
+BOX_C2 = _box(37, 86, 11, 17, 22, 11, 31, 15)
+
+GAMES = [
+    _game('2026-01-01', 'A', 'B', 110, 101, BOX_A1, BOX_B1),
+    _game('2026-01-03', 'C', 'A', 99, 119, BOX_C2, BOX_A2, periods=5),
+]
+
+def _poss(a, b):
+    side = lambda x: x['fga'] - x['orb'] + x['tov'] + FT_WEIGHT * x['fta']
+    return (side(a) + side(b)) / 2
+
+def test_possessions_formula_and_fallback():
+    poss = possessions(GAMES, NBA)
+    assert poss == pytest.approx([_poss(BOX_A1, BOX_B1), _poss(BOX_A2, BOX_C2)])
+    bare = [{'home_score': 100, 'away_score': 98, 'periods': 5}]
+    assert possessions(bare, NBA) == pytest.approx([NBA['stats']['pace'] * 53 / 48])
+
+def test_season_to_date_ratios():
+    t = BoxTable(GAMES, NBA)
+    f = t.features('A', date(2026, 1, 4))
+    p1, p2 = _poss(BOX_A1, BOX_B1), _poss(BOX_A2, BOX_C2)
+    assert f['games'] == 2
+    assert f['ppg'] == pytest.approx((110 + 119) / 2)
+    assert f['ortg'] == pytest.approx(100 * (110 + 119) / (p1 + p2))
+    assert f['drtg'] == pytest.approx(100 * (101 + 99) / (p1 + p2))
+    assert f['pace'] == pytest.approx((p1 + p2) * 48 / (48 + 53))       # second game went to overtime
+    assert f['efg'] == pytest.approx((40 + 42 + 0.5 * (12 + 15)) / (85 + 88))
+    assert f['tov_pct'] == pytest.approx((12 + 11) / (85 + 88 + FT_WEIGHT * (24 + 25) + 12 + 11))
+    assert f['orb_pct'] == pytest.approx((10 + 9) / (10 + 9 + 30 + 31))
+    assert f['drb_pct'] == pytest.approx((34 + 33) / (34 + 33 + 12 + 11))
+    assert f['opp_efg'] == pytest.approx((38 + 37 + 0.5 * (10 + 11)) / (90 + 86))
+    assert f['ft_rate'] == pytest.approx((18 + 20) / (85 + 88))
+
+def test_as_of_excludes_games_on_the_day():
+    t = BoxTable(GAMES, NBA)
+    assert t.features('A', date(2026, 1, 1)) is None
+    assert t.features('A', date(2026, 1, 3))['games'] == 1
+    assert t.features('A', date(2026, 1, 3))['ortg'] == pytest.approx(100 * 110 / _poss(BOX_A1, BOX_B1))
+    assert t.features('Z', date(2026, 1, 4)) is None
+
+def test_factor_skips_games_missing_an_input():
+    games = [dict(g) for g in GAMES]
+    for key in ('home_orb', 'away_orb', 'home_drb', 'away_drb'):
+        games[1][key] = None                # scoreboard-only box: no rebounds
+    t = BoxTable(games, NBA)
+    f = t.features('A', date(2026, 1, 4))
+    assert f['orb_pct'] == pytest.approx(10 / (10 + 30))
+    assert f['efg'] == pytest.approx((40 + 42 + 0.5 * (12 + 15)) / (85 + 88))
+    assert f['orb'] == pytest.approx(10)
+    assert f['box_games'] == 1
+    c = t.features('C', date(2026, 1, 4))
+    assert 'orb_pct' not in c and 'drb_pct' not in c         # NaN left out
+    assert not has_full_box(c)
+    assert has_full_box(f)
+
+def test_empty_log():
+    t = BoxTable([], NBA)
+    assert len(t) == 0
+    assert t.features('A', date(2026, 1, 4)) is None
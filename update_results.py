@@ -2,49 +2,96 @@
 update_results.py
 Run this after nba_predictor.py to backfill actual scores into the predictions log.
 The dashboard reads from this log to show hit/miss history.
+
+Each league settles its own log (league['log']) from its own scoreboard,
+through its own finals cache (league['finals']):
+
+  python3 update_results.py                     # every league with a log
+  python3 update_results.py --league ncaab
 """
-import requests
+import argparse
 import json
 import os
 from datetime import datetime, timedelta
 
-LOG_FILE = 'nba_predictions_log.json'
-
-def fetch_results_for_date(date_str):
-    """Fetch ESPN NBA results for a given date YYYY-MM-DD"""
-    date_clean = date_str.replace('-', '')
-    url = f"https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard?dates={date_clean}"
+import elo_ratings
+import oracle_metrics
+from leagues import NBA, parse_leagues, scoreboard_url, season_start
+from log_store import load_log, save_log, write_json
+from oracle_http import safe_get
+from warehouse import is_void
+
+FINALS_CACHE = NBA['finals']
+
+def _periods(competitor):
+    return [int(float(ls.get('value', 0) or 0)) for ls in competitor.get('linescores', [])]
+
+def parse_finals(events):
+    """Final games from a scoreboard payload, keyed "Away @ Home" """
+    results = {}
+    for e in events:
+        comp = e['competitions'][0]
+        home = comp['competitors'][0]
+        away = comp['competitors'][1]
+        status = e['status']['type']['state']
+        if status != 'post' or is_void(e):
+            continue
+        h_score = int(home.get('score', 0) or 0)
+        a_score = int(away.get('score', 0) or 0)
+        home_name = home['team']['displayName']
+        away_name = away['team']['displayName']
+        total = h_score + a_score
+        # Store by both team names for fuzzy matching
+        key = f"{away_name} @ {home_name}"
+        results[key] = {
+            'game_id': str(e.get('id', '')),
+            'home_id': str(home['team'].get('id', '')),
+            'away_id': str(away['team'].get('id', '')),
+            'home_team': home_name,
+            'away_team': away_name,
+            'home_score': h_score,
+            'away_score': a_score,
+            'total': total,
+            'home_won': h_score > a_score,
+            'home_periods': _periods(home),
+            'away_periods': _periods(away),
+        }
+    return results
+
+def load_finals_cache(path=FINALS_CACHE):
     try:
-        r = requests.get(url, timeout=10)
-        events = r.json().get('events', [])
-        results = {}
-        for e in events:
-            comp = e['competitions'][0]
-            home = comp['competitors'][0]
-            away = comp['competitors'][1]
-            status = e['status']['type']['state']
-            if status != 'post':
-                continue
-            h_score = int(home.get('score', 0) or 0)
-            a_score = int(away.get('score', 0) or 0)
-            home_name = home['team']['displayName']
-            away_name = away['team']['displayName']
-            total = h_score + a_score
-            # Store by both team names for fuzzy matching
-            key = f"{away_name} @ {home_name}"
-            results[key] = {
-                'home_team': home_name,
-                'away_team': away_name,
-                'home_score': h_score,
-                'away_score': a_score,
-                'total': total,
-                'home_won': h_score > a_score
-            }
-        return results
-    except Exception as ex:
-        print(f"  ⚠ Could not fetch results for {date_str}: {ex}")
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
         return {}
 
+def fetch_results_for_date(date_str, cache=None, save=True, league=NBA):
+    """
+    Final scores for a date YYYY-MM-DD. Days where every game is final (or
+    postponed / cancelled) are served from the finals cache; otherwise the scoreboard is fetched once
+    and the cache updated. Predictions and bet slips both settle from here.
+    """
+    if cache is None:
+        cache = load_finals_cache(league['finals'])
+    day = cache.get(date_str)
+    if day and day.get('complete') and all(g.get('game_id') for g in day['games'].values()):
+        return day['games']         # (days cached before game ids were kept are fetched once more)
+
+    data = safe_get(scoreboard_url(league, date_str.replace('-', '')))
+    if data is None:
+        print(f"  ⚠ Could not fetch results for {date_str}")
+        return day['games'] if day else {}
+    events = data.get('events', [])
+
+    results = parse_finals(events)
+    # A past day with no games at all (off-season, All-Star break) is settled too
+    past = date_str < datetime.now().strftime('%Y-%m-%d')
+    complete = (bool(events) or past) and len(results) + sum(map(is_void, events)) == len(events)
+    cache[date_str] = {'complete': complete, 'games': results}
+    if save:
+        write_json(league['finals'], cache)
+    return results
+
 def team_name_match(pred_name, result_name):
     """Fuzzy match team names"""
     pred_words = set(pred_name.lower().split())
@@ -52,8 +99,14 @@ def team_name_match(pred_name, result_name):
     return len(pred_words & result_words) >= 1
 
 def find_result(pred, results):
-    """Match a prediction to its result"""
+    """
+    Match a prediction to its result. A fuzzy match only counts when it is
+    the only one: on a college slate "State" alone matches a dozen games.
+    """
     matchup = pred.get('matchup', '')
+    if matchup in results:
+        return results[matchup]
+    fuzzy = []
     for key, res in results.items():
         # Try exact match first
         if matchup.lower() in key.lower() or key.lower() in matchup.lower():
@@ -63,8 +116,8 @@ def find_result(pred, results):
         if len(parts) == 2:
             away_pred, home_pred = parts[0].strip(), parts[1].strip()
             if team_name_match(away_pred, res['away_team']) and team_name_match(home_pred, res['home_team']):
-                return res
-    return None
+                fuzzy.append(res)
+    return fuzzy[0] if len(fuzzy) == 1 else None
 
 def determine_result(pred, actual):
     """Determine if prediction was hit or miss"""
@@ -85,16 +138,55 @@ def determine_result(pred, actual):
             return 'hit' if not actual['home_won'] else 'miss'
     return 'pending'
 
-def update_log():
-    if not os.path.exists(LOG_FILE):
-        print(f"⚠ {LOG_FILE} not found. Run nba_predictor.py first.")
+def settlement_lag_hours(date_str):
+    """Hours from the start of the game date to now"""
+    try:
+        return (datetime.now() - datetime.strptime(date_str, '%Y-%m-%d')).total_seconds() / 3600
+    except (TypeError, ValueError):
+        return 0.0
+
+def update_elo(cache, league=NBA):
+    """
+    Feed every final since the Elo ratings were last current into them,
+    oldest day first, through the same finals cache settlement uses.
+    The first run walks the season so far.
+
+    `through` only moves over an unbroken run of complete days, so a failed
+    fetch or an unfinished day is walked again next time. Finals after it
+    are still applied; once the gap fills, the book is replayed in date order.
+    """
+    books = elo_ratings.load()
+    book = books[league['key']]
+    today = datetime.now().date()
+    day = (datetime.strptime(book.through, '%Y-%m-%d').date() + timedelta(days=1) if book.through
+           else season_start(league, today))
+    latest = max((r['date'] for r in elo_ratings.read_history(league['key'])), default='')
+    applied, contiguous, late = 0, True, False
+    while day <= today:
+        date_str = day.isoformat()
+        results = fetch_results_for_date(date_str, cache, save=False, league=league)
+        fetched = cache.get(date_str)
+        contiguous = contiguous and bool(fetched) and fetched['complete']
+        n = elo_ratings.record_finals(book, date_str, results.values(), contiguous)
+        late = late or (n > 0 and date_str < latest)
+        applied += n
+        day += timedelta(days=1)
+    if late:
+        rebuilt = elo_ratings.replay(league, elo_ratings.read_history(league['key']))
+        rebuilt.through = book.through
+        books[league['key']] = book = rebuilt
+    write_json(league['finals'], cache)
+    elo_ratings.save(books)
+    print(f"♟️  {league['name']} Elo: {applied} new game(s) applied, current through {book.through or '—'}")
+
+def update_log(league=NBA):
+    log_file = league['log']
+    if not os.path.exists(log_file):
+        print(f"⚠ {log_file} not found. Run nba_predictor.py --league {league['key']} first.")
         return
 
-    with open(LOG_FILE, 'r') as f:
-        log = json.load(f)
-
-    if not isinstance(log, list):
-        log = log.get('entries', [])
+    log = load_log(log_file)
+    cache = load_finals_cache(league['finals'])
 
     updated = 0
     for entry in log:
@@ -108,8 +200,8 @@ def update_log():
         if not has_pending:
             continue
 
-        print(f"\n📅 Checking results for {date}...")
-        results = fetch_results_for_date(date)
+        print(f"\n📅 Checking {league['name']} results for {date}...")
+        results = fetch_results_for_date(date, cache, league=league)
 
         if not results:
             print(f"  No final games found for {date} (may still be in progress or future)")
@@ -131,15 +223,33 @@ def update_log():
                 icon = '✅' if res == 'hit' else '❌'
                 print(f"  {icon} {pred.get('matchup')} → {res.upper()} (actual: {actual['total']})")
                 updated += 1
+                oracle_metrics.inc('oracle_predictions_settled', result=res, league=league['key'])
+                oracle_metrics.observe('oracle_settlement_lag_hours', settlement_lag_hours(date))
             else:
                 print(f"  ⚠ No match found for: {pred.get('matchup')}")
 
-    # Save updated log
-    with open(LOG_FILE, 'w') as f:
-        json.dump(log, f, indent=2)
+    # Save updated log (canonical form — only settled games change)
+    save_log(log, log_file)
+    update_elo(cache, league)
+    oracle_metrics.set_gauge('oracle_predictions_pending', sum(
+        1 for e in log for p in e.get('predictions', []) if p.get('result') in (None, '', 'pending')),
+        league=league['key'])
 
-    print(f"\n✅ Updated {updated} predictions in {LOG_FILE}")
-    print("📤 Now run: git add nba_predictions_log.json && git commit -m 'Update results' && git push")
+    print(f"\n✅ Updated {updated} predictions in {log_file}")
+    print(f"📤 Now run: git add {log_file} && git commit -m 'Update results' && git push")
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Settle logged predictions against final scores")
+    ap.add_argument('--league', default='all', help="nba, wnba, ncaab, ncaaw, a comma list or all (default)")
+    args = ap.parse_args(argv)
+    try:
+        leagues = parse_leagues(args.league)
+    except ValueError as e:
+        ap.error(str(e))
+    for league in leagues:
+        if league is NBA or os.path.exists(league['log']):
+            update_log(league)
 
 if __name__ == '__main__':
-    update_log()
+    with oracle_metrics.job('update_results'):
+        main()
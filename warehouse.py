@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+warehouse.py
+Local game-log warehouse. It keeps one SQLite row per completed game:
+ids, date, teams, final score, points by period and team box-score totals.
+With it, team context is a local query instead of a round of per-team ESPN
+calls. That covers recent form, back-to-backs, head-to-head and backtests.
+
+The first ingest backfills the season so far, one scoreboard per day. After
+that each run only fetches what is missing, normally just yesterday. Days
+whose games were all final are recorded in `ingested` and never fetched
+again.
+
+  python3 warehouse.py ingest                                # every league, season so far → yesterday
+  python3 warehouse.py ingest --league ncaab --box
+  python3 warehouse.py backfill --league nba --from 2024-10-22 --to 2025-06-20
+  python3 warehouse.py status
+
+The scoreboard has the shooting and assist totals. --box also fetches each
+new game's summary for rebounds, steals, blocks and turnovers, at one
+request per game.
+"""
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+
+from leagues import parse_leagues, scoreboard_url, season_start
+from oracle_http import safe_get
+
+DB_FILE  = os.environ.get('ORACLE_WAREHOUSE', 'games.db')
+WORKERS  = 8              # scoreboard days fetched at once during a backfill
+RECHECK_DAYS = 3          # ingest refetches days left incomplete (late finishes) this long
+VOID_STATUSES = {'STATUS_POSTPONED', 'STATUS_CANCELED'}     # never get a final; count as settled
+
+BOX_KEYS = ('fgm', 'fga', 'fg3m', 'fg3a', 'ftm', 'fta', 'orb', 'drb', 'ast', 'tov', 'stl', 'blk')
+STAT_NAMES = {     # ESPN team statistic → box key (scoreboard and summary spellings)
+    'fieldGoalsMade': 'fgm', 'fieldGoalsAttempted': 'fga',
+    'threePointFieldGoalsMade': 'fg3m', 'threePointFieldGoalsAttempted': 'fg3a',
+    'freeThrowsMade': 'ftm', 'freeThrowsAttempted': 'fta',
+    'offensiveRebounds': 'orb', 'defensiveRebounds': 'drb',
+    'assists': 'ast', 'turnovers': 'tov', 'steals': 'stl', 'blocks': 'blk',
+}
+
+COLUMNS = (['league', 'game_id', 'date', 'tipoff', 'home_id', 'away_id', 'home_name', 'away_name',
+            'home_score', 'away_score', 'periods', 'home_lines', 'away_lines'] +
+           [f'{side}_{k}' for side in ('home', 'away') for k in BOX_KEYS])
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS games (
+    league      TEXT NOT NULL,
+    game_id     TEXT NOT NULL,
+    date        TEXT NOT NULL,        -- scoreboard date, YYYY-MM-DD
+    tipoff      TEXT,                 -- ISO 8601, UTC
+    home_id     TEXT NOT NULL,
+    away_id     TEXT NOT NULL,
+    home_name   TEXT,
+    away_name   TEXT,
+    home_score  INTEGER NOT NULL,
+    away_score  INTEGER NOT NULL,
+    periods     INTEGER,              -- OT included
+    home_lines  TEXT,                 -- JSON list of points per period
+    away_lines  TEXT,
+    {', '.join(f'{c} INTEGER' for c in COLUMNS[13:])},
+    PRIMARY KEY (league, game_id)
+);
+CREATE INDEX IF NOT EXISTS games_by_date ON games (league, date);
+CREATE INDEX IF NOT EXISTS games_by_home ON games (league, home_id, date);
+CREATE INDEX IF NOT EXISTS games_by_away ON games (league, away_id, date);
+CREATE TABLE IF NOT EXISTS ingested (
+    league      TEXT NOT NULL,
+    date        TEXT NOT NULL,
+    games       INTEGER NOT NULL,
+    complete    INTEGER NOT NULL,     -- every game that day was final
+    PRIMARY KEY (league, date)
+);
+"""
+
+# A refetch never blanks box totals an earlier --box run filled in
+UPSERT = (f"INSERT INTO games ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))}) "
+          f"ON CONFLICT (league, game_id) DO UPDATE SET " +
+          ', '.join(f"{c} = COALESCE(excluded.{c}, games.{c})" for c in COLUMNS[2:]))
+
+# ── CONNECTION ───────────────────────────────────────────────────────────
+_local = threading.local()     # one connection per thread and path (bulk slate mode queries from workers)
+
+def connect(path=None, create=False):
+    """Connection to the warehouse, or None if it does not exist and create is False"""
+    path = path or DB_FILE
+    conns = getattr(_local, 'conns', None)
+    if conns is None:
+        conns = _local.conns = {}
+    conn = conns.get(path)
+    if conn is None:
+        if not create and not os.path.exists(path):
+            return None
+        conn = sqlite3.connect(path)
+        conn.row_factory = sqlite3.Row
+        conn.executescript(SCHEMA)
+        conns[path] = conn
+    return conn
+
+# ── PARSING ──────────────────────────────────────────────────────────────
+def _int(v):
+    try:
+        return int(float(v))
+    except (TypeError, ValueError):
+        return None
+
+def box_totals(statistics):
+    """
+    {'fgm': 41, 'fga': 88, ...} from an ESPN team statistics list — scoreboard
+    style ('fieldGoalsMade': '41') or summary style ('fieldGoalsMade-fieldGoalsAttempted': '41-88')
+    """
+    box = {}
+    for s in statistics or []:
+        names = s.get('name', '').split('-')
+        values = str(s.get('displayValue', '')).split('-')
+        if len(names) != len(values):
+            continue
+        for name, value in zip(names, values):
+            key = STAT_NAMES.get(name)
+            if key and _int(value) is not None:
+                box[key] = _int(value)
+    return box
+
+def is_void(event):
+    """Postponed or cancelled — ESPN marks these 'post' without a final score"""
+    return event['status']['type'].get('name') in VOID_STATUSES
+
+def parse_game(event, league_key, day):
+    """Warehouse row for a final scoreboard event, or None if it is not final"""
+    comp = event['competitions'][0]
+    status = comp.get('status') or event.get('status', {})
+    if not status.get('type', {}).get('completed'):
+        return None
+    sides = {c.get('homeAway'): c for c in comp.get('competitors', [])}
+    if 'home' not in sides or 'away' not in sides:
+        return None
+    row = {'league': league_key, 'game_id': str(event['id']), 'date': day, 'tipoff': event.get('date')}
+    for side, c in sides.items():
+        if side not in ('home', 'away'):
+            continue
+        lines = [_int(ls.get('value')) or 0 for ls in c.get('linescores', [])]
+        row[f'{side}_id'] = str(c['team']['id'])
+        row[f'{side}_name'] = c['team'].get('displayName', '')
+        row[f'{side}_score'] = _int(c.get('score')) or 0
+        row[f'{side}_lines'] = json.dumps(lines)
+        row['periods'] = len(lines) or None
+        for k, v in box_totals(c.get('statistics')).items():
+            row[f'{side}_{k}'] = v
+    return row
+
+def add_box(league, row):
+    """Fill a row's full box score from the game summary (one request)"""
+    data = safe_get(f"{league['url']}/summary?event={row['game_id']}", priority='low')
+    for team in ((data or {}).get('boxscore') or {}).get('teams', []):
+        side = team.get('homeAway')
+        if side in ('home', 'away'):
+            for k, v in box_totals(team.get('statistics')).items():
+                row[f'{side}_{k}'] = v
+    return row
+
+# ── INGEST ───────────────────────────────────────────────────────────────
+def fetch_day(league, day, box=False):
+    """→ (rows, games to expect: scoreboard events less postponed / cancelled ones) for one date, or None if the fetch failed"""
+    data = safe_get(scoreboard_url(league, day.strftime('%Y%m%d')), priority='low')
+    if data is None:
+        return None
+    events = data.get('events', [])
+    rows = [r for r in (parse_game(e, league['key'], day.isoformat()) for e in events) if r]
+    if box:
+        rows = [add_box(league, r) if r.get('home_orb') is None else r for r in rows]
+    return rows, sum(not is_void(e) for e in events)
+
+def store_day(conn, league, day, rows, n_events):
+    complete = len(rows) == n_events and day < datetime.utcnow().date()
+    with conn:
+        conn.executemany(UPSERT, [tuple(r.get(c) for c in COLUMNS) for r in rows])
+        conn.execute("INSERT OR REPLACE INTO ingested (league, date, games, complete) VALUES (?, ?, ?, ?)",
+                     (league['key'], day.isoformat(), len(rows), int(complete)))
+    return complete
+
+def backfill(league, start, end, box=False, workers=WORKERS, conn=None, settled_before=None):
+    """
+    Fetch every day in [start, end] not already ingested as complete (or, if
+    settled_before is given, ingested at all before that date) → (days fetched, games stored).
+    With box, days that still have games without the full box score count as not done.
+    """
+    conn = conn or connect(create=True)
+    unboxed = ("AND NOT EXISTS (SELECT 1 FROM games g WHERE g.league = i.league AND g.date = i.date "
+               "AND g.home_orb IS NULL)") if box else ""
+    done = {r['date'] for r in conn.execute(
+        f"SELECT date FROM ingested i WHERE league = ? AND (complete OR date < ?) AND date BETWEEN ? AND ? {unboxed}",
+        (league['key'], (settled_before or start).isoformat(), start.isoformat(), end.isoformat()))}
+    days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+    days = [d for d in days if d.isoformat() not in done]
+    n_games = failed = 0
+    # Fetch on a pool, write from this thread (one SQLite writer)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for day, result in zip(days, pool.map(lambda d: fetch_day(league, d, box), days)):
+            if result is None:
+                failed += 1
+                continue
+            store_day(conn, league, day, *result)
+            n_games += len(result[0])
+    if failed:
+        print(f"  ⚠ {league['name']}: {failed} day(s) could not be fetched — the next run retries them")
+    return len(days) - failed, n_games
+
+def ingest(league, day=None, box=False, conn=None):
+    """
+    Bring a league up to `day` (default yesterday): the whole season on the
+    first run, afterwards only days that are missing or were still in
+    progress when last fetched.
+    """
+    conn = conn or connect(create=True)
+    day = day or datetime.utcnow().date() - timedelta(days=1)
+    return backfill(league, season_start(league, day), day, box, conn=conn,
+                    settled_before=day - timedelta(days=RECHECK_DAYS))
+
+# ── QUERIES ──────────────────────────────────────────────────────────────
+def covers(league, day, conn=None):
+    """True if every game of `day` and of the season before it is in the warehouse"""
+    conn = conn or connect()
+    if conn is None:
+        return False
+    start = season_start(league, day)
+    done = conn.execute("SELECT COUNT(*) FROM ingested WHERE league = ? AND complete AND date BETWEEN ? AND ?",
+                        (league['key'], start.isoformat(), day.isoformat())).fetchone()[0]
+    return done == (day - start).days + 1
+
+def team_games(league_key, team_id, before=None, limit=None, conn=None):
+    """
+    A team's games from its own side, oldest first: date, game_id, home,
+    opp_id, opp_name, pts, opp_pts, won. `before` (YYYY-MM-DD) is exclusive.
+    """
+    conn = conn or connect()
+    if conn is None:
+        return []
+    cond = " AND date < :before" if before else ""
+    sql = (f"SELECT date, game_id, 1 AS home, away_id AS opp_id, away_name AS opp_name, "
+           f"home_score AS pts, away_score AS opp_pts FROM games "
+           f"WHERE league = :league AND home_id = :team{cond} "
+           f"UNION ALL "
+           f"SELECT date, game_id, 0 AS home, home_id AS opp_id, home_name AS opp_name, "
+           f"away_score AS pts, home_score AS opp_pts FROM games "
+           f"WHERE league = :league AND away_id = :team{cond} "
+           f"ORDER BY date DESC, game_id DESC" + (" LIMIT :limit" if limit else ""))
+    rows = conn.execute(sql, {'league': league_key, 'team': str(team_id), 'before': before, 'limit': limit})
+    return [dict(r, won=r['pts'] > r['opp_pts']) for r in reversed(rows.fetchall())]
+
+def played_on(league_key, team_id, day, conn=None):
+    """Did the team play on `day` (a date or YYYY-MM-DD)? — back-to-back detection"""
+    conn = conn or connect()
+    if conn is None:
+        return False
+    return conn.execute("SELECT 1 FROM games WHERE league = ? AND date = ? AND ? IN (home_id, away_id) LIMIT 1",
+                        (league_key, str(day), str(team_id))).fetchone() is not None
+
+def head_to_head(league_key, team_id, opp_id, before=None, limit=10, conn=None):
+    """The last `limit` meetings of two teams, from team_id's side, oldest first"""
+    return [g for g in team_games(league_key, team_id, before, conn=conn) if g['opp_id'] == str(opp_id)][-limit:]
+
+def games(league_key, date_from=None, date_to=None, conn=None):
+    """Every stored game in a date range (inclusive), oldest first — for backtests and feature builds"""
+    conn = conn or connect()
+    if conn is None:
+        return []
+    rows = conn.execute("SELECT * FROM games WHERE league = ? AND date BETWEEN ? AND ? ORDER BY date, game_id",
+                        (league_key, date_from or '0000', date_to or '9999'))
+    return [dict(r) for r in rows]
+
+# ── CLI ──────────────────────────────────────────────────────────────────
+def print_status(conn, path=None):
+    print(f"  🗄  {path or DB_FILE}")
+    for r in conn.execute("SELECT g.league, COUNT(*) AS n, MIN(g.date) AS first, MAX(g.date) AS last, "
+                          "SUM(g.home_orb IS NOT NULL) AS boxed FROM games g GROUP BY g.league"):
+        print(f"     {r['league']:<6} {r['n']:>6} games  {r['first']} → {r['last']}  "
+              f"({r['boxed']} with full box)")
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Local SQLite warehouse of completed games")
+    ap.add_argument('command', choices=('ingest', 'backfill', 'status'))
+    ap.add_argument('--league', default='all', help="comma-separated leagues or all (default all)")
+    ap.add_argument('--date', type=date.fromisoformat, help="ingest up to this day (default yesterday)")
+    ap.add_argument('--from', dest='start', type=date.fromisoformat, help="backfill start (default season start)")
+    ap.add_argument('--to', dest='end', type=date.fromisoformat, help="backfill end (default yesterday)")
+    ap.add_argument('--box', action='store_true', help="fetch each new game's summary for the full box score")
+    ap.add_argument('--db', help=f"warehouse file (default {DB_FILE}, or $ORACLE_WAREHOUSE)")
+    args = ap.parse_args(argv)
+    try:
+        leagues = parse_leagues(args.league)
+    except ValueError as e:
+        ap.error(str(e))
+
+    conn = connect(args.db, create=True)
+    if args.command == 'status':
+        print_status(conn, args.db)
+        return
+    for league in leagues:
+        t0 = time.perf_counter()
+        if args.command == 'ingest':
+            days, n = ingest(league, args.date, args.box, conn=conn)
+        else:
+            end = args.end or datetime.utcnow().date() - timedelta(days=1)
+            days, n = backfill(league, args.start or season_start(league, end), end, args.box, conn=conn)
+        print(f"  ✅ {league['name']}: {days} day(s) fetched, {n} game(s) stored "
+              f"({time.perf_counter() - t0:.1f}s)")
+    print_status(conn, args.db)
+
+if __name__ == '__main__':
+    sys.exit(main())